@@ -0,0 +1,387 @@
+"""Benchmarks for volt's own generation paths.
+
+Times ``volt fastapi create --skip-install`` for every feature combination,
+``volt generate crud`` for 1, 50 and 500 models in an existing project, and
+``volt add db`` / ``volt add auth`` with per-phase timings. Everything runs
+offline in temporary directories with a private volt cache.
+
+    uv run python benchmarks/run.py                    # compare with baseline.json
+    uv run python benchmarks/run.py --only 'crud/*'    # a subset (exact names or globs)
+    uv run python benchmarks/run.py --update-baseline  # record a new baseline
+
+Exits with status 1 when a benchmark's median is slower than its baseline by
+more than the tolerance. Baselines are machine specific: record them on the
+box that runs the gate.
+"""
+
+import contextlib
+import fnmatch
+import io
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+from typer import Exit, Option, Typer
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+CRUD_MODEL_COUNTS = (1, 50, 500)
+# Feature answers of the existing project CRUD benchmarks generate into.
+CRUD_PROJECT = ("PostgreSQL", "Bearer Token (Authorization Header)", "Yes", "No", "None")
+CRUD_FIELDS = [
+    {"name": "title", "type": "str", "required": "Yes"},
+    {"name": "quantity", "type": "int", "required": "Yes"},
+    {"name": "price", "type": "float", "required": "No"},
+    {"name": "created_at", "type": "datetime", "required": "No"},
+]
+
+app = Typer(help="Benchmark volt's generation paths against a stored baseline.")
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Prepares a fresh working directory; not timed.
+    setup: Callable[[Path], Path]
+    # Runs the measured operation, recording phases on the given timings.
+    run: Callable[[Path, object], None]
+
+
+@contextlib.contextmanager
+def answering(*answers: str):
+    """Feed fixed answers to volt's interactive prompts."""
+    import volt.core.prompts as prompts
+    import volt.stacks.fastapi.adder as adder
+
+    remaining = iter(answers)
+
+    def choose(*args, **kwargs):
+        return next(remaining)
+
+    original = prompts.choose, adder.choose
+    prompts.choose = adder.choose = choose
+    try:
+        yield
+    finally:
+        prompts.choose, adder.choose = original
+
+
+def create_project(
+    dest: Path,
+    db: str,
+    auth: str,
+    alembic: str,
+    redis: str,
+    observability: str,
+    timings=None,
+):
+    from volt.stacks.fastapi.app_creator import create_fastapi_app
+
+    features = {
+        "database": db,
+        "auth": auth,
+        "alembic": alembic == "Yes",
+        "redis": redis == "Yes",
+        "observability": observability,
+    }
+    create_fastapi_app(dest, skip_install=True, timings=timings, features=features)
+    return dest
+
+
+def feature_combinations():
+    from volt.stacks.constants import DB_SQL_MODEL
+    from volt.stacks.fastapi.dependencies import (
+        FASTAPI_AUTH_DEPS,
+        FASTAPI_DB_CHOICES,
+        OBSERVABILITY_CHOICES,
+    )
+
+    for db in FASTAPI_DB_CHOICES:
+        auth_choices = ["None"] + (list(FASTAPI_AUTH_DEPS) if db != "None" else [])
+        # Alembic is only offered for SQL databases.
+        alembic_choices = ["Yes", "No"] if db in DB_SQL_MODEL else ["No"]
+        for auth, alembic, redis, observability in itertools.product(
+            auth_choices, alembic_choices, ["No", "Yes"], OBSERVABILITY_CHOICES
+        ):
+            yield db, auth, alembic, redis, observability
+
+
+def combination_name(
+    db: str, auth: str, alembic: str, redis: str, observability: str
+) -> str:
+    from volt.stacks.constants import DB_SQL_MODEL
+
+    parts = [db.lower()]
+    if auth != "None":
+        parts.append(auth.split()[0].lower())
+    # Alembic is on by default, so only its absence is named.
+    if db in DB_SQL_MODEL and alembic == "No":
+        parts.append("no-alembic")
+    if redis == "Yes":
+        parts.append("redis")
+    if observability != "None":
+        parts.append(observability.lower())
+    return "+".join(parts)
+
+
+def crud_models(count: int) -> dict:
+    return {f"Model{i:04d}": CRUD_FIELDS for i in range(count)}
+
+
+def generate_models(project: Path, count: int, timings=None) -> None:
+    from volt.core.config import load_config
+    from volt.stacks.fastapi.scaffold import generate_cruds
+
+    config = load_config(project / "volt.toml")
+    generate_cruds(project, crud_models(count), config, timings=timings)
+
+
+def copy_of(template: Path) -> Callable[[Path], Path]:
+    def setup(workdir: Path) -> Path:
+        return Path(shutil.copytree(template, workdir / "project"))
+
+    return setup
+
+
+def build_benchmarks(root: Path, only: List[str]) -> list[Benchmark]:
+    from volt.core.config import load_config
+    from volt.core.project import Project
+    from volt.stacks.fastapi.adder import add_auth, add_database
+
+    def selected(name: str) -> bool:
+        return not only or any(fnmatch.fnmatchcase(name, pattern) for pattern in only)
+
+    benchmarks = []
+    for combination in feature_combinations():
+        name = f"create/{combination_name(*combination)}"
+        if selected(name):
+            benchmarks.append(
+                Benchmark(
+                    name,
+                    setup=lambda workdir: workdir / "project",
+                    run=lambda project, timings, c=combination: create_project(
+                        project, *c, timings=timings
+                    ),
+                )
+            )
+
+    def base_project(name: str, *combination: str) -> Path:
+        path = root / "bases" / name
+        if not path.exists():
+            create_project(path, *combination)
+        return path
+
+    for count in CRUD_MODEL_COUNTS:
+        name = f"crud/{count}"
+        if selected(name):
+            base = base_project("crud", *CRUD_PROJECT)
+            benchmarks.append(
+                Benchmark(
+                    name,
+                    setup=copy_of(base),
+                    run=lambda project, timings, n=count: generate_models(
+                        project, n, timings
+                    ),
+                )
+            )
+
+    count = CRUD_MODEL_COUNTS[-1]
+    if selected(f"crud-regenerate/{count}"):
+        base = base_project("crud", *CRUD_PROJECT)
+        regenerate_base = root / "bases" / "crud-generated"
+        if not regenerate_base.exists():
+            shutil.copytree(base, regenerate_base)
+            generate_models(regenerate_base, count)
+        benchmarks.append(
+            Benchmark(
+                f"crud-regenerate/{count}",
+                setup=copy_of(regenerate_base),
+                run=lambda project, timings: generate_models(project, count, timings),
+            )
+        )
+
+    if selected("add/db"):
+        base = base_project("no-db", "None", "None", "No", "No", "None")
+
+        def run_add_db(project: Path, timings) -> None:
+            with answering("PostgreSQL"):
+                add_database(
+                    Project(project, load_config(project / "volt.toml")),
+                    skip_install=True,
+                    timings=timings,
+                )
+
+        benchmarks.append(Benchmark("add/db", setup=copy_of(base), run=run_add_db))
+
+    if selected("add/auth"):
+        base = base_project("no-auth", "PostgreSQL", "None", "Yes", "No", "None")
+
+        def run_add_auth(project: Path, timings) -> None:
+            with answering("Bearer Token (Authorization Header)"):
+                add_auth(
+                    Project(project, load_config(project / "volt.toml")),
+                    skip_install=True,
+                    timings=timings,
+                )
+
+        benchmarks.append(Benchmark("add/auth", setup=copy_of(base), run=run_add_auth))
+
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, root: Path, repeat: int) -> dict:
+    """Median total and per-phase seconds over ``repeat`` runs after a warmup."""
+    from volt.core.timing import StageTimings
+
+    totals = []
+    phases: dict[str, list[float]] = {}
+    for attempt in range(repeat + 1):
+        workdir = Path(tempfile.mkdtemp(dir=root))
+        try:
+            project = benchmark.setup(workdir)
+            timings = StageTimings()
+            start = time.perf_counter()
+            benchmark.run(project, timings)
+            elapsed = time.perf_counter() - start
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        if attempt == 0:
+            continue
+        totals.append(elapsed)
+        for name, seconds in timings.stages:
+            phases.setdefault(name, []).append(seconds)
+
+    return {
+        "total": round(statistics.median(totals), 6),
+        "phases": {
+            name: round(statistics.median(values), 6) for name, values in phases.items()
+        },
+    }
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float, min_delta: float
+) -> list[str]:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(
+        title="volt benchmarks", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Median (ms)", justify="right", style="green")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Phases (ms)", style="dim")
+
+    regressions = []
+    for name, result in results.items():
+        total = result["total"]
+        phases = ", ".join(f"{p} {s * 1000:.1f}" for p, s in result["phases"].items())
+        previous = baseline.get(name, {}).get("total")
+        if previous is None:
+            table.add_row(
+                name, f"{total * 1000:.1f}", "-", "[yellow]new[/yellow]", phases
+            )
+            continue
+        change = (total - previous) / previous if previous else 0.0
+        regressed = total > previous * (1 + tolerance) and total - previous > min_delta
+        if regressed:
+            regressions.append(name)
+        style = "red" if regressed else "green" if change <= 0 else "white"
+        table.add_row(
+            name,
+            f"{total * 1000:.1f}",
+            f"{previous * 1000:.1f}",
+            f"[{style}]{change:+.0%}[/{style}]",
+            phases,
+        )
+
+    Console().print(table)
+    return regressions
+
+
+@app.command()
+def main(
+    repeat: int = Option(3, "--repeat", "-n", help="Measured runs per benchmark."),
+    only: List[str] = Option(
+        [],
+        "--only",
+        help="Only run benchmarks with this name or matching this glob, e.g. 'crud/*' (repeatable).",
+    ),
+    tolerance: float = Option(
+        0.25, "--tolerance", help="Allowed slowdown before failing, as a fraction."
+    ),
+    min_delta: float = Option(
+        0.005, "--min-delta", help="Ignore slowdowns smaller than this many seconds."
+    ),
+    baseline_path: Path = Option(
+        DEFAULT_BASELINE, "--baseline", help="Baseline JSON file."
+    ),
+    update_baseline: bool = Option(
+        False, "--update-baseline", help="Store these results as the new baseline."
+    ),
+    output: Path = Option(
+        None, "--output", help="Also write the results to this JSON file."
+    ),
+):
+    from rich import print
+
+    with tempfile.TemporaryDirectory(prefix="volt-bench-") as tmp:
+        root = Path(tmp)
+        # A private cache keeps runs hermetic; the warmup run fills it.
+        os.environ["VOLT_CACHE_DIR"] = str(root / "cache")
+
+        results = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            benchmarks = build_benchmarks(root, only)
+        for benchmark in benchmarks:
+            print(f"[dim]Running {benchmark.name}...[/dim]", file=sys.stderr)
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[benchmark.name] = measure(benchmark, root, repeat)
+
+    if not results:
+        print("[yellow]No benchmarks selected.[/yellow]")
+        raise Exit(1)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    if output:
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if update_baseline:
+        stored = {}
+        if baseline_path.exists():
+            stored = json.loads(baseline_path.read_text()).get("benchmarks", {})
+        report["benchmarks"] = {**stored, **results}
+        baseline_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        compare(results, {}, tolerance, min_delta)
+        print(f"[green]✔ Baseline written to {baseline_path}[/green]")
+        return
+
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text()).get("benchmarks", {})
+    regressions = compare(results, baseline, tolerance, min_delta)
+    if regressions:
+        print(
+            f"[red]✘ {len(regressions)} benchmark(s) regressed: {', '.join(regressions)}[/red]"
+        )
+        raise Exit(1)
+    print("[green]✔ No regressions against the baseline[/green]")
+
+
+if __name__ == "__main__":
+    app()
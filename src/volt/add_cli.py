@@ -1,40 +1,55 @@
-from pathlib import Path
-
-from typer import Typer
+from typer import Option, Typer
 
 
 add_app = Typer(help="Add features to an existing project.")
 
 
-def detect_stack() -> str:
-    if Path("app/main.py").exists():
-        return "fastapi"
-    return "unknown"
-
-
-@add_app.command("db", help="Add a database to the project.")
-def add_db():
-    from volt.stacks.fastapi.adder import add_feature as add_fastapi_feature
+def add_to_project(feature_type: str, skip_install: bool, dry_run: bool) -> None:
+    from volt.core.project import require_project
     from rich import print
 
-    stack = detect_stack()
-    if stack == "fastapi":
-        add_fastapi_feature("database")
+    project = require_project(config_required=False)
+    if project.stack == "fastapi":
+        from volt.stacks.fastapi.adder import add_feature as add_fastapi_feature
+
+        add_fastapi_feature(
+            project, feature_type, skip_install=skip_install, dry_run=dry_run
+        )
     else:
         print(
             "[red]Could not detect a valid Volt project or stack not supported.[/red]"
         )
 
 
-@add_app.command("auth", help="Add authentication to the project.")
-def add_auth():
-    from volt.stacks.fastapi.adder import add_feature as add_fastapi_feature
-    from rich import print
+def skip_install_option():
+    return Option(False, "--skip-install", help="Skip dependency installation")
 
-    stack = detect_stack()
-    if stack == "fastapi":
-        add_fastapi_feature("auth")
-    else:
-        print(
-            "[red]Could not detect a valid Volt project or stack not supported.[/red]"
-        )
+
+def dry_run_option():
+    return Option(
+        False, "--dry-run", help="Show the files and packages that would change and exit"
+    )
+
+
+@add_app.command("db", help="Add a database to the project.")
+def add_db(
+    skip_install: bool = skip_install_option(),
+    dry_run: bool = dry_run_option(),
+):
+    add_to_project("database", skip_install, dry_run)
+
+
+@add_app.command("auth", help="Add authentication to the project.")
+def add_auth(
+    skip_install: bool = skip_install_option(),
+    dry_run: bool = dry_run_option(),
+):
+    add_to_project("auth", skip_install, dry_run)
+
+
+@add_app.command("redis", help="Add Redis to the project.")
+def add_redis(
+    skip_install: bool = skip_install_option(),
+    dry_run: bool = dry_run_option(),
+):
+    add_to_project("redis", skip_install, dry_run)
@@ -1,50 +1,107 @@
-import os
 import sys
 import subprocess
 from pathlib import Path
 from typer import Typer, Option, Context, Exit
 from rich.console import Console
-from volt.stacks.fastapi.docker_utils import FASTAPI_DOCKERFILE
+from rich.markup import escape
+from volt.stacks.fastapi.docker_utils import DOCKERFILE_PROFILES
 
-from volt.core.config import load_config
+from volt.core.compose import REPLICAS_COMPOSE_FILE, TUNED_COMPOSE_FILE
+from volt.core.project import require_project
+from volt.core.tracing import span, traced
 
 build_app = Typer(help="Build project artifacts.")
 console = Console()
 
 
-def get_python_version() -> str:
-    if os.path.exists(".python-version"):
-        with open(".python-version", "r") as f:
-            return f.read().strip()
+def run_docker(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run a docker CLI command, traced as a span named after its subcommand."""
+    name = " ".join(arg for arg in cmd[:3] if not arg.startswith("-"))
+    with span(name, category="docker", command=" ".join(cmd)):
+        return subprocess.run(cmd, **kwargs)
+
+
+def get_python_version(project_path: Path = Path(".")) -> str:
+    version_file = project_path / ".python-version"
+    if version_file.exists():
+        return version_file.read_text().strip()
 
     v = sys.version_info
     return f"{v.major}.{v.minor}"
 
 
-def sync_dockerfile(project_path: Path, config: any) -> Path:
-    dockerfile_path = project_path / "Dockerfile"
-    python_version = get_python_version()
+@traced(category="docker")
+def sync_dockerfile(project_path: Path, config: any, profile: str = "dev") -> Path:
+    filename, template = DOCKERFILE_PROFILES[profile]
+    dockerfile_path = project_path / filename
+    python_version = get_python_version(project_path)
 
     if not dockerfile_path.exists():
         console.print(
-            f"[blue]Generating Dockerfile (Python {python_version})...[/blue]"
+            f"[blue]Generating {filename} (Python {python_version})...[/blue]"
         )
-        content = FASTAPI_DOCKERFILE.format(python_version=python_version)
+        content = template.format(python_version=python_version)
         dockerfile_path.write_text(content)
     else:
-        console.print(
-            f"[blue]Updating Dockerfile with Python {python_version}...[/blue]"
-        )
-        content = dockerfile_path.read_text()
+        current = dockerfile_path.read_text()
         import re
 
+        # Both stages: the uv builder image and the python runtime image,
+        # so the venv is never built for another Python than it runs on.
         content = re.sub(
-            r"python:[\d\.]+-slim", f"python:{python_version}-slim", content
+            r"(uv:python|python:)[\d.]+(?=-)", rf"\g<1>{python_version}", current
         )
-        dockerfile_path.write_text(content)
+        # Left untouched when up to date, so its mtime and digest stay stable.
+        if content != current:
+            console.print(
+                f"[blue]Updating {filename} with Python {python_version}...[/blue]"
+            )
+            dockerfile_path.write_text(content)
     return dockerfile_path
 
 
+def ensure_production_server(project) -> None:
+    """Add gunicorn.conf.py and the production server packages if missing."""
+    from volt.core.dependencies import install_uv_packages, missing_packages
+    from volt.stacks.fastapi.dependencies import PRODUCTION_SERVER_DEPS
+    from volt.stacks.fastapi.docker_utils import GUNICORN_CONF
+
+    conf_path = project.root / "gunicorn.conf.py"
+    if not conf_path.exists():
+        console.print("[blue]Generating gunicorn.conf.py...[/blue]")
+        conf_path.write_text(GUNICORN_CONF)
+
+    packages = missing_packages(PRODUCTION_SERVER_DEPS, project.requirements)
+    if packages:
+        names = escape(", ".join(packages))
+        console.print(f"[blue]Adding production server packages: {names}...[/blue]")
+        try:
+            install_uv_packages(packages, project.root)
+        except subprocess.CalledProcessError as e:
+            console.print(f"[red]Failed to add {names}: {e}[/red]")
+            raise Exit(1)
+
+
+def ensure_dockerignore(project_path: Path) -> Path:
+    from volt.core.build_cache import DEFAULT_DOCKERIGNORE, DOCKERIGNORE
+
+    dockerignore_path = project_path / DOCKERIGNORE
+    if not dockerignore_path.exists():
+        console.print("[blue]Generating .dockerignore...[/blue]")
+        dockerignore_path.write_text(DEFAULT_DOCKERIGNORE)
+    return dockerignore_path
+
+
+def image_exists(tag: str) -> bool:
+    result = run_docker(
+        ["docker", "image", "inspect", tag],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+@traced(category="docker")
 def ensure_docker_compose(project_path: Path, config: any) -> Path:
     compose_path = project_path / "docker-compose.yaml"
     if not compose_path.exists():
@@ -73,31 +130,72 @@ def build(
         "--platform",
         help="Target platform for the build (e.g., linux/amd64,linux/arm64)",
     ),
+    cache_from: Path = Option(
+        None,
+        "--cache-from",
+        help="Local directory to import the buildx layer cache from",
+        file_okay=False,
+    ),
+    cache_to: Path = Option(
+        None,
+        "--cache-to",
+        help="Local directory to export the buildx layer cache to",
+        file_okay=False,
+    ),
+    force: bool = Option(
+        False, "--force", help="Build even if an image of the same inputs exists"
+    ),
+    profile: str = Option(
+        "dev",
+        "--profile",
+        help="Image profile: 'dev' (single uvicorn process) or 'production' (gunicorn with uvicorn workers)",
+    ),
 ):
     if ctx.invoked_subcommand is not None:
         return
 
-    config_path = project_path / "volt.toml"
-    config = load_config(config_path)
+    from volt.core.build_cache import build_context_digest, image_tag
+
+    project = require_project(project_path)
+    project_path, config = project.root, project.config
 
-    if not config:
+    if config.stack != "fastapi":
         console.print(
-            "[red]Error: 'volt.toml' not found. Please run this command in a Volt project directory.[/red]"
+            f"[red]Error: Stack '{config.stack}' is not supported for Docker builds yet. Only 'fastapi' is supported.[/red]"
         )
         raise Exit(1)
 
-    if config.stack != "fastapi":
+    if profile not in DOCKERFILE_PROFILES:
         console.print(
-            f"[red]Error: Stack '{config.stack}' is not supported for Docker builds yet. Only 'fastapi' is supported.[/red]"
+            f"[red]Error: Unknown profile '{profile}'. Choose from: {', '.join(DOCKERFILE_PROFILES)}.[/red]"
         )
         raise Exit(1)
 
-    sync_dockerfile(project_path, config)
+    dockerfile_path = sync_dockerfile(project_path, config, profile)
     ensure_docker_compose(project_path, config)
+    ensure_dockerignore(project_path)
+    if profile == "production":
+        ensure_production_server(project)
 
     image_name = config.project_name.lower().replace("-", "_")
+    if profile != "dev":
+        image_name = f"{image_name}-{profile}"
+
+    # Images are also tagged with the digest of everything the build reads,
+    # so a build with the same inputs is replaced by re-tagging that image.
+    digest = build_context_digest(
+        project_path, {"platform": platform or "", "profile": profile}
+    )
+    digest_tag = image_tag(image_name, digest)
+    if not force and image_exists(digest_tag):
+        run_docker(["docker", "tag", digest_tag, image_name], check=True)
+        console.print(
+            f"[bold green]✔ Image is up to date ({digest_tag}), build skipped.[/bold green]"
+        )
+        return
 
     build_cmd = ["docker", "build"]
+    buildx = bool(platform or cache_from or cache_to)
 
     if platform:
         console.print(
@@ -106,18 +204,158 @@ def build(
         build_cmd = ["docker", "buildx", "build", "--platform", platform, "--load"]
     else:
         console.print(f"[bold green]Building image for local platform...[/bold green]")
+        if buildx:
+            build_cmd = ["docker", "buildx", "build", "--load"]
+
+    if cache_from and cache_from.exists():
+        build_cmd += ["--cache-from", f"type=local,src={cache_from}"]
+    if cache_to:
+        build_cmd += ["--cache-to", f"type=local,dest={cache_to},mode=max"]
 
-    build_cmd += ["-t", image_name, str(project_path)]
+    build_cmd += ["-f", str(dockerfile_path)]
+    build_cmd += ["-t", image_name, "-t", digest_tag, str(project_path)]
 
     try:
-        subprocess.run(build_cmd, check=True)
-        console.print("[bold green]✔ Build successful![/bold green]")
+        run_docker(build_cmd, check=True)
+        console.print(f"[bold green]✔ Build successful! ({digest_tag})[/bold green]")
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Build failed: {e}[/red]")
-        if platform:
+        if buildx:
             console.print(
-                "[yellow]Tip: Ensure Docker Buildx is installed and configured for multi-platform (e.g., docker buildx create --use)[/yellow]"
+                "[yellow]Tip: Ensure Docker Buildx is installed and configured (e.g., docker buildx create --use); local cache export needs a docker-container builder.[/yellow]"
+            )
+        raise Exit(1)
+
+
+def sync_tuned_compose(
+    project_path: Path,
+    config: any,
+    tuned: bool,
+    ephemeral: bool,
+    db_memory: str,
+    db_cpus: float,
+) -> Path:
+    from volt.stacks.fastapi.docker_config import parse_memory
+    from volt.stacks.fastapi.docker_utils import generate_tuned_compose_override
+
+    db_choice = config.features.get("database", "None")
+    if db_choice in {"SQLite", "None"}:
+        console.print(
+            "[yellow]No database service to tune, starting the default stack.[/yellow]"
+        )
+
+    try:
+        memory_mb = parse_memory(db_memory)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise Exit(1)
+
+    content = generate_tuned_compose_override(
+        db_choice, memory_mb, db_cpus, tuned=tuned, ephemeral=ephemeral
+    )
+    return write_compose_override(project_path / TUNED_COMPOSE_FILE, content)
+
+
+def sync_replicas_compose(project_path: Path, replicas: int) -> Path:
+    from volt.stacks.fastapi.docker_utils import generate_replicas_compose_override
+
+    content = generate_replicas_compose_override(replicas)
+    return write_compose_override(project_path / REPLICAS_COMPOSE_FILE, content)
+
+
+def write_compose_override(path: Path, content: str) -> Path:
+    if not path.exists() or path.read_text() != content:
+        console.print(f"[blue]Generating {path.name}...[/blue]")
+        path.write_text(content)
+    return path
+
+
+def compose_service_hashes(compose_cmd: list[str], cwd: Path) -> dict[str, str]:
+    """Config hash of every service; empty when compose can't tell."""
+    from volt.core.compose import parse_service_hashes
+
+    result = run_docker(
+        [*compose_cmd, "config", "--hash", "*"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {}
+    return parse_service_hashes(result.stdout)
+
+
+def compose_running_services(compose_cmd: list[str], cwd: Path) -> set[str]:
+    result = run_docker(
+        [*compose_cmd, "ps", "--services", "--status", "running"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.split()) if result.returncode == 0 else set()
+
+
+@traced(category="docker")
+def wait_for_services(compose_cmd: list[str], cwd: Path, timeout: float) -> bool:
+    """Wait until every container of the stack is healthy (or running, when it
+    has no healthcheck), print when each got there and return whether all did.
+
+    All containers are polled together with one ``docker inspect`` per round.
+    """
+    import time
+
+    from volt.core.compose import (
+        FAILED,
+        INSPECT_FORMAT,
+        READY,
+        STARTING,
+        parse_container_health,
+        print_readiness,
+    )
+
+    result = run_docker(
+        [*compose_cmd, "ps", "-q"], cwd=cwd, capture_output=True, text=True
+    )
+    pending = result.stdout.split() if result.returncode == 0 else []
+    if not pending:
+        return True
+
+    console.print(f"[blue]Waiting for {len(pending)} containers to be ready...[/blue]")
+    results: dict[str, tuple[str, float | None]] = {}
+    names: dict[str, str] = {}
+    start = time.perf_counter()
+    while pending:
+        inspect = run_docker(
+            ["docker", "inspect", "--format", INSPECT_FORMAT, *pending],
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - start
+        still_pending = []
+        # Matched by id: inspect skips containers removed since `ps`.
+        # `ps -q` prints short ids, inspect full ones.
+        containers = parse_container_health(inspect.stdout)
+        for container_id in pending:
+            container = next(
+                (c for c in containers if c.id.startswith(container_id)), None
             )
+            if container is None:
+                results[names.get(container_id, container_id)] = (FAILED, elapsed)
+                continue
+            names[container_id] = container.name
+            if container.state == STARTING:
+                still_pending.append(container_id)
+                results[container.name] = (STARTING, None)
+            else:
+                results[container.name] = (container.state, elapsed)
+        pending = still_pending
+        if pending:
+            if elapsed >= timeout:
+                break
+            time.sleep(0.5)
+
+    print_readiness(results, time.perf_counter() - start)
+    return all(state == READY for state, _ in results.values())
 
 
 def up_command(
@@ -125,15 +363,18 @@ def up_command(
     detach: bool = Option(
         False, "--detach", "-d", help="Run containers in the background"
     ),
+    tuned: bool = False,
+    ephemeral: bool = False,
+    db_memory: str = "1g",
+    db_cpus: float = 2.0,
+    replicas: int = 1,
+    wait_timeout: int = 120,
 ):
-    config_path = project_path / "volt.toml"
-    config = load_config(config_path)
+    from volt.core.build_cache import build_context_digest
+    from volt.core.compose import UpState
 
-    if not config:
-        console.print(
-            "[red]Error: 'volt.toml' not found. Please run this command in a Volt project directory.[/red]"
-        )
-        raise Exit(1)
+    project = require_project(project_path)
+    project_path, config = project.root, project.config
 
     if config.stack != "fastapi":
         console.print(
@@ -142,15 +383,77 @@ def up_command(
         raise Exit(1)
 
     sync_dockerfile(project_path, config)
-    ensure_docker_compose(project_path, config)
+    compose_path = ensure_docker_compose(project_path, config)
+
+    # Layered over the project's own compose file, which stays as it is.
+    overrides = []
+    if tuned or ephemeral:
+        overrides.append(
+            sync_tuned_compose(project_path, config, tuned, ephemeral, db_memory, db_cpus)
+        )
+    if replicas > 1:
+        overrides.append(sync_replicas_compose(project_path, replicas))
+
+    compose_cmd = ["docker", "compose"]
+    if overrides:
+        for path in [compose_path, *overrides]:
+            compose_cmd += ["-f", path.name]
 
-    console.print("[bold green]Starting services with Docker Compose...[/bold green]")
-    up_cmd = ["docker", "compose", "up", "--build"]
+    # The app image is only rebuilt when its build inputs changed since the
+    # last `volt up`; `compose up` still builds it if it is missing.
+    ensure_dockerignore(project_path)
+    state = UpState.load(project_path)
+    digest = build_context_digest(project_path, {"compose": True})
+    if digest != state.build:
+        console.print("[bold green]Build inputs changed, rebuilding the app image...[/bold green]")
+        try:
+            run_docker([*compose_cmd, "build"], check=True, cwd=project_path)
+        except subprocess.CalledProcessError as e:
+            console.print(f"[red]Build failed: {e}[/red]")
+            raise Exit(1)
+        state.build = digest
+        state.save(project_path)
+
+    up_cmd = [*compose_cmd, "up"]
+    hashes = {}
     if detach:
-        up_cmd.append("-d")
+        # Only services whose config changed, or that aren't running, are
+        # (re)started; compose starts their dependencies as needed.
+        hashes = compose_service_hashes(compose_cmd, project_path)
+        running = compose_running_services(compose_cmd, project_path)
+        services = [
+            name
+            for name, config_hash in hashes.items()
+            if name not in running or state.services.get(name) != config_hash
+        ]
+        # Running app containers of an older image are replaced as well.
+        if "app" in hashes and state.started != digest and "app" not in services:
+            services.append("app")
+        if hashes and not services:
+            console.print("[bold green]✔ All services are up to date.[/bold green]")
+            up_cmd = None
+        else:
+            if services and len(services) < len(hashes):
+                console.print(f"[blue]Changed services: {', '.join(services)}[/blue]")
+            up_cmd += ["-d", *services]
 
-    try:
-        subprocess.run(up_cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Failed to start services: {e}[/red]")
-        raise Exit(1)
+    if up_cmd is not None:
+        if replicas > 1:
+            console.print(
+                f"[bold green]Starting services with Docker Compose ({replicas} app replicas behind nginx on port 8000)...[/bold green]"
+            )
+        else:
+            console.print("[bold green]Starting services with Docker Compose...[/bold green]")
+
+        try:
+            run_docker(up_cmd, check=True, cwd=project_path)
+        except subprocess.CalledProcessError as e:
+            console.print(f"[red]Failed to start services: {e}[/red]")
+            raise Exit(1)
+
+    if detach:
+        if hashes:
+            state.services, state.started = hashes, digest
+            state.save(project_path)
+        if wait_timeout > 0 and not wait_for_services(compose_cmd, project_path, wait_timeout):
+            raise Exit(1)
@@ -1,56 +1,94 @@
+import sys
 from pathlib import Path
 from typer import Typer, Option, Context, Exit
 
-from volt.stacks.fastapi.cli import fastapi_app
-from volt.add_cli import add_app
-from volt.db_cli import db_app
-from volt.build_cli import build_app, up_command
+from volt.core.lazy import LazySubcommand, LazyTyperGroup
+from volt.core.profiling import IMPORT_PROFILE_FLAG
+from volt.core.tracing import TRACE_FILE_FLAG, TRACE_FLAG
+
+
+class VoltGroup(LazyTyperGroup):
+    # Sub-apps are imported only when invoked so that short commands such as
+    # `volt --version` don't pay for alembic, docker helpers, etc.
+    lazy_subcommands = {
+        "build": LazySubcommand(
+            "volt.build_cli:build_app",
+            help="Build project artifacts (Docker, etc.).",
+        ),
+        "fastapi": LazySubcommand(
+            "volt.stacks.fastapi.cli:fastapi_app",
+            no_args_is_help=True,
+        ),
+        "add": LazySubcommand(
+            "volt.add_cli:add_app",
+            help="Add features to an existing project.",
+            no_args_is_help=True,
+        ),
+        "db": LazySubcommand(
+            "volt.db_cli:db_app",
+            help="Database migration management (Alembic).",
+            no_args_is_help=True,
+        ),
+        "generate": LazySubcommand(
+            "volt.stacks.fastapi.cli:generate_app",
+            help="Generate code components.",
+            no_args_is_help=True,
+        ),
+    }
+
 
 app = Typer(
+    cls=VoltGroup,
     help="An extremely fast template and stack manager for Python projects.",
     no_args_is_help=True,
 )
 
 
-app.add_typer(
-    build_app,
-    name="build",
-    help="Build project artifacts (Docker, etc.).",
-)
-
-
-app.add_typer(fastapi_app, name="fastapi", no_args_is_help=True)
-app.add_typer(
-    add_app,
-    name="add",
-    help="Add features to an existing project.",
-    no_args_is_help=True,
-)
-app.add_typer(
-    db_app,
-    name="db",
-    help="Database migration management (Alembic).",
-    no_args_is_help=True,
-)
-
-from volt.stacks.fastapi.cli import generate_app as fastapi_generate
-
-app.add_typer(
-    fastapi_generate,
-    name="generate",
-    help="Generate code components.",
-    no_args_is_help=True,
-)
-
-
 @app.command("up", help="Start the project services using Docker Compose.")
 def up(
     project_path: Path = Option(Path("."), "--path", "-p", help="Path to the project"),
     detach: bool = Option(
         False, "--detach", "-d", help="Run containers in the background"
     ),
+    tuned: bool = Option(
+        False,
+        "--tuned",
+        help="Size the database for --db-memory/--db-cpus, limit it to them and pool PostgreSQL connections with PgBouncer",
+    ),
+    ephemeral: bool = Option(
+        False, "--ephemeral", help="Keep the database files in tmpfs (lost on stop)"
+    ),
+    db_memory: str = Option(
+        "1g", "--db-memory", help="Memory of the tuned database container (e.g. 512m, 2g)"
+    ),
+    db_cpus: float = Option(
+        2.0, "--db-cpus", help="CPUs of the tuned database container"
+    ),
+    replicas: int = Option(
+        1,
+        "--replicas",
+        min=1,
+        help="Number of app containers, load-balanced by an nginx proxy",
+    ),
+    wait_timeout: int = Option(
+        120,
+        "--wait-timeout",
+        min=0,
+        help="With --detach, seconds to wait for the services to be healthy (0 to skip)",
+    ),
 ):
-    up_command(project_path, detach)
+    from volt.build_cli import up_command
+
+    up_command(
+        project_path,
+        detach,
+        tuned=tuned,
+        ephemeral=ephemeral,
+        db_memory=db_memory,
+        db_cpus=db_cpus,
+        replicas=replicas,
+        wait_timeout=wait_timeout,
+    )
 
 
 def version_callback(value: bool):
@@ -71,13 +109,83 @@ def common(
         callback=version_callback,
         help="Display the volt version",
     ),
+    import_profile: bool = Option(
+        False,
+        IMPORT_PROFILE_FLAG,
+        help="Print the import cost of each module loaded by the command",
+    ),
+    trace: bool = Option(
+        False,
+        TRACE_FLAG,
+        help="Print where the command spent its time, phase by phase",
+    ),
+    trace_file: Path = Option(
+        None,
+        TRACE_FILE_FLAG,
+        help="Also write the trace as Chrome-trace JSON (implies --trace)",
+    ),
 ):
+    # --import-profile and the trace flags are consumed by main() before
+    # command resolution so that the subcommand's own work is captured.
     pass
 
 
-def main():
+def _pop_global_options(argv: list[str]) -> dict[str, str | bool]:
+    """Remove --import-profile and the trace options from argv.
+
+    Only options before the subcommand name are root options: the same
+    strings after it, or after ``--``, belong to the subcommand.
+    """
+    found: dict[str, str | bool] = {}
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--" or not arg.startswith("-"):
+            break
+        if arg in (IMPORT_PROFILE_FLAG, TRACE_FLAG):
+            found[arg] = True
+            del argv[i]
+        elif arg == TRACE_FILE_FLAG and i + 1 < len(argv):
+            found[arg] = argv[i + 1]
+            del argv[i : i + 2]
+        elif arg.startswith(f"{TRACE_FILE_FLAG}="):
+            found[TRACE_FILE_FLAG] = arg.split("=", 1)[1]
+            del argv[i]
+        else:
+            i += 1
+    return found
+
+
+def _run(options: dict[str, str | bool]):
+    trace_file = options.get(TRACE_FILE_FLAG)
+    if options.get(TRACE_FLAG) or trace_file is not None:
+        from volt.core.tracing import trace_command
+
+        name = " ".join(["volt", *sys.argv[1:]])
+        with trace_command(name, Path(trace_file) if trace_file else None):
+            app()
+        return
+
     app()
 
 
+def main():
+    if getattr(sys, "frozen", False):
+        # Frozen executables re-enter main() in `volt fastapi batch` workers.
+        from multiprocessing import freeze_support
+
+        freeze_support()
+
+    options = _pop_global_options(sys.argv)
+    if options.get(IMPORT_PROFILE_FLAG):
+        from volt.core.profiling import profile_imports
+
+        with profile_imports():
+            _run(options)
+        return
+
+    _run(options)
+
+
 if __name__ == "__main__":
     main()
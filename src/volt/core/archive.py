@@ -0,0 +1,141 @@
+import bisect
+import json
+import mmap
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+
+from volt.core.render import IGNORED_NAMES, TemplateFile
+
+ARCHIVE_MAGIC = b"VOLTPK01"
+ARCHIVE_HEADER = struct.Struct("<8sQ")
+ARCHIVE_NAME = "templates.voltpack"
+ARCHIVE_PATH = Path(__file__).parent.parent / ARCHIVE_NAME
+ARCHIVE_SOURCE_ROOT = Path(__file__).parent.parent / "templates"
+
+
+def pack_templates(root: Path, output: Path) -> Path:
+    """Pack every template below ``root`` into a single indexed archive.
+
+    Layout: ``magic | index length | JSON index | content``. Index entries are
+    ``[path, offset, length, placeholders]`` sorted by path, with offsets
+    relative to the start of the content section and placeholder spans
+    precomputed for text templates (``None`` for raw files).
+    """
+    entries = []
+    blobs = []
+    offset = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_NAMES)
+        for filename in sorted(filenames):
+            if filename in IGNORED_NAMES or filename.endswith((".pyc", ".pyo")):
+                continue
+            path = Path(dirpath) / filename
+            data = path.read_bytes()
+            try:
+                file = TemplateFile.from_content(filename, data.decode("utf-8"))
+                placeholders = [list(span) for span in file.placeholders]
+            except UnicodeDecodeError:
+                placeholders = None
+            key = path.relative_to(root).as_posix()
+            entries.append([key, offset, len(data), placeholders])
+            blobs.append(data)
+            offset += len(data)
+
+    entries.sort(key=lambda entry: entry[0])
+    index = json.dumps({"files": entries}, separators=(",", ":")).encode("utf-8")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, output)
+    return output
+
+
+class TemplateArchive:
+    """Read-only, memory-mapped view of a packed template archive."""
+
+    def __init__(self, path: Path, source_root: Path = ARCHIVE_SOURCE_ROOT):
+        self.path = path
+        self.source_root = source_root
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = ARCHIVE_HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError(f"Not a volt template archive: {path}")
+        index_start = ARCHIVE_HEADER.size
+        index = json.loads(self._map[index_start : index_start + index_length])
+        self._data_start = index_start + index_length
+        self._entries = index["files"]
+        self._keys = [entry[0] for entry in self._entries]
+
+    def key_for(self, path: Path) -> str | None:
+        """Map a path below the loose template directory to an archive key."""
+        try:
+            key = Path(path).relative_to(self.source_root).as_posix()
+        except ValueError:
+            return None
+        return "" if key == "." else key
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        return start, end
+
+    def is_file(self, key: str) -> bool:
+        i = bisect.bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def is_dir(self, key: str) -> bool:
+        if not key:
+            return bool(self._keys)
+        start, end = self._range(f"{key}/")
+        return start < end
+
+    def exists(self, key: str) -> bool:
+        return self.is_file(key) or self.is_dir(key)
+
+    def _load(self, entry) -> TemplateFile:
+        _, offset, length, placeholders = entry
+        start = self._data_start + offset
+        data = self._map[start : start + length]
+        if placeholders is None:
+            return TemplateFile(data)
+        return TemplateFile(
+            data.decode("utf-8"), tuple(tuple(span) for span in placeholders)
+        )
+
+    def read(self, key: str) -> TemplateFile:
+        i = bisect.bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            raise FileNotFoundError(f"Template file not found in archive: {key}")
+        return self._load(self._entries[i])
+
+    def read_dir(self, key: str) -> dict[str, TemplateFile]:
+        prefix = f"{key}/" if key else ""
+        start, end = self._range(prefix) if prefix else (0, len(self._keys))
+        if start == end:
+            raise FileNotFoundError(f"Template directory not found in archive: {key}")
+        return {
+            self._keys[i][len(prefix) :]: self._load(self._entries[i])
+            for i in range(start, end)
+        }
+
+
+@lru_cache(maxsize=None)
+def get_template_archive() -> TemplateArchive | None:
+    """Return the packed archive shipped next to the package, if any.
+
+    Frozen builds ship only the archive; development checkouts have no
+    archive and fall back to the loose ``templates`` directory.
+    """
+    path = Path(os.environ.get("VOLT_TEMPLATE_ARCHIVE", ARCHIVE_PATH))
+    if not path.is_file():
+        return None
+    return TemplateArchive(path)
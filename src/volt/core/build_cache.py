@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from volt.core.compose import REPLICAS_COMPOSE_FILE, TUNED_COMPOSE_FILE
+from volt.core.state import STATE_DIR
+from volt.core.tracing import traced
+
+DOCKERIGNORE = ".dockerignore"
+# Written when a project has no .dockerignore, so the local environment and
+# caches are neither sent to the daemon nor part of the build digest.
+DEFAULT_DOCKERIGNORE = """.git
+.venv
+.volt
+**/__pycache__
+**/*.pyc
+"""
+# Volt's own state and the compose overrides it writes change on every
+# `volt up` without changing the image, so they never count as context,
+# whatever the project's .dockerignore says.
+VOLT_STATE_DIR = STATE_DIR.as_posix()
+VOLT_GENERATED_FILES = frozenset({TUNED_COMPOSE_FILE, REPLICAS_COMPOSE_FILE})
+IMAGE_TAG_PREFIX = "volt-"
+
+
+def _pattern_regex(pattern: str) -> re.Pattern:
+    """Translate a .dockerignore pattern into a regex over relative paths."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    # A pattern matching a directory also excludes everything below it.
+    return re.compile("".join(parts) + "(?:/.*)?")
+
+
+class DockerIgnore:
+    """The exclusion rules of a build context's .dockerignore.
+
+    Rules apply in order and the last matching one wins, so ``!pattern``
+    re-includes paths excluded by an earlier rule.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.rules: list[tuple[re.Pattern, bool]] = []
+        for line in patterns:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            include = line.startswith("!")
+            pattern = os.path.normpath(line.lstrip("!").strip()).lstrip("/")
+            self.rules.append((_pattern_regex(pattern), include))
+        self.has_exceptions = any(include for _, include in self.rules)
+
+    @classmethod
+    def load(cls, root: Path) -> "DockerIgnore":
+        path = root / DOCKERIGNORE
+        return cls(path.read_text().splitlines() if path.exists() else [])
+
+    def ignores(self, rel: str) -> bool:
+        ignored = False
+        for regex, include in self.rules:
+            if regex.fullmatch(rel):
+                ignored = not include
+        return ignored
+
+
+def iter_context_files(root: Path):
+    """Relative paths of the files ``docker build`` sends from ``root``.
+
+    Volt's state directory and generated compose overrides are left out.
+    """
+    ignore = DockerIgnore.load(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        if not prefix:
+            dirnames[:] = [d for d in dirnames if d != VOLT_STATE_DIR]
+            filenames = [f for f in filenames if f not in VOLT_GENERATED_FILES]
+        # Excluded directories can only be skipped when nothing re-includes.
+        if not ignore.has_exceptions:
+            dirnames[:] = [d for d in dirnames if not ignore.ignores(prefix + d)]
+        dirnames.sort()
+        for filename in sorted(filenames):
+            rel = prefix + filename
+            if not ignore.ignores(rel):
+                yield rel
+
+
+@traced(category="docker")
+def build_context_digest(root: Path, options: dict | None = None) -> str:
+    """Content hash of a build: every file of the context plus the options.
+
+    Anything that changes what ``docker build`` would produce changes the
+    digest (sources, pyproject.toml, uv.lock, the Dockerfile itself), so an
+    image tagged with it can be reused as is.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(options or {}, sort_keys=True).encode("utf-8"))
+    for rel in iter_context_files(root):
+        file_digest = hashlib.sha256()
+        with open(root / rel, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_digest.update(chunk)
+        digest.update(f"{rel}\0{file_digest.hexdigest()}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def image_tag(image_name: str, digest: str) -> str:
+    return f"{image_name}:{IMAGE_TAG_PREFIX}{digest[:16]}"
@@ -0,0 +1,121 @@
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from volt.core.state import STATE_DIR, ensure_state_dir
+
+UP_STATE_PATH = STATE_DIR / "up"
+UP_STATE_VERSION = 1
+
+# Overrides volt up writes next to docker-compose.yaml.
+TUNED_COMPOSE_FILE = "docker-compose.tuned.yaml"
+REPLICAS_COMPOSE_FILE = "docker-compose.replicas.yaml"
+
+# One line per container for `docker inspect --format`.
+INSPECT_FORMAT = (
+    "{{.Id}}\t{{.Name}}\t{{.State.Status}}\t"
+    "{{if .State.Health}}{{.State.Health.Status}}{{else}}none{{end}}"
+)
+
+READY = "ready"
+FAILED = "failed"
+STARTING = "starting"
+
+
+@dataclass
+class UpState:
+    """What the last ``volt up`` started, stored in ``.volt/up``.
+
+    ``build`` is the digest of the app's build inputs when its image was last
+    built, ``started`` the digest of the image the running app was started
+    from and ``services`` the compose config hash of every service started.
+    """
+
+    build: str = ""
+    started: str = ""
+    services: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, root: Path) -> "UpState":
+        path = root / UP_STATE_PATH
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == UP_STATE_VERSION:
+                return cls(
+                    build=data["build"],
+                    started=data["started"],
+                    services=dict(data["services"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return cls()
+
+    def save(self, root: Path) -> None:
+        path = root / UP_STATE_PATH
+        ensure_state_dir(root)
+        data = {"version": UP_STATE_VERSION, **asdict(self)}
+        path.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n")
+
+
+def parse_service_hashes(output: str) -> dict[str, str]:
+    """Parse ``docker compose config --hash '*'`` (one ``service hash`` per line)."""
+    hashes = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            hashes[parts[0]] = parts[1]
+    return hashes
+
+
+@dataclass
+class ContainerHealth:
+    id: str
+    name: str
+    status: str
+    health: str
+
+    @property
+    def state(self) -> str:
+        if self.status in {"exited", "dead"} or self.health == "unhealthy":
+            return FAILED
+        if self.status == "running" and self.health in {"healthy", "none"}:
+            return READY
+        return STARTING
+
+
+def parse_container_health(output: str) -> list[ContainerHealth]:
+    """Parse ``docker inspect --format INSPECT_FORMAT`` output."""
+    containers = []
+    for line in output.splitlines():
+        parts = line.strip().split("\t")
+        if len(parts) == 4:
+            container_id, name, status, health = parts
+            containers.append(
+                ContainerHealth(container_id, name.lstrip("/"), status, health)
+            )
+    return containers
+
+
+def print_readiness(results: dict[str, tuple[str, float | None]], elapsed: float) -> None:
+    """Print when each container became ready (or that it didn't)."""
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+
+    styles = {READY: "green", FAILED: "red", STARTING: "yellow"}
+    table = Table(title="Service readiness", show_header=True, header_style="bold magenta")
+    table.add_column("Container", style="cyan")
+    table.add_column("State")
+    table.add_column("Ready after", justify="right")
+
+    for name, (state, seconds) in sorted(results.items()):
+        label = state if state != STARTING else "timed out"
+        table.add_row(
+            escape(name),
+            f"[{styles[state]}]{label}[/{styles[state]}]",
+            f"{seconds:.1f}s" if seconds is not None else "-",
+        )
+
+    console = Console()
+    console.print(table)
+    console.print(f"[dim]Waited {elapsed:.1f}s for {len(results)} containers.[/dim]")
@@ -1,7 +1,10 @@
+import os
+import sys
+
 import tomli
 import tomli_w
 from pathlib import Path
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 
 class VoltConfig(BaseModel):
@@ -11,16 +14,29 @@ class VoltConfig(BaseModel):
 
 
 def load_config(path: Path) -> VoltConfig | None:
+    """Read a volt.toml; None when it doesn't exist.
+
+    Raises ``ValueError`` when the file exists but can't be used.
+    """
     if not path.exists():
         return None
     try:
         with open(path, "rb") as f:
             data = tomli.load(f)
         return VoltConfig(**data)
-    except Exception:
-        return None
+    except (OSError, tomli.TOMLDecodeError, ValidationError) as e:
+        raise ValueError(f"Invalid {path.name}: {e}") from e
 
 
 def save_config(config: VoltConfig, path: Path) -> None:
-    with open(path, "wb") as f:
-        tomli_w.dump(config.model_dump(), f)
+    path.write_text(tomli_w.dumps(config.model_dump()))
+
+
+def volt_cache_dir() -> Path:
+    if os.environ.get("VOLT_CACHE_DIR"):
+        return Path(os.environ["VOLT_CACHE_DIR"])
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "volt"
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+
+from volt.core.dependencies import DependencyPlan, missing_packages
+from volt.core.render import RenderTree
+
+CHANGE_STYLES = {
+    "package": ("+ add", "green"),
+    "dev package": ("+ dev", "green"),
+    "create": ("+ create", "green"),
+    "update": ("~ update", "yellow"),
+    "keep": ("= keep", "dim"),
+}
+
+
+@dataclass
+class ProjectDelta:
+    """What adding a feature changes in an existing project.
+
+    Only the missing packages are installed and only created or updated files
+    are written; files a template would have replaced are kept as they are.
+    """
+
+    feature: str
+    packages: list[str] = field(default_factory=list)
+    dev_packages: list[str] = field(default_factory=list)
+    created: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    kept: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.packages or self.dev_packages or self.created or self.updated)
+
+    def changes(self):
+        for kind, items in (
+            ("package", self.packages),
+            ("dev package", self.dev_packages),
+            ("create", self.created),
+            ("update", self.updated),
+            ("keep", self.kept),
+        ):
+            for item in items:
+                yield kind, item
+
+
+def plan_delta(
+    feature: str,
+    tree: RenderTree,
+    plan: DependencyPlan,
+    requirements: dict[str, set[str]],
+    dev_requirements: dict[str, set[str]] | None = None,
+) -> ProjectDelta:
+    """Compare a tree staged with ``keep_existing`` against its base project."""
+    delta = ProjectDelta(
+        feature,
+        packages=missing_packages(plan.packages, requirements),
+        dev_packages=missing_packages(plan.dev_packages, dev_requirements or {}),
+        kept=sorted(tree.kept),
+    )
+    for key in sorted(tree.dirty):
+        if (tree.base / key).exists():
+            delta.updated.append(key)
+        else:
+            delta.created.append(key)
+    return delta
+
+
+def print_project_delta(delta: ProjectDelta) -> None:
+    from rich import print
+    from rich.markup import escape
+
+    if not delta:
+        print(f"[green]✔ {escape(delta.feature)} is already set up, nothing to do.[/green]")
+        return
+
+    lines = [f"[bold]Changes for {escape(delta.feature)}:[/bold]"]
+    for kind, item in delta.changes():
+        label, style = CHANGE_STYLES[kind]
+        lines.append(f"  [{style}]{label:<8}[/{style}] {escape(item)}")
+    lines.append(
+        f"[dim]{len(delta.packages) + len(delta.dev_packages)} packages, {len(delta.created)} new and "
+        f"{len(delta.updated)} updated files, {len(delta.kept)} existing files kept.[/dim]"
+    )
+    print("\n".join(lines))
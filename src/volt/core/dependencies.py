@@ -1,17 +1,117 @@
+import json
+import re
 import subprocess
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from volt.core.tracing import span
+
 
 def run_uv(args: list[str], cwd: Path, check: bool = True):
     cmd = ["uv", *args]
-    subprocess.run(cmd, cwd=cwd, check=check, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, )
+    with span(f"uv {args[0]}", category="uv", command=" ".join(cmd)):
+        subprocess.run(cmd, cwd=cwd, check=check, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, )
+
+
+@dataclass
+class DependencyPlan:
+    """Packages to install, grouped by the feature that requires them.
+
+    Development-only packages (tests, tooling) go to the project's ``dev``
+    dependency group.
+    """
+
+    groups: dict[str, list[str]] = field(default_factory=dict)
+    dev_groups: dict[str, list[str]] = field(default_factory=dict)
+
+    def add(self, feature: str, packages: list[str]) -> None:
+        if packages:
+            self.groups.setdefault(feature, []).extend(packages)
+
+    def add_dev(self, feature: str, packages: list[str]) -> None:
+        if packages:
+            self.dev_groups.setdefault(feature, []).extend(packages)
+
+    @property
+    def packages(self) -> list[str]:
+        return list(dict.fromkeys(p for group in self.groups.values() for p in group))
+
+    @property
+    def dev_packages(self) -> list[str]:
+        return list(
+            dict.fromkeys(p for group in self.dev_groups.values() for p in group)
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.packages or self.dev_packages)
+
+
+def print_dependency_plan(plan: DependencyPlan) -> None:
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+
+    table = Table(title="Dependency plan", show_header=True, header_style="bold magenta")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Packages", style="green")
+
+    for feature, packages in plan.groups.items():
+        table.add_row(escape(feature), escape(", ".join(packages)))
+    for feature, packages in plan.dev_groups.items():
+        table.add_row(escape(f"{feature} (dev)"), escape(", ".join(packages)))
 
+    console = Console()
+    console.print(table)
+    count = len(plan.packages) + len(plan.dev_packages)
+    console.print(f"[dim]{count} packages, resolved and synced in a single 'uv add'.[/dim]")
 
-def install_uv_packages(packages: list[str], dest: Path):
+
+def parse_requirement(requirement: str) -> tuple[str, set[str]] | None:
+    """Normalized name and extras of a PEP 508 requirement string."""
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?", requirement)
+    if match is None:
+        return None
+    name = re.sub(r"[-_.]+", "-", match.group(1)).lower()
+    extras = {e.strip().lower() for e in (match.group(2) or "").split(",") if e.strip()}
+    return name, extras
+
+
+def missing_packages(
+    packages: list[str], requirements: dict[str, set[str]]
+) -> list[str]:
+    """The packages (with their extras) that ``requirements`` don't cover yet."""
+    missing = []
+    for package in packages:
+        name, extras = parse_requirement(package)
+        if name not in requirements or not extras <= requirements[name]:
+            missing.append(package)
+    return missing
+
+
+def install_uv_packages(packages: list[str], dest: Path, dev: bool = False):
     if not packages:
         return
 
-    run_uv(["add", *packages], dest)
+    run_uv(["add", *(["--dev"] if dev else []), *packages], dest)
+
+
+def declare_dev_dependencies(packages: list[str], dest: Path):
+    """Declare the ``dev`` dependency group of a freshly initialised project.
+
+    Written straight into pyproject.toml, so the next ``uv add`` resolves and
+    syncs it together with the runtime packages.
+    """
+    if not packages:
+        return
+
+    pyproject = dest / "pyproject.toml"
+    lines = "".join(f"    {json.dumps(package)},\n" for package in packages)
+    text = pyproject.read_text().rstrip("\n")
+    pyproject.write_text(f"{text}\n\n[dependency-groups]\ndev = [\n{lines}]\n")
+
+
+def apply_dependency_plan(plan: DependencyPlan, dest: Path):
+    install_uv_packages(plan.packages, dest)
 
 
 def init_uv_project(dest: Path):
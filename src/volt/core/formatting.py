@@ -0,0 +1,164 @@
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import tomli
+
+from volt.core.config import volt_cache_dir
+
+FORMAT_EXCLUDED_DIRS = {".venv", "venv", ".git", "__pycache__", "node_modules"}
+
+
+@lru_cache(maxsize=None)
+def _black_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("black")
+    except PackageNotFoundError:
+        import black
+
+        return black.__version__
+
+
+class FormatCache:
+    """Content-addressed cache of black output, keyed by the input's hash.
+
+    Entries live under the volt cache dir, namespaced by black version, so a
+    file whose content was already seen is never handed to black again.
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or volt_cache_dir() / "black" / _black_version()
+
+    def _entry(self, source: str, mode=None) -> Path:
+        digest = hashlib.sha256(source.encode("utf-8"))
+        if mode is not None:
+            digest.update(mode.get_cache_key().encode("utf-8"))
+        digest = digest.hexdigest()
+        return self.root / digest[:2] / digest
+
+    def get(self, source: str, mode=None) -> str | None:
+        try:
+            return self._entry(source, mode).read_text()
+        except OSError:
+            return None
+
+    def put(self, source: str, formatted: str, mode=None) -> None:
+        entry = self._entry(source, mode)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_name(f".{entry.name}.{os.getpid()}")
+            tmp.write_text(formatted)
+            os.replace(tmp, entry)
+        except OSError:
+            pass
+
+
+def _mode_from_pyproject(text: str):
+    """black's Mode for a pyproject.toml, read as ``black`` itself reads it."""
+    import black
+    from black.files import infer_target_version
+
+    data = tomli.loads(text)
+    config = data.get("tool", {}).get("black", {})
+    config = {k.replace("--", "").replace("-", "_"): v for k, v in config.items()}
+    if "target_version" in config:
+        target_versions = {black.TargetVersion[v.upper()] for v in config["target_version"]}
+    else:
+        target_versions = set(infer_target_version(data) or ())
+
+    return black.Mode(
+        target_versions=target_versions,
+        line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+        string_normalization=not config.get("skip_string_normalization", False),
+        magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+        skip_source_first_line=config.get("skip_source_first_line", False),
+        is_pyi=config.get("pyi", False),
+        preview=config.get("preview", False),
+        unstable=config.get("unstable", False),
+        enabled_features={
+            black.Preview[feature] for feature in config.get("enable_unstable_feature", [])
+        },
+    )
+
+
+def black_mode(root: Path):
+    """black's Mode for the project at ``root``, from its ``[tool.black]``.
+
+    ``root`` may be a render-tree path, whose pending pyproject.toml counts.
+    Without one there, the configuration is looked up the way the ``black``
+    CLI does, from the directory upwards.
+    """
+    import black
+
+    pyproject = root / "pyproject.toml"
+    if pyproject.exists():
+        text = pyproject.read_text()
+    else:
+        tree = getattr(root, "tree", None)
+        if tree is not None:
+            # Only the part of the project already on disk can be searched.
+            root = tree.base / root.relative_to(tree.root) if tree.base else None
+        if root is None or not Path(root).exists():
+            return black.Mode()
+        found = black.find_pyproject_toml((str(root),))
+        if found is None:
+            return black.Mode()
+        text = Path(found).read_text()
+
+    try:
+        return _mode_from_pyproject(text)
+    except (tomli.TOMLDecodeError, KeyError, TypeError, ValueError):
+        return black.Mode()
+
+
+def format_source(source: str, cache: FormatCache | None = None, mode=None) -> str:
+    """Format Python source with black's API, skipping black on cache hits.
+
+    Sources black can't parse are returned unchanged.
+    """
+    import black
+
+    mode = mode or black.Mode()
+    if cache is not None:
+        cached = cache.get(source, mode)
+        if cached is not None:
+            return cached
+
+    try:
+        formatted = black.format_str(source, mode=mode)
+    except black.InvalidInput:
+        return source
+
+    if cache is not None:
+        cache.put(source, formatted, mode)
+        cache.put(formatted, formatted, mode)
+    return formatted
+
+
+def format_files(files, cache: FormatCache | None = None, mode=None) -> list:
+    """Format the given files in place; returns the ones whose content changed.
+
+    Works with both ``Path`` and render-tree ``VirtualPath`` objects.
+    """
+    cache = cache or FormatCache()
+    changed = []
+    for path in files:
+        if path.suffix != ".py" or not path.exists():
+            continue
+        source = path.read_text()
+        formatted = format_source(source, cache, mode)
+        if formatted != source:
+            path.write_text(formatted)
+            changed.append(path)
+    return changed
+
+
+def iter_python_files(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in FORMAT_EXCLUDED_DIRS]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath) / filename
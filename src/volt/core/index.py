@@ -0,0 +1,143 @@
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Callable
+
+from volt.core.state import STATE_DIR, ensure_state_dir
+from volt.core.tracing import traced
+
+INDEX_PATH = STATE_DIR / "index"
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    """Project files defining one kind of symbol, and how to find them."""
+
+    kind: str
+    # Path relative to the project root; may contain glob wildcards.
+    pattern: str
+    # Returns the names of the symbols a module's source defines.
+    scan: Callable[[str], list[str]]
+
+
+class SymbolIndex:
+    """Symbols a project defines (models, routers, ...), kept in ``.volt/index``.
+
+    Every indexed file is stored with its size, mtime and the symbols found
+    in it. Loading re-scans only the files that changed since they were
+    indexed, so generators can look symbols up without parsing the project.
+    The index is a cache: it is rebuilt from the sources when missing.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        sources: tuple[IndexSource, ...] = (),
+        files: dict[str, dict] | None = None,
+    ):
+        self.root = root
+        self.sources = sources
+        self.files = files or {}
+        self._symbols: dict[str, dict[str, str]] = {}
+        self._changed = False
+
+    @classmethod
+    @traced(category="index")
+    def load(cls, root: Path, sources: tuple[IndexSource, ...]) -> "SymbolIndex":
+        files = {}
+        path = root / INDEX_PATH
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == INDEX_VERSION:
+                    files = dict(data["files"])
+            except (ValueError, KeyError, TypeError):
+                pass
+        index = cls(root, sources, files)
+        index.refresh()
+        return index
+
+    def save(self) -> None:
+        path = self.root / INDEX_PATH
+        ensure_state_dir(self.root)
+        data = {
+            "version": INDEX_VERSION,
+            "files": {key: self.files[key] for key in sorted(self.files)},
+        }
+        path.write_text(json.dumps(data, indent=1) + "\n")
+        self._changed = False
+
+    def _source_for(self, key: str) -> IndexSource | None:
+        for source in self.sources:
+            if PurePosixPath(key).full_match(source.pattern):
+                return source
+        return None
+
+    def _scan(self, key: str, source: IndexSource, stat: os.stat_result) -> None:
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        entry = self.files.get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            return
+        try:
+            symbols = source.scan((self.root / key).read_text())
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            # Half-edited files are indexed as empty until they change again.
+            symbols = []
+        self.files[key] = {"kind": source.kind, "stamp": stamp, "symbols": symbols}
+        self._symbols.pop(source.kind, None)
+        self._changed = True
+
+    def _drop(self, key: str) -> None:
+        entry = self.files.pop(key, None)
+        if entry is not None:
+            self._symbols.pop(entry["kind"], None)
+            self._changed = True
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the files on disk."""
+        found = {}
+        for source in self.sources:
+            for path in self.root.glob(source.pattern):
+                found.setdefault(path.relative_to(self.root).as_posix(), source)
+
+        for key in [key for key in self.files if key not in found]:
+            self._drop(key)
+        for key, source in found.items():
+            try:
+                self._scan(key, source, (self.root / key).stat())
+            except FileNotFoundError:
+                self._drop(key)
+        if self._changed:
+            self.save()
+
+    @traced(category="index")
+    def update(self, paths) -> None:
+        """Re-index ``paths`` after they were written or removed."""
+        for path in paths:
+            key = Path(path).relative_to(self.root).as_posix()
+            source = self._source_for(key)
+            if source is None:
+                continue
+            try:
+                self._scan(key, source, (self.root / key).stat())
+            except FileNotFoundError:
+                self._drop(key)
+        if self._changed:
+            self.save()
+
+    def symbols(self, kind: str) -> dict[str, str]:
+        """Every symbol of ``kind``, mapped to the file that defines it."""
+        symbols = self._symbols.get(kind)
+        if symbols is None:
+            symbols = self._symbols[kind] = {
+                name: key
+                for key, entry in sorted(self.files.items())
+                if entry["kind"] == kind
+                for name in entry["symbols"]
+            }
+        return symbols
+
+    def has(self, kind: str, name: str) -> bool:
+        return name in self.symbols(kind)
@@ -1,4 +1,7 @@
+import ast
 import re
+import textwrap
+from functools import cached_property
 from pathlib import Path
 
 
@@ -21,3 +24,237 @@ def insert_after_pattern(file_path: Path, pattern: str, text_to_insert: str, fla
     new_content = re.sub(pattern, r"\g<0>" + text_to_insert, content, flags=flags)
     file_path.write_text(new_content)
     return new_content
+
+
+LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class SourceEditor:
+    """Parse a Python module once, queue edits against it, then write once.
+
+    Edit positions come from the ``ast`` of the file rather than regexes, so
+    hand-written code around the edited spans is left untouched. Edits are
+    applied together by :meth:`commit`, in the order they were queued when
+    several target the same position.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.source = path.read_text()
+        self.module = ast.parse(self.source)
+        # Only the line breaks ast counts; str.splitlines() also splits on
+        # form feeds and other separators, which would shift every offset.
+        self._line_starts = [0]
+        self._line_starts += [m.end() for m in LINE_BREAK.finditer(self.source)]
+        if self._line_starts[-1] != len(self.source):
+            self._line_starts.append(len(self.source))
+        self._edits: list[tuple[int, int, int, str]] = []
+        self._pending_imports: set[tuple] = set()
+        self._filled: set[int] = set()
+
+    # Positions -----------------------------------------------------------
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        if lineno > len(self._line_starts) - 1:
+            return len(self.source)
+        start = self._line_starts[lineno - 1]
+        line = self.source[start : self._line_starts[lineno]]
+        # ast column offsets count UTF-8 bytes, not characters.
+        return start + len(line.encode("utf-8")[:col_offset].decode("utf-8"))
+
+    def start(self, node: ast.AST) -> int:
+        return self.offset(node.lineno, node.col_offset)
+
+    def end(self, node: ast.AST) -> int:
+        return self.offset(node.end_lineno, node.end_col_offset)
+
+    def _line_start(self, node: ast.AST) -> int:
+        decorators = getattr(node, "decorator_list", None)
+        first = decorators[0] if decorators else node
+        return self._line_starts[first.lineno - 1]
+
+    def _line_end(self, node: ast.AST) -> int:
+        if node.end_lineno >= len(self._line_starts) - 1:
+            return len(self.source)
+        return self._line_starts[node.end_lineno]
+
+    # Queries -------------------------------------------------------------
+
+    @staticmethod
+    def call_name(call: ast.Call) -> str | None:
+        if isinstance(call.func, ast.Name):
+            return call.func.id
+        if isinstance(call.func, ast.Attribute):
+            return call.func.attr
+        return None
+
+    def find_assignment(self, name: str, call: str | None = None) -> ast.stmt | None:
+        """Top-level ``name = ...`` statement, optionally ``name = call(...)``."""
+        for stmt in self.module.body:
+            if isinstance(stmt, ast.Assign):
+                targets = stmt.targets
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets = [stmt.target]
+            else:
+                continue
+            if not any(isinstance(t, ast.Name) and t.id == name for t in targets):
+                continue
+            if call is None or (
+                isinstance(stmt.value, ast.Call) and self.call_name(stmt.value) == call
+            ):
+                return stmt
+        return None
+
+    def find_function(self, name: str) -> ast.FunctionDef | ast.AsyncFunctionDef | None:
+        for stmt in self.module.body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) and stmt.name == name:
+                return stmt
+        return None
+
+    def find_calls(self, name: str, root: ast.AST | None = None) -> list[ast.Call]:
+        """Calls to ``name``; dotted names such as ``"sentry_sdk.init"`` match exactly."""
+
+        def matches(call: ast.Call) -> bool:
+            if "." in name:
+                return ast.unparse(call.func) == name
+            return self.call_name(call) == name
+
+        if root is not None:
+            return [
+                node
+                for node in ast.walk(root)
+                if isinstance(node, ast.Call) and matches(node)
+            ]
+        return [call for call in self._calls.get(name.rsplit(".", 1)[-1], []) if matches(call)]
+
+    @cached_property
+    def _calls(self) -> dict[str | None, list[ast.Call]]:
+        # The module is parsed once and never re-parsed, so calls are indexed
+        # once instead of walking the whole tree for every query.
+        index: dict[str | None, list[ast.Call]] = {}
+        for node in ast.walk(self.module):
+            if isinstance(node, ast.Call):
+                index.setdefault(self.call_name(node), []).append(node)
+        return index
+
+    def defines(self, name: str) -> bool:
+        for stmt in self.module.body:
+            if isinstance(stmt, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                if stmt.name == name:
+                    return True
+        return self.find_assignment(name) is not None
+
+    @staticmethod
+    def keyword(call: ast.Call, name: str) -> ast.keyword | None:
+        return next((kw for kw in call.keywords if kw.arg == name), None)
+
+    @staticmethod
+    def _import_keys(stmt: ast.stmt) -> set[tuple]:
+        if isinstance(stmt, ast.ImportFrom):
+            return {(stmt.module, a.name, a.asname) for a in stmt.names}
+        if isinstance(stmt, ast.Import):
+            return {(None, a.name, a.asname) for a in stmt.names}
+        return set()
+
+    @cached_property
+    def _module_imports(self) -> set[tuple]:
+        keys = set()
+        for stmt in self.module.body:
+            keys |= self._import_keys(stmt)
+        return keys
+
+    def imported(self) -> set[tuple]:
+        return self._module_imports | self._pending_imports
+
+    def has_import(self, statement: str) -> bool:
+        wanted = set()
+        for stmt in ast.parse(statement).body:
+            wanted |= self._import_keys(stmt)
+        return all(
+            key in self._module_imports or key in self._pending_imports for key in wanted
+        )
+
+    # Edits ---------------------------------------------------------------
+
+    def replace(self, start: int, end: int, text: str) -> None:
+        self._edits.append((start, end, len(self._edits), text))
+
+    def insert(self, offset: int, text: str) -> None:
+        self.replace(offset, offset, text)
+
+    @staticmethod
+    def _indent(code: str, col_offset: int) -> str:
+        lines = textwrap.dedent(code).strip("\n").splitlines()
+        prefix = " " * col_offset
+        return "".join(f"{prefix}{line}\n" if line.strip() else "\n" for line in lines)
+
+    def add_import(self, statement: str) -> None:
+        """Add an import after the module's last top-level import, once."""
+        if self.has_import(statement):
+            return
+        for stmt in ast.parse(statement).body:
+            self._pending_imports |= self._import_keys(stmt)
+
+        imports = [
+            stmt
+            for stmt in self.module.body
+            if isinstance(stmt, (ast.Import, ast.ImportFrom))
+        ]
+        if imports:
+            self.insert(self._line_end(imports[-1]), f"{statement}\n")
+        else:
+            self.insert(0, f"{statement}\n")
+
+    def insert_before(self, node: ast.stmt, code: str, blank_lines: int = 0) -> None:
+        text = self._indent(code, node.col_offset) + "\n" * blank_lines
+        self.insert(self._line_start(node), text)
+
+    def insert_after(self, node: ast.stmt, code: str, blank_lines: int = 0) -> None:
+        end = self._line_end(node)
+        prefix = "" if self.source[:end].endswith("\n") or not end else "\n"
+        self.insert(end, prefix + "\n" * blank_lines + self._indent(code, node.col_offset))
+
+    def append(self, code: str) -> None:
+        prefix = "" if self.source.endswith("\n") or not self.source else "\n"
+        self.insert(len(self.source), prefix + textwrap.dedent(code).strip("\n") + "\n")
+
+    def _append_item(self, items: list[ast.AST], closing: int, text: str, multiline: bool) -> None:
+        if not items:
+            # Later appends to a collection that was empty follow the first one.
+            if closing in self._filled:
+                self.insert(closing, f"    {text},\n" if multiline else f", {text}")
+            else:
+                self.insert(closing, f"\n    {text},\n" if multiline else text)
+                self._filled.add(closing)
+            return
+        last_end = self.end(items[-1])
+        between = self.source[last_end:closing]
+        if "," in between:
+            self.insert(last_end + between.index(",") + 1, f" {text},")
+        else:
+            self.insert(last_end, f", {text}")
+
+    def add_keyword(self, call: ast.Call, name: str, value: str) -> None:
+        items = sorted([*call.args, *call.keywords], key=lambda n: (n.lineno, n.col_offset))
+        self._append_item(items, self.end(call) - 1, f"{name}={value}", multiline=False)
+
+    def append_element(self, collection: ast.List | ast.Dict, code: str, multiline: bool = False) -> None:
+        items = collection.values if isinstance(collection, ast.Dict) else collection.elts
+        self._append_item(items, self.end(collection) - 1, code, multiline)
+
+    # Transaction ---------------------------------------------------------
+
+    def apply(self) -> str:
+        content = self.source
+        for start, end, _, text in sorted(self._edits, key=lambda e: (e[0], e[2]), reverse=True):
+            content = content[:start] + text + content[end:]
+        return content
+
+    def commit(self) -> bool:
+        """Write all queued edits in one go; returns whether the file changed."""
+        if not self._edits:
+            return False
+        self.path.write_text(self.apply())
+        self._edits.clear()
+        self._filled.clear()
+        return True
@@ -0,0 +1,54 @@
+import importlib
+from dataclasses import dataclass
+
+import click
+from typer import Typer
+from typer.core import TyperGroup
+from typer.main import get_group
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A sub-Typer registered by import path, resolved on first use."""
+
+    import_path: str
+    help: str | None = None
+    no_args_is_help: bool = False
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup whose sub-apps are only imported when they are invoked.
+
+    Subclasses declare ``lazy_subcommands`` as ``{name: LazySubcommand}`` where
+    ``import_path`` is ``"package.module:attribute"`` pointing at a ``Typer``.
+    """
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolved: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*self.lazy_subcommands, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._resolve(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _resolve(self, cmd_name: str) -> click.Command:
+        if cmd_name not in self._resolved:
+            spec = self.lazy_subcommands[cmd_name]
+            module_name, attr = spec.import_path.split(":", 1)
+            sub_app = getattr(importlib.import_module(module_name), attr)
+
+            # Mount the sub-app on a throwaway parent so typer applies the same
+            # name/help/no_args_is_help handling as a regular add_typer().
+            options = {"no_args_is_help": spec.no_args_is_help}
+            if spec.help is not None:
+                options["help"] = spec.help
+            holder = Typer()
+            holder.add_typer(sub_app, name=cmd_name, **options)
+            self._resolved[cmd_name] = get_group(holder).commands[cmd_name]
+        return self._resolved[cmd_name]
@@ -0,0 +1,144 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from volt.core.render import TemplateFile, load_template_file
+from volt.core.state import STATE_DIR, ensure_state_dir
+
+MANIFEST_PATH = STATE_DIR / "manifest"
+MANIFEST_VERSION = 1
+
+# Outcomes of comparing a generated file against its manifest entry.
+STATUS_NEW = "new"
+STATUS_UNCHANGED = "unchanged"
+STATUS_STALE = "stale"
+STATUS_MODIFIED = "modified"
+
+
+def content_hash(content: str | bytes) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def input_hash(template: TemplateFile, variables: dict[str, str] | None = None) -> str:
+    """Hash everything a generated file is rendered from.
+
+    Only the variables the template actually references count, so a shared
+    file such as a base class keeps the same inputs for every model.
+    """
+    used = {
+        key: str(variables[key])
+        for _, _, key in template.placeholders
+        if variables and key in variables
+    }
+    digest = hashlib.sha256(bytes.fromhex(content_hash(template.content)))
+    digest.update(json.dumps(used, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def template_key(template: Path) -> str:
+    from volt.core.template import TEMPLATES_ROOT
+
+    try:
+        return Path(template).relative_to(TEMPLATES_ROOT).as_posix()
+    except ValueError:
+        return Path(template).as_posix()
+
+
+@dataclass
+class ManifestEntry:
+    template: str
+    inputs: str
+    hash: str
+
+
+class Manifest:
+    """Record of the files volt generated in a project, stored in ``.volt/manifest``.
+
+    Each entry keeps the template a file came from, a hash of its inputs
+    (template content and variables) and a hash of the content volt wrote.
+    Regeneration compares against both: files whose inputs did not change
+    are left alone, and files whose content no longer matches what volt
+    wrote were edited by the user and are never overwritten.
+    """
+
+    def __init__(self, entries: dict[str, ManifestEntry] | None = None):
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, root: Path) -> "Manifest":
+        path = root / MANIFEST_PATH
+        if not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != MANIFEST_VERSION:
+                return cls()
+            entries = {
+                key: ManifestEntry(**entry) for key, entry in data["files"].items()
+            }
+        except (ValueError, KeyError, TypeError):
+            return cls()
+        return cls(entries)
+
+    def save(self, root: Path) -> None:
+        path = root / MANIFEST_PATH
+        ensure_state_dir(root)
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": {key: asdict(self.entries[key]) for key in sorted(self.entries)},
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n")
+
+    def tracks(self, key: str) -> bool:
+        return key in self.entries
+
+    def record(self, key: str, template: Path, inputs: str, content: str | bytes) -> None:
+        self.entries[key] = ManifestEntry(
+            template=template_key(template), inputs=inputs, hash=content_hash(content)
+        )
+
+    def status(self, key: str, inputs: str, path: Path) -> str:
+        """Classify the generated file ``key`` currently found at ``path``."""
+        entry = self.entries.get(key)
+        if entry is None or not path.exists():
+            return STATUS_NEW
+        if entry.inputs == inputs:
+            return STATUS_UNCHANGED
+        if content_hash(path.read_text()) != entry.hash:
+            return STATUS_MODIFIED
+        return STATUS_STALE
+
+    def record_tree(self, tree, inputs: dict[str, str] | None = None) -> None:
+        """Record every pending file of a render tree that came from a template.
+
+        ``inputs`` overrides the input hash per key; other files are keyed by
+        their template content alone.
+        """
+        inputs = inputs or {}
+        for key in sorted(tree.dirty):
+            template = tree.origins.get(key)
+            if template is None or key == MANIFEST_PATH.as_posix():
+                continue
+            self.record(
+                key,
+                template,
+                inputs.get(key) or input_hash(load_template_file(template)),
+                tree.files[key].content,
+            )
+
+
+def record_generated(tree, inputs: dict[str, str] | None = None) -> Manifest:
+    """Add a render tree's generated files to its project's manifest.
+
+    Call after formatting and before ``tree.write`` so the manifest is written
+    together with the files it describes.
+    """
+    manifest = Manifest.load(tree.root)
+    manifest.record_tree(tree, inputs)
+    manifest.save(tree.root)
+    return manifest
@@ -0,0 +1,569 @@
+import ast
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Lint severities.
+ERROR = "error"
+WARNING = "warning"
+
+BACKFILL_TEMPLATE = ("fastapi", "backfill", "backfill.py")
+BASELINE_TEMPLATE = ("fastapi", "squash", "baseline.py")
+
+
+@dataclass
+class StepTiming:
+    revision: str
+    message: str
+    seconds: float
+
+
+@contextmanager
+def time_migration_steps():
+    """Time every revision step Alembic runs inside the block.
+
+    The project's env.py runs in this process; its ``context.configure``
+    call gets an extra ``on_version_apply`` callback, which Alembic invokes
+    right after each step.
+    """
+    from alembic.runtime.environment import EnvironmentContext
+
+    timings: list[StepTiming] = []
+    last = time.perf_counter()
+
+    def on_version_apply(ctx, step, heads, run_args):
+        nonlocal last
+        now = time.perf_counter()
+        script = step.up_revision
+        message = (script.doc or "") if script is not None else ""
+        timings.append(StepTiming(step.up_revision_id, message, now - last))
+        last = now
+
+    original = EnvironmentContext.configure
+
+    def configure(self, *args, **kwargs):
+        nonlocal last
+        callbacks = kwargs.pop("on_version_apply", None) or []
+        if callable(callbacks):
+            callbacks = [callbacks]
+        kwargs["on_version_apply"] = [*callbacks, on_version_apply]
+        last = time.perf_counter()
+        return original(self, *args, **kwargs)
+
+    EnvironmentContext.configure = configure
+    try:
+        yield timings
+    finally:
+        EnvironmentContext.configure = original
+
+
+def print_step_timings(timings: list[StepTiming], total: float) -> None:
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+
+    table = Table(title="Migration steps", show_header=True, header_style="bold magenta")
+    table.add_column("Revision", style="cyan")
+    table.add_column("Message")
+    table.add_column("Time", justify="right")
+
+    slowest = max((t.seconds for t in timings), default=0)
+    for timing in timings:
+        seconds = f"{timing.seconds:.3f}s"
+        if timing.seconds == slowest and len(timings) > 1:
+            seconds = f"[bold yellow]{seconds}[/bold yellow]"
+        table.add_row(escape(timing.revision), escape(timing.message), seconds)
+
+    console = Console()
+    console.print(table)
+    console.print(f"[dim]{len(timings)} steps in {total:.3f}s.[/dim]")
+
+
+def read_database(
+    cfg, script, compare: bool = False
+) -> tuple[tuple[str, ...], object, list | None]:
+    """The database's current revisions, the env.py ``target_metadata`` and,
+    with ``compare``, how the database schema differs from that metadata.
+
+    Connects through the project's env.py, like ``alembic current``; the
+    comparison honours the filters env.py passes to ``context.configure``.
+    """
+    from alembic.autogenerate import compare_metadata
+    from alembic.runtime.environment import EnvironmentContext
+
+    found = {}
+
+    def read(rev, context):
+        found["current"] = tuple(head.revision for head in script.get_all_current(rev))
+        found["metadata"] = metadata = context.opts.get("target_metadata")
+        if compare and metadata is not None:
+            found["diff"] = compare_metadata(context, metadata)
+        return []
+
+    with EnvironmentContext(cfg, script, fn=read, dont_mutate=True):
+        script.run_env()
+    return found.get("current", ()), found.get("metadata"), found.get("diff")
+
+
+def describe_schema_diff(diff) -> str:
+    """One line for an entry of ``compare_metadata``'s result."""
+    if isinstance(diff, list):
+        # Column modifications come grouped per column.
+        diff = diff[0]
+    operation, *args = diff
+    names = [
+        arg if isinstance(arg, str) else arg.name
+        for arg in args
+        if isinstance(arg, str) or isinstance(getattr(arg, "name", None), str)
+    ]
+    return " ".join([operation, *names])
+
+
+def pending_revisions(cfg, all_revisions: bool = False) -> list:
+    """Revisions between the database's current ones and the heads, oldest first.
+
+    With ``all_revisions`` every revision is returned without connecting.
+    """
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(cfg)
+    current = () if all_revisions else read_database(cfg, script)[0]
+    revisions = list(script.iterate_revisions("heads", current or "base"))
+    revisions.reverse()
+    return revisions
+
+
+def squashable_revisions(script, revision: str) -> list:
+    """The linear chain from the first revision to ``revision``, oldest first.
+
+    Raises ``ValueError`` for branched histories, which a single baseline
+    can't replace.
+    """
+    heads = script.get_heads()
+    if len(heads) != 1:
+        raise ValueError(f"History has {len(heads)} heads; merge them before squashing")
+    target = script.get_revision(revision)
+    if target.revision != heads[0]:
+        raise ValueError(
+            f"Only the head revision ({heads[0]}) can be squashed: the baseline is "
+            "generated from the current models, which describe the schema at head"
+        )
+
+    chain = list(script.iterate_revisions(target.revision, "base"))
+    for rev in chain:
+        if rev.is_merge_point or rev.is_branch_point:
+            raise ValueError(f"Revision {rev.revision} merges or branches history")
+    chain.reverse()
+    return chain
+
+
+# Operations that change data rather than schema; a baseline generated from
+# the models can't reproduce them.
+DATA_OPERATIONS = {"execute", "bulk_insert"}
+
+
+def data_operations(revisions) -> list[tuple[str, int, str]]:
+    """``op.execute``/``op.bulk_insert`` calls in the revisions' ``upgrade()``,
+    as (path, line, operation)."""
+    found = []
+    for rev in revisions:
+        with open(rev.path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if not (isinstance(node, ast.FunctionDef) and node.name == "upgrade"):
+                continue
+            for call in ast.walk(node):
+                if (
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Attribute)
+                    and call.func.attr in DATA_OPERATIONS
+                ):
+                    found.append((rev.path, call.lineno, call.func.attr))
+    return found
+
+
+def render_baseline_revision(
+    revision: str, message: str, squashed: int, metadata
+) -> str:
+    """Source of a revision creating every table of ``metadata`` at once."""
+    from datetime import datetime
+
+    from alembic.autogenerate import render_python_code
+    from alembic.operations import ops
+
+    from volt.core.render import load_template_file
+    from volt.core.template import TEMPLATES_ROOT
+
+    upgrades = []
+    for table in metadata.sorted_tables:
+        upgrades.append(ops.CreateTableOp.from_table(table))
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            upgrades.append(ops.CreateIndexOp.from_index(index))
+    downgrades = [
+        ops.DropTableOp.from_table(table) for table in reversed(metadata.sorted_tables)
+    ]
+
+    def render(operations) -> str:
+        # render_python_code indents every line for a function body.
+        return render_python_code(operations).lstrip()
+
+    template = load_template_file(TEMPLATES_ROOT.joinpath(*BASELINE_TEMPLATE))
+    return template.render(
+        {
+            "MESSAGE": message,
+            "REVISION": revision,
+            "CREATE_DATE": str(datetime.now()),
+            "SQUASHED_COUNT": str(squashed),
+            "UPGRADES": render(ops.UpgradeOps(ops=upgrades)),
+            "DOWNGRADES": render(ops.DowngradeOps(ops=downgrades)),
+        }
+    ).content
+
+
+# backfill_batch() when no assignments are given: the user writes the update.
+BACKFILL_TODO = """    # Example:
+    # connection.execute(
+    #     sa.text(f"UPDATE {TABLE_NAME} SET new_column = old_column WHERE {KEY_COLUMN} IN :keys")
+    #     .bindparams(sa.bindparam("keys", expanding=True)),
+    #     {"keys": keys},
+    # )
+    raise NotImplementedError("Implement backfill_batch() in " + __file__)"""
+
+BACKFILL_UPDATE = """    statement = sa.text(
+        {sql}
+    ).bindparams(sa.bindparam("keys", expanding=True))
+    connection.execute(statement, {{"keys": keys}})"""
+
+ASSIGNMENT = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*=(.*)", re.DOTALL)
+
+
+def parse_assignments(values: list[str]) -> list[tuple[str, str]]:
+    """``column=SQL expression`` strings as (column, expression) pairs.
+
+    Raises ``ValueError`` for anything else.
+    """
+    assignments = []
+    for value in values:
+        match = ASSIGNMENT.fullmatch(value)
+        if match is None or not match.group(2).strip():
+            raise ValueError(f"Expected 'column=expression', got {value!r}")
+        assignments.append((match.group(1), match.group(2).strip()))
+    return assignments
+
+
+def backfill_update_sql(
+    table_name: str, key_column: str, assignments: list[tuple[str, str]]
+) -> str:
+    """The UPDATE a backfill runs per batch, with an expanding ``:keys`` list."""
+    set_clause = ", ".join(f"{column} = {expression}" for column, expression in assignments)
+    return f"UPDATE {table_name} SET {set_clause} WHERE {key_column} IN :keys"
+
+
+def render_backfill_revision(
+    script,
+    table_name: str,
+    key_column: str = "id",
+    batch_size: int = 1000,
+    assignments: list[tuple[str, str]] | None = None,
+) -> str:
+    """Source of a batched data migration with the identifiers of ``script``.
+
+    ``script`` is the empty revision Alembic just created for it. With
+    ``assignments``, backfill_batch() runs the UPDATE they describe;
+    otherwise it is left for the user to implement.
+    """
+    from datetime import datetime
+
+    from volt.core.render import load_template_file
+    from volt.core.template import TEMPLATES_ROOT
+
+    body = BACKFILL_TODO
+    if assignments:
+        sql = backfill_update_sql(table_name, key_column, assignments)
+        body = BACKFILL_UPDATE.format(sql=repr(sql))
+    template = load_template_file(TEMPLATES_ROOT.joinpath(*BACKFILL_TEMPLATE))
+    return template.render(
+        {
+            "MESSAGE": script.doc or "",
+            "REVISION": script.revision,
+            "DOWN_REVISION": script.down_revision or "",
+            "DOWN_REVISION_REPR": repr(script.down_revision),
+            "CREATE_DATE": str(datetime.now()),
+            "TABLE_NAME": table_name,
+            "KEY_COLUMN": key_column,
+            "BATCH_SIZE": str(batch_size),
+            "BACKFILL_BODY": body,
+        }
+    ).content
+
+
+@dataclass
+class LintFinding:
+    path: str
+    line: int
+    operation: str
+    severity: str
+    risk: str
+    suggestion: str
+
+
+def _keyword(call: ast.Call, name: str):
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+
+def _is_true(node) -> bool:
+    return isinstance(node, ast.Constant) and node.value is True
+
+
+def _is_false(node) -> bool:
+    return isinstance(node, ast.Constant) and node.value is False
+
+
+def _column_calls(call: ast.Call):
+    """``Column(...)`` calls among the arguments of an operation."""
+    for arg in call.args:
+        if isinstance(arg, ast.Call) and (
+            (isinstance(arg.func, ast.Attribute) and arg.func.attr == "Column")
+            or (isinstance(arg.func, ast.Name) and arg.func.id == "Column")
+        ):
+            yield arg
+
+
+def _sql_text(call: ast.Call) -> str | None:
+    """The SQL string passed to ``op.execute``, also through ``sa.text()``."""
+    if not call.args:
+        return None
+    arg = call.args[0]
+    if isinstance(arg, ast.Call) and arg.args:
+        arg = arg.args[0]
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return arg.value
+    return None
+
+
+def _check_operation(call: ast.Call, name: str, in_autocommit: bool):
+    """Findings for one migration operation, as (severity, risk, suggestion)."""
+    if name in {"create_index", "drop_index"}:
+        concurrently = _is_true(_keyword(call, "postgresql_concurrently"))
+        if not concurrently:
+            yield (
+                WARNING,
+                f"{'CREATE' if name == 'create_index' else 'DROP'} INDEX blocks writes to the table until it finishes",
+                "pass postgresql_concurrently=True inside 'with op.get_context().autocommit_block():'",
+            )
+        elif not in_autocommit:
+            yield (
+                ERROR,
+                "CONCURRENTLY cannot run inside the migration's transaction",
+                "move the operation into 'with op.get_context().autocommit_block():'",
+            )
+
+    elif name == "alter_column":
+        if _keyword(call, "type_") is not None:
+            yield (
+                ERROR,
+                "changing a column type rewrites the table under an exclusive lock",
+                "add a new column, backfill it in batches, then switch reads and drop the old one",
+            )
+        if _is_false(_keyword(call, "nullable")):
+            yield (
+                WARNING,
+                "SET NOT NULL scans the whole table under an exclusive lock",
+                "add a CHECK (col IS NOT NULL) NOT VALID constraint, VALIDATE it in a later revision, then SET NOT NULL",
+            )
+
+    elif name == "add_column":
+        for column in _column_calls(call):
+            not_null = _is_false(_keyword(column, "nullable")) or _is_true(
+                _keyword(column, "primary_key")
+            )
+            if not_null and _keyword(column, "server_default") is None:
+                yield (
+                    ERROR,
+                    "a NOT NULL column without a server default fails on non-empty tables",
+                    "add it nullable (or with a constant server_default), backfill in batches, then make it NOT NULL",
+                )
+
+    elif name == "create_foreign_key":
+        yield (
+            WARNING,
+            "adding a foreign key validates every row while locking both tables",
+            "add it with NOT VALID through op.execute(), then VALIDATE CONSTRAINT in a later revision",
+        )
+
+    elif name == "create_unique_constraint":
+        yield (
+            WARNING,
+            "a unique constraint builds its index while blocking writes",
+            "CREATE UNIQUE INDEX CONCURRENTLY first, then ADD CONSTRAINT ... USING INDEX",
+        )
+
+    elif name == "execute":
+        sql = " ".join((_sql_text(call) or "").upper().split())
+        if sql.startswith(("UPDATE", "DELETE")):
+            yield (
+                WARNING,
+                "a data change in one statement holds its row locks in one long transaction",
+                "move it to a data migration that processes rows in batches",
+            )
+        if ("CREATE INDEX" in sql or "CREATE UNIQUE INDEX" in sql) and (
+            "CONCURRENTLY" not in sql
+        ):
+            yield (
+                WARNING,
+                "CREATE INDEX blocks writes to the table until it finishes",
+                "use CREATE INDEX CONCURRENTLY inside 'with op.get_context().autocommit_block():'",
+            )
+
+
+# Linted operations, with the position of their table argument.
+LINTED_OPERATIONS = {
+    "create_index": 1,
+    "drop_index": None,
+    "alter_column": 0,
+    "add_column": 0,
+    "create_foreign_key": 1,
+    "create_unique_constraint": 1,
+    "execute": None,
+}
+
+
+def _string_arg(call: ast.Call, position: int | None, keyword: str) -> str | None:
+    node = _keyword(call, keyword)
+    if node is None and position is not None and len(call.args) > position:
+        node = call.args[position]
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _with_call(item: ast.withitem, name: str) -> ast.Call | None:
+    expr = item.context_expr
+    if (
+        isinstance(expr, ast.Call)
+        and isinstance(expr.func, ast.Attribute)
+        and expr.func.attr == name
+    ):
+        return expr
+    return None
+
+
+def _unimplemented(tree: ast.Module):
+    """``raise NotImplementedError`` statements in the module's functions,
+    as (function, statement); downgrade() may legitimately refuse."""
+    for function in tree.body:
+        if not isinstance(function, ast.FunctionDef) or function.name == "downgrade":
+            continue
+        for node in ast.walk(function):
+            if not isinstance(node, ast.Raise) or node.exc is None:
+                continue
+            exc = node.exc.func if isinstance(node.exc, ast.Call) else node.exc
+            if isinstance(exc, ast.Name) and exc.id == "NotImplementedError":
+                yield function, node
+
+
+def lint_migration(source: str, path: str = "") -> list[LintFinding]:
+    """Operations in a revision's ``upgrade()`` that lock or rewrite tables.
+
+    The checks target PostgreSQL, where large tables make them matter most;
+    ``op.*`` and ``batch_op.*`` calls are both recognized. Tables created in
+    the same revision are empty, so operations on them are not reported.
+    Functions left unimplemented, like a generated backfill_batch(), are
+    errors.
+    """
+    tree = ast.parse(source)
+    findings = [
+        LintFinding(
+            path,
+            node.lineno,
+            f"{function.name}()",
+            ERROR,
+            "the upgrade fails here: the function still raises NotImplementedError",
+            "implement it (for a backfill, or regenerate it with --set 'column=expression')",
+        )
+        for function, node in _unimplemented(tree)
+    ]
+    upgrade = next(
+        (
+            node
+            for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name == "upgrade"
+        ),
+        None,
+    )
+    if upgrade is None:
+        return findings
+
+    created = {
+        _string_arg(node, 0, "table_name")
+        for node in ast.walk(upgrade)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "create_table"
+    }
+
+    def visit(node: ast.AST, in_autocommit: bool, batches: dict[str, str | None]):
+        if isinstance(node, ast.With):
+            for item in node.items:
+                in_autocommit = in_autocommit or _with_call(item, "autocommit_block") is not None
+                batch = _with_call(item, "batch_alter_table")
+                if batch is not None and isinstance(item.optional_vars, ast.Name):
+                    batches = {
+                        **batches,
+                        item.optional_vars.id: _string_arg(batch, 0, "table_name"),
+                    }
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in LINTED_OPERATIONS
+        ):
+            name = node.func.attr
+            position = LINTED_OPERATIONS[name]
+            receiver = node.func.value
+            if isinstance(receiver, ast.Name) and receiver.id in batches:
+                # batch_op calls leave out the table argument.
+                table = batches[receiver.id]
+            else:
+                table = _string_arg(node, position, "table_name")
+            if table is None or table not in created:
+                for severity, risk, suggestion in _check_operation(
+                    node, name, in_autocommit
+                ):
+                    findings.append(
+                        LintFinding(path, node.lineno, name, severity, risk, suggestion)
+                    )
+        for child in ast.iter_child_nodes(node):
+            visit(child, in_autocommit, batches)
+
+    for statement in upgrade.body:
+        visit(statement, False, {})
+    return findings
+
+
+def print_lint_findings(findings: list[LintFinding], checked: int) -> None:
+    from rich import print
+    from rich.markup import escape
+
+    if not findings:
+        print(f"[green]✔ No blocking operations found in {checked} revisions.[/green]")
+        return
+
+    styles = {ERROR: "red", WARNING: "yellow"}
+    lines = []
+    for finding in findings:
+        style = styles[finding.severity]
+        lines += [
+            f"[cyan]{escape(finding.path)}:{finding.line}[/cyan] "
+            f"[{style}]{finding.severity}[/{style}] {escape(finding.operation)}",
+            f"  {escape(finding.risk)}",
+            f"  [green]→ {escape(finding.suggestion)}[/green]",
+        ]
+    errors = sum(finding.severity == ERROR for finding in findings)
+    lines.append(
+        f"[dim]{errors} errors and {len(findings) - errors} warnings in {checked} revisions.[/dim]"
+    )
+    print("\n".join(lines))
@@ -0,0 +1,122 @@
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+
+IMPORT_PROFILE_FLAG = "--import-profile"
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    cumulative: float = 0.0
+    children: float = 0.0
+    depth: int = 0
+
+    @property
+    def self_time(self) -> float:
+        return self.cumulative - self.children
+
+
+@dataclass
+class _ImportProfile:
+    records: list[ImportRecord] = field(default_factory=list)
+    stack: list[ImportRecord] = field(default_factory=list)
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` and delegates everything else."""
+
+    def __init__(self, loader, name: str, profile: _ImportProfile):
+        self._loader = loader
+        self._name = name
+        self._profile = profile
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        profile = self._profile
+        record = ImportRecord(self._name, depth=len(profile.stack))
+        profile.stack.append(record)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            record.cumulative = time.perf_counter() - start
+            profile.stack.pop()
+            if profile.stack:
+                profile.stack[-1].children += record.cumulative
+            profile.records.append(record)
+
+
+class _TimingFinder(MetaPathFinder):
+    def __init__(self, profile: _ImportProfile):
+        self._profile = profile
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, fullname, self._profile)
+            return spec
+        return None
+
+
+@contextmanager
+def profile_imports(limit: int = 30):
+    """Record the import time of every module loaded inside the block.
+
+    The report is printed to stderr once the block exits, even when it exits
+    through ``SystemExit`` as typer apps do.
+    """
+    profile = _ImportProfile()
+    preloaded = len(sys.modules)
+    finder = _TimingFinder(profile)
+    sys.meta_path.insert(0, finder)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.meta_path.remove(finder)
+        print_import_report(profile.records, elapsed, preloaded, limit)
+
+
+def print_import_report(
+    records: list[ImportRecord], elapsed: float, preloaded: int, limit: int = 30
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    total_imports = sum(r.cumulative for r in records if r.depth == 0)
+    table = Table(
+        title=f"Import profile (top {min(limit, len(records))} of {len(records)})",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right", style="green")
+    table.add_column("Cumulative (ms)", justify="right", style="yellow")
+
+    for record in sorted(records, key=lambda r: r.cumulative, reverse=True)[:limit]:
+        table.add_row(
+            record.name,
+            f"{record.self_time * 1000:.2f}",
+            f"{record.cumulative * 1000:.2f}",
+        )
+
+    console = Console(stderr=True)
+    console.print(table)
+    console.print(
+        f"[dim]{len(records)} modules imported in {total_imports * 1000:.1f} ms "
+        f"({elapsed * 1000:.1f} ms total, {preloaded} modules loaded at startup)[/dim]"
+    )
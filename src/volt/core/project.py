@@ -0,0 +1,148 @@
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+from volt.core.config import VoltConfig, load_config, save_config
+
+CONFIG_FILE = "volt.toml"
+
+
+class Project:
+    """A Volt project, resolved once per command.
+
+    Holds the project root, its volt.toml and, on first use, the symbol
+    index and the dependencies declared in pyproject.toml.
+    """
+
+    def __init__(self, root: Path, config: VoltConfig | None = None):
+        self.root = root
+        self.config = config
+
+    @property
+    def stack(self) -> str:
+        if self.config is not None:
+            return self.config.stack
+        # Projects created before volt.toml existed.
+        if (self.root / "app" / "main.py").exists():
+            return "fastapi"
+        return "unknown"
+
+    @property
+    def features(self) -> dict:
+        return self.config.features if self.config is not None else {}
+
+    @cached_property
+    def index(self):
+        from volt.core.index import SymbolIndex
+
+        sources = ()
+        if self.stack == "fastapi":
+            from volt.stacks.fastapi.index import FASTAPI_INDEX_SOURCES
+
+            sources = FASTAPI_INDEX_SOURCES
+        return SymbolIndex.load(self.root, sources)
+
+    @cached_property
+    def pyproject(self) -> dict:
+        import tomli
+
+        try:
+            with open(self.root / "pyproject.toml", "rb") as f:
+                return tomli.load(f)
+        except (OSError, tomli.TOMLDecodeError):
+            return {}
+
+    @cached_property
+    def requirements(self) -> dict[str, set[str]]:
+        """Packages pyproject.toml depends on, with their requested extras."""
+        return _parse_requirements(
+            self.pyproject.get("project", {}).get("dependencies", [])
+        )
+
+    @cached_property
+    def dev_requirements(self) -> dict[str, set[str]]:
+        """Packages of the ``dev`` dependency group, as in :attr:`requirements`."""
+        declared = self.pyproject.get("dependency-groups", {}).get("dev", [])
+        # uv's legacy spelling of the same group.
+        legacy = self.pyproject.get("tool", {}).get("uv", {}).get("dev-dependencies", [])
+        return _parse_requirements(
+            [r for r in [*declared, *legacy] if isinstance(r, str)]
+        )
+
+    @property
+    def dependencies(self) -> set[str]:
+        """Normalized names of the packages pyproject.toml depends on."""
+        return set(self.requirements)
+
+    def save_config(self) -> None:
+        save_config(self.config, self.root / CONFIG_FILE)
+
+
+def _parse_requirements(declared: list[str]) -> dict[str, set[str]]:
+    from volt.core.dependencies import parse_requirement
+
+    requirements: dict[str, set[str]] = {}
+    for requirement in declared:
+        parsed = parse_requirement(requirement)
+        if parsed is not None:
+            name, extras = parsed
+            requirements.setdefault(name, set()).update(extras)
+    return requirements
+
+
+def find_project_root(start: Path) -> Path | None:
+    """The nearest directory at or above ``start`` holding a Volt project."""
+    start = start.resolve()
+    candidates = [start, *start.parents]
+    for directory in candidates:
+        if (directory / CONFIG_FILE).is_file():
+            return directory
+    for directory in candidates:
+        if (directory / "app" / "main.py").is_file() and (
+            directory / "pyproject.toml"
+        ).is_file():
+            return directory
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_project(start: Path) -> Project | None:
+    root = find_project_root(start)
+    if root is None:
+        return None
+    config_path = root / CONFIG_FILE
+    config = load_config(config_path) if config_path.exists() else None
+    return Project(root, config)
+
+
+def load_project(start: Path | None = None) -> Project | None:
+    """The project containing ``start`` (the working directory by default).
+
+    Resolved once per process and directory. Raises ``ValueError`` when the
+    project's volt.toml is invalid.
+    """
+    return _load_project((start or Path.cwd()).resolve())
+
+
+def require_project(
+    start: Path | None = None, stack: str | None = None, config_required: bool = True
+) -> Project:
+    """Like :func:`load_project`, but exits with an error outside a project."""
+    from rich import print
+    from typer import Exit
+
+    try:
+        project = load_project(start)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/red]")
+        raise Exit(1)
+
+    if project is None or (config_required and project.config is None):
+        print("[red]Error: Not a Volt project (volt.toml not found).[/red]")
+        raise Exit(1)
+
+    if stack is not None and project.stack != stack:
+        print(
+            f"[red]Error: This command is only for the {stack} stack (current: {project.stack}).[/red]"
+        )
+        raise Exit(1)
+    return project
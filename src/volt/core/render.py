@@ -0,0 +1,392 @@
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+from volt.core.tracing import traced
+
+PLACEHOLDER_PATTERN = re.compile(r"__([A-Z0-9]+(?:_[A-Z0-9]+)*)__")
+RENDERED_SUFFIXES = (".py", ".toml", ".env", ".md", ".json", ".ts", ".tsx")
+IGNORED_NAMES = {"__pycache__", ".DS_Store"}
+
+
+@dataclass
+class TemplateFile:
+    """File content plus the precomputed ``__PLACEHOLDER__`` spans it contains."""
+
+    content: str | bytes
+    placeholders: tuple[tuple[int, int, str], ...] = ()
+
+    @classmethod
+    def from_content(cls, name: str, content: str | bytes) -> "TemplateFile":
+        if isinstance(content, bytes) or not name.endswith(RENDERED_SUFFIXES):
+            return cls(content)
+        return cls.scan(content)
+
+    @classmethod
+    def scan(cls, content: str) -> "TemplateFile":
+        spans = tuple(
+            (m.start(), m.end(), m.group(1))
+            for m in PLACEHOLDER_PATTERN.finditer(content)
+        )
+        return cls(content, spans)
+
+    def render(self, variables: dict[str, str]) -> "TemplateFile":
+        if not self.placeholders or not any(
+            key in variables for _, _, key in self.placeholders
+        ):
+            return self
+
+        parts = []
+        cursor = 0
+        for start, end, key in self.placeholders:
+            if key not in variables:
+                continue
+            parts.append(self.content[cursor:start])
+            parts.append(str(variables[key]))
+            cursor = end
+        parts.append(self.content[cursor:])
+        return TemplateFile.scan("".join(parts))
+
+
+def _read_content(path: Path) -> str | bytes:
+    data = path.read_bytes()
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data
+
+
+def _template_archive():
+    from volt.core.archive import get_template_archive
+
+    return get_template_archive()
+
+
+def template_exists(path: Path) -> bool:
+    """Whether a template file or directory exists, packed or loose."""
+    archive = _template_archive()
+    if archive is not None:
+        key = archive.key_for(path)
+        if key is not None:
+            return archive.exists(key)
+    return path.exists()
+
+
+@lru_cache(maxsize=None)
+def load_template_dir(root: Path) -> dict[str, TemplateFile]:
+    """Read every file below ``root`` once and cache it for the process.
+
+    Templates come from the packed archive when one is shipped, otherwise
+    from the loose directory on disk.
+    """
+    archive = _template_archive()
+    if archive is not None:
+        key = archive.key_for(root)
+        if key is not None:
+            return archive.read_dir(key)
+
+    if not root.is_dir():
+        raise FileNotFoundError(f"Template directory not found: {root}")
+
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_NAMES)
+        for filename in sorted(filenames):
+            if filename in IGNORED_NAMES or filename.endswith((".pyc", ".pyo")):
+                continue
+            path = Path(dirpath) / filename
+            key = path.relative_to(root).as_posix()
+            files[key] = TemplateFile.from_content(filename, _read_content(path))
+    return files
+
+
+@lru_cache(maxsize=None)
+def load_template_file(path: Path) -> TemplateFile:
+    archive = _template_archive()
+    if archive is not None:
+        key = archive.key_for(path)
+        if key is not None:
+            return archive.read(key)
+    return TemplateFile.from_content(path.name, _read_content(path))
+
+
+class VirtualPath(PurePosixPath):
+    """A path inside a :class:`RenderTree`.
+
+    It implements the subset of the ``pathlib.Path`` API used by the stack
+    helpers and injectors, so they can edit the in-memory project exactly as
+    they would edit files on disk.
+    """
+
+    def __init__(self, *segments, tree: "RenderTree"):
+        super().__init__(*segments)
+        self.tree = tree
+
+    def with_segments(self, *segments):
+        return type(self)(*segments, tree=self.tree)
+
+    def exists(self) -> bool:
+        return self.tree.exists(self)
+
+    def is_file(self) -> bool:
+        return self.tree.is_file(self)
+
+    def is_dir(self) -> bool:
+        return self.tree.is_dir(self)
+
+    def read_text(self, encoding: str | None = None) -> str:
+        return self.tree.read_text(self)
+
+    def write_text(self, data: str, encoding: str | None = None) -> int:
+        self.tree.write_text(self, data)
+        return len(data)
+
+    def touch(self, exist_ok: bool = True) -> None:
+        if not self.exists():
+            self.write_text("")
+
+    def mkdir(self, parents: bool = False, exist_ok: bool = False) -> None:
+        self.tree.mkdir(self)
+
+    def unlink(self, missing_ok: bool = False) -> None:
+        self.tree.remove(self, missing_ok=missing_ok)
+
+    def resolve(self) -> "VirtualPath":
+        return self
+
+
+class RenderTree:
+    """An in-memory project that is assembled from template overlays and edits
+    and then written to disk in a single pass.
+
+    When ``base`` is given, files that are not overlaid are read lazily from
+    that directory, so the tree can also stage edits to an existing project.
+    Only files that were added or changed are written back. With
+    ``keep_existing``, overlays never replace a file that exists in ``base``;
+    such files are listed in ``kept`` instead.
+    """
+
+    def __init__(self, base: Path | None = None, keep_existing: bool = False):
+        self.base = base
+        self.keep_existing = keep_existing
+        self.kept: set[str] = set()
+        self.files: dict[str, TemplateFile] = {}
+        self.dirs: set[str] = set()
+        self.dirty: set[str] = set()
+        self.removed: set[str] = set()
+        self.origins: dict[str, Path] = {}
+        self._file_dirs: set[str] | None = None
+
+    @property
+    def root(self) -> VirtualPath:
+        return VirtualPath(tree=self)
+
+    @staticmethod
+    def _key(path: PurePosixPath | str) -> str:
+        if isinstance(path, PurePosixPath):
+            # Reuses the path's cached string instead of re-parsing it.
+            return path.as_posix()
+        return PurePosixPath(path).as_posix()
+
+    def _load(self, key: str) -> TemplateFile | None:
+        if key in self.files:
+            return self.files[key]
+        if key in self.removed or self.base is None:
+            return None
+        disk_path = self.base / key
+        if not disk_path.is_file():
+            return None
+        loaded = TemplateFile.from_content(disk_path.name, _read_content(disk_path))
+        self.files[key] = loaded
+        self._add_parents(key)
+        return loaded
+
+    def is_file(self, path) -> bool:
+        return self._load(self._key(path)) is not None
+
+    def is_dir(self, path) -> bool:
+        key = self._key(path)
+        if key == "." or key in self.dirs:
+            return True
+        if key in self._dirs_with_files():
+            return True
+        return self.base is not None and (self.base / key).is_dir()
+
+    def _dirs_with_files(self) -> set[str]:
+        if self._file_dirs is None:
+            self._file_dirs = set()
+            for key in self.files:
+                self._add_parents(key)
+        return self._file_dirs
+
+    def _add_parents(self, key: str) -> None:
+        if self._file_dirs is None:
+            return
+        parent = key.rpartition("/")[0]
+        while parent and parent not in self._file_dirs:
+            self._file_dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+
+    def exists(self, path) -> bool:
+        return self.is_file(path) or self.is_dir(path)
+
+    def _keeps(self, key: str) -> bool:
+        if self.keep_existing and self.base is not None and (self.base / key).is_file():
+            self.kept.add(key)
+            return True
+        return False
+
+    def read_text(self, path) -> str:
+        file = self._load(self._key(path))
+        if file is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        if isinstance(file.content, bytes):
+            return file.content.decode("utf-8")
+        return file.content
+
+    def write_text(self, path, text: str) -> None:
+        key = self._key(path)
+        current = self._load(key)
+        if current is not None and current.content == text:
+            return
+        self.files[key] = TemplateFile.from_content(key, text)
+        self._add_parents(key)
+        self.dirty.add(key)
+        self.removed.discard(key)
+
+    def mkdir(self, path) -> None:
+        self.dirs.add(self._key(path))
+
+    def remove(self, path, missing_ok: bool = False) -> None:
+        key = self._key(path)
+        if self._load(key) is None:
+            if missing_ok:
+                return
+            raise FileNotFoundError(f"File not found: {path}")
+        self.files.pop(key)
+        self._file_dirs = None
+        self.dirty.discard(key)
+        self.origins.pop(key, None)
+        self.removed.add(key)
+
+    def overlay(self, template_root: Path, dest: PurePosixPath | str = ".") -> None:
+        """Merge a template directory into the tree, later overlays winning."""
+        prefix = self._key(dest)
+        for rel, file in load_template_dir(template_root).items():
+            key = rel if prefix == "." else f"{prefix}/{rel}"
+            if self._keeps(key):
+                continue
+            self.files[key] = file
+            self._add_parents(key)
+            self.origins[key] = template_root / rel
+            self.dirty.add(key)
+            self.removed.discard(key)
+
+    def copy(self, src: Path, dest: PurePosixPath | str) -> None:
+        """Add a single (cached) template file to the tree."""
+        key = self._key(dest)
+        if self._keeps(key):
+            return
+        self.files[key] = load_template_file(src)
+        self._add_parents(key)
+        self.origins[key] = src
+        self.dirty.add(key)
+        self.removed.discard(key)
+
+    def render(self, variables: dict[str, str], paths=None) -> None:
+        """Substitute ``__KEY__`` placeholders using the precomputed spans."""
+        keys = self.dirty if paths is None else [self._key(p) for p in paths]
+        for key in list(keys):
+            file = self._load(key)
+            if file is None:
+                raise FileNotFoundError(f"File not found: {key}")
+            rendered = file.render(variables)
+            if rendered is not file:
+                self.files[key] = rendered
+                self.dirty.add(key)
+
+    @traced(category="io")
+    def write(self, dest: Path) -> list[Path]:
+        """Write every pending file to ``dest`` exactly once.
+
+        A new project is staged in a sibling directory and moved into place
+        with a single rename. In an existing project, changed files get one
+        atomic replace each and new files are created directly.
+        """
+        if dest.exists():
+            created: set[Path] = set()
+            written = [self._write_file(dest, key, created) for key in sorted(self.dirty)]
+            for key in self.removed:
+                (dest / key).unlink(missing_ok=True)
+            for key in self.dirs:
+                (dest / key).mkdir(parents=True, exist_ok=True)
+            self._reset()
+            return written
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{dest.name}.", dir=dest.parent))
+        try:
+            for key in sorted(self.dirs):
+                (staging / key).mkdir(parents=True, exist_ok=True)
+            for key in sorted(self.dirty):
+                target = staging / key
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._dump(target, self.files[key].content)
+            staging.chmod(0o777 & ~_umask())
+            os.rename(staging, dest)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        written = [dest / key for key in sorted(self.dirty)]
+        self._reset()
+        return written
+
+    def _write_file(self, dest: Path, key: str, created: set[Path]) -> Path:
+        target = dest / key
+        if target.parent not in created:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            created.add(target.parent)
+
+        content = self.files[key].content
+        try:
+            # Nothing to protect on disk yet, so skip the temp file and rename.
+            with open(target, "xb" if isinstance(content, bytes) else "x") as f:
+                f.write(content)
+            return target
+        except FileExistsError:
+            pass
+
+        fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+        os.close(fd)
+        tmp_path = Path(tmp)
+        try:
+            self._dump(tmp_path, content)
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return target
+
+    @staticmethod
+    def _dump(path: Path, content: str | bytes) -> None:
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+    def _reset(self) -> None:
+        self.dirty.clear()
+        self.removed.clear()
+        self.dirs.clear()
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
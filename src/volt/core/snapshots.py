@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+import tomli
+
+from volt.core.config import volt_cache_dir
+from volt.core.dependencies import run_uv
+
+SNAPSHOT_PROJECT_NAME = "volt-snapshot"
+SNAPSHOT_FILES = ("dependencies.json", "uv.lock")
+
+
+def lock_snapshots_dir() -> Path:
+    return volt_cache_dir() / "locks"
+
+
+def lock_snapshot_key(
+    packages: list[str], python_version: str, dev_packages: list[str] = ()
+) -> str:
+    key = {"packages": sorted(set(packages)), "python": python_version}
+    if dev_packages:
+        key["dev"] = sorted(set(dev_packages))
+    payload = json.dumps(key, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def read_python_version(dest: Path) -> str:
+    version_file = dest / ".python-version"
+    return version_file.read_text().strip() if version_file.exists() else ""
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _project_name(dest: Path) -> str:
+    with open(dest / "pyproject.toml", "rb") as f:
+        return tomli.load(f)["project"]["name"]
+
+
+def _rename_project(text: str, old: str, new: str) -> str:
+    return re.sub(
+        rf'^name = "{re.escape(_normalize_name(old))}"$',
+        lambda _: f'name = "{_normalize_name(new)}"',
+        text,
+        flags=re.MULTILINE,
+    )
+
+
+def _project_dependencies(dest: Path) -> list[str]:
+    with open(dest / "pyproject.toml", "rb") as f:
+        return tomli.load(f)["project"].get("dependencies", [])
+
+
+def _set_project_dependencies(dest: Path, dependencies: list[str]) -> None:
+    pyproject = dest / "pyproject.toml"
+    lines = "".join(f"    {json.dumps(dep)},\n" for dep in dependencies)
+    block = f"dependencies = [\n{lines}]" if dependencies else "dependencies = []"
+    text, count = re.subn(
+        r"^dependencies = \[.*?\]",
+        lambda _: block,
+        pyproject.read_text(),
+        count=1,
+        flags=re.MULTILINE | re.DOTALL,
+    )
+    if not count:
+        raise ValueError(f"No dependencies array found in {pyproject}")
+    pyproject.write_text(text)
+
+
+def save_lock_snapshot(dest: Path, key: str) -> Path | None:
+    """Store the project's resolved dependencies and uv.lock under ``key``."""
+    if not (dest / "uv.lock").exists():
+        return None
+
+    name = _project_name(dest)
+    target = lock_snapshots_dir() / key
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=target.parent))
+    try:
+        (staging / "dependencies.json").write_text(
+            json.dumps(_project_dependencies(dest), indent=2)
+        )
+        (staging / "uv.lock").write_text(
+            _rename_project((dest / "uv.lock").read_text(), name, SNAPSHOT_PROJECT_NAME)
+        )
+        shutil.rmtree(target, ignore_errors=True)
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # Another volt process (e.g. a batch create) stored the same
+            # snapshot in the meantime; theirs is as good as ours.
+            if not target.exists():
+                raise
+            shutil.rmtree(staging, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+
+def restore_lock_snapshot(dest: Path, key: str) -> bool:
+    """Install a freshly initialised project from a stored snapshot.
+
+    The snapshot's dependency list is written into ``dest``'s pyproject.toml
+    next to the stored uv.lock, then installed with ``uv sync --frozen``.
+    Returns False when there is no usable snapshot, leaving ``dest`` as it was
+    so the caller can fall back to a regular resolution.
+    """
+    source = lock_snapshots_dir() / key
+    if not all((source / name).exists() for name in SNAPSHOT_FILES):
+        return False
+
+    name = _project_name(dest)
+    original_pyproject = (dest / "pyproject.toml").read_text()
+    try:
+        _set_project_dependencies(
+            dest, json.loads((source / "dependencies.json").read_text())
+        )
+        (dest / "uv.lock").write_text(
+            _rename_project((source / "uv.lock").read_text(), SNAPSHOT_PROJECT_NAME, name)
+        )
+        run_uv(["sync", "--frozen"], dest)
+    except Exception:
+        (dest / "pyproject.toml").write_text(original_pyproject)
+        (dest / "uv.lock").unlink(missing_ok=True)
+        return False
+    return True
+
+
+def clear_lock_snapshots() -> int:
+    root = lock_snapshots_dir()
+    if not root.exists():
+        return 0
+    count = sum(1 for p in root.iterdir() if p.is_dir())
+    shutil.rmtree(root)
+    return count
@@ -0,0 +1,18 @@
+from pathlib import PurePosixPath
+
+STATE_DIR = PurePosixPath(".volt")
+STATE_GITIGNORE = STATE_DIR / ".gitignore"
+# Per-machine state, rebuilt or re-detected when missing. The manifest next
+# to it describes the generated files and belongs in version control.
+LOCAL_STATE = ("index", "up", "db_template/")
+
+
+def ensure_state_dir(root) -> None:
+    """Create the project's state directory, ignoring its local state in git.
+
+    ``root`` is a project ``Path`` or a render tree's ``VirtualPath``.
+    """
+    gitignore = root / STATE_GITIGNORE
+    if not gitignore.exists():
+        gitignore.parent.mkdir(parents=True, exist_ok=True)
+        gitignore.write_text("".join(f"{name}\n" for name in LOCAL_STATE))
@@ -1,41 +1,92 @@
-import shutil
-import subprocess
 from pathlib import Path
 
+from volt.core.render import (
+    RENDERED_SUFFIXES,
+    TemplateFile,
+    VirtualPath,
+    load_template_dir,
+    load_template_file,
+    template_exists,
+)
+from volt.core.tracing import traced
+
 TEMPLATES_ROOT = Path(__file__).parent.parent / "templates"
 
 
+@traced(category="template")
 def copy_template(stack: str, template_name: str, dest: Path, dirs_exist_ok: bool = False) -> None:
     src = TEMPLATES_ROOT / stack / template_name
-    if not src.exists():
+    if not template_exists(src):
         raise FileNotFoundError(f"Template '{template_name}' not found for stack '{stack}'.")
-    shutil.copytree(src, dest, dirs_exist_ok=dirs_exist_ok)
+    if isinstance(dest, VirtualPath):
+        dest.tree.overlay(src, dest)
+        return
+    if dest.exists() and not dirs_exist_ok:
+        raise FileExistsError(f"Destination already exists: {dest}")
+    for rel, file in load_template_dir(src).items():
+        _write_template_file(file, dest / rel)
+
+
+@traced(category="template")
+def copy_template_file(src: Path, dest: Path) -> None:
+    if isinstance(dest, VirtualPath):
+        dest.tree.copy(src, dest)
+        return
+    _write_template_file(load_template_file(src), dest)
+
+
+def read_template_text(src: Path) -> str:
+    content = load_template_file(src).content
+    return content.decode("utf-8") if isinstance(content, bytes) else content
+
 
+def _write_template_file(file: TemplateFile, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(file.content, bytes):
+        dest.write_bytes(file.content)
+    else:
+        dest.write_text(file.content)
 
+
+@traced(category="template")
 def inject_variables(dest: Path, variables: dict[str, str]) -> None:
+    if isinstance(dest, VirtualPath):
+        dest.tree.render(variables)
+        return
     for file in dest.rglob("*.*"):
-        if file.suffix in (".py", ".toml", ".env", ".md", ".json", ".ts", ".tsx"):
+        if file.suffix in RENDERED_SUFFIXES:
             text = file.read_text()
             for key, value in variables.items():
                 text = text.replace(f"__{key}__", str(value))
             file.write_text(text)
 
 
+@traced(category="template")
 def inject_variables_in_file(file_path: Path, variables: dict[str, str]) -> None:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    if isinstance(file_path, VirtualPath):
+        file_path.tree.render(variables, [file_path])
+        return
+
     text = file_path.read_text()
     for key, value in variables.items():
         text = text.replace(f"__{key}__", str(value))
     file_path.write_text(text)
 
 
-def add_env_variables(env_file: Path, variables: dict[str, str | None]) -> None:
-    if not env_file.exists():
-        env_file.touch()
+@traced(category="template")
+def add_env_variables(
+    env_file: Path, variables: dict[str, str | None], overwrite: bool = True
+) -> None:
+    """Set ``variables`` in a .env file.
 
-    lines = env_file.read_text().splitlines()
+    Without ``overwrite``, only variables the file doesn't define yet are
+    appended and the rest of the file is left untouched.
+    """
+    text = env_file.read_text() if env_file.exists() else ""
+    lines = text.splitlines()
     env_dict = {}
 
     for line in lines:
@@ -45,13 +96,53 @@ def add_env_variables(env_file: Path, variables: dict[str, str | None]) -> None:
             key, value = line.split("=", 1)
             env_dict[key.strip()] = value.strip()
 
-    env_dict.update(variables)
-
-    with env_file.open("w") as f:
-        for key, value in env_dict.items():
-            f.write(f"{key}={value or ''}\n")
+    if not overwrite:
+        missing = {k: v for k, v in variables.items() if k not in env_dict}
+        if missing:
+            prefix = text if not text or text.endswith("\n") else text + "\n"
+            env_file.write_text(
+                prefix + "".join(f"{key}={value or ''}\n" for key, value in missing.items())
+            )
+        return
 
+    env_dict.update(variables)
 
-def format_with_black(dest: Path, formatter: str = "black") -> None:
-    subprocess.run(["uv", "run", formatter, str(dest)], check=False, stdout=subprocess.DEVNULL,
-                   stderr=subprocess.DEVNULL, )
+    env_file.write_text("".join(f"{key}={value or ''}\n" for key, value in env_dict.items()))
+
+
+@traced(category="format")
+def format_with_black(dest: Path, files=None) -> None:
+    """Format Python files with black in-process.
+
+    Only ``files`` are formatted when given. Otherwise a render tree formats
+    its pending files and a directory formats every Python file below it.
+    Unchanged content is served from the format cache without invoking black.
+    The ``[tool.black]`` settings of the project around ``dest`` apply.
+    """
+    from volt.core.formatting import black_mode, format_files, iter_python_files
+
+    if files is None:
+        if isinstance(dest, VirtualPath):
+            files = [
+                path
+                for path in (dest.tree.root / key for key in sorted(dest.tree.dirty))
+                if path.is_relative_to(dest)
+            ]
+        else:
+            files = iter_python_files(dest)
+    format_files(files, mode=black_mode(dest))
+
+
+def preload_templates(stack: str) -> None:
+    """Load every template of ``stack`` and the formatter into this process.
+
+    Called once before forking worker processes, so that they all share the
+    parsed templates and the imported black instead of each loading them.
+    """
+    import black  # noqa: F401
+
+    root = TEMPLATES_ROOT / stack
+    templates = {rel.split("/", 1)[0] for rel in load_template_dir(root) if "/" in rel}
+    for template in sorted(templates):
+        for rel in load_template_dir(root / template):
+            load_template_file(root / template / rel)
@@ -0,0 +1,48 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from volt.core.tracing import span
+
+
+class StageTimings:
+    """Wall-clock timings of named pipeline stages, safe to use from threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            with span(name, category="stage"):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stages.append((name, elapsed))
+
+    def timed(self, name: str, func, *args, **kwargs):
+        with self.stage(name):
+            return func(*args, **kwargs)
+
+    def print_summary(self, title: str = "Timings") -> None:
+        from rich.console import Console
+        from rich.table import Table
+
+        wall = time.perf_counter() - self._start
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Seconds", justify="right", style="green")
+
+        for name, elapsed in self.stages:
+            table.add_row(name, f"{elapsed:.2f}")
+
+        console = Console()
+        console.print(table)
+        console.print(
+            f"[dim]Sum of stages {sum(e for _, e in self.stages):.2f}s, "
+            f"wall clock {wall:.2f}s[/dim]"
+        )
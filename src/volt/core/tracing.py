@@ -0,0 +1,197 @@
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TRACE_FLAG = "--trace"
+TRACE_FILE_FLAG = "--trace-file"
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float
+    thread: int
+    depth: int
+    args: dict = field(default_factory=dict)
+    duration: float = 0.0
+    children: float = 0.0
+
+    @property
+    def self_time(self) -> float:
+        return self.duration - self.children
+
+
+class Tracer:
+    """Collects named, nested spans from every thread of the process."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, category: str, args: dict):
+        stack = self._stack()
+        record = Span(
+            name,
+            category,
+            start=time.perf_counter(),
+            thread=threading.get_ident(),
+            depth=len(stack),
+            args=args,
+        )
+        stack.append(record)
+        try:
+            yield record
+        finally:
+            record.duration = time.perf_counter() - record.start
+            stack.pop()
+            if stack:
+                stack[-1].children += record.duration
+            with self._lock:
+                self.spans.append(record)
+
+    def chrome_trace(self) -> dict:
+        """The spans as a Chrome trace (``chrome://tracing``, Perfetto)."""
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for record in sorted(self.spans, key=lambda s: s.start):
+            tid = threads.setdefault(record.thread, len(threads))
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": round((record.start - self.origin) * 1e6, 3),
+                    "dur": round(record.duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {key: str(value) for key, value in record.args.items()},
+                }
+            )
+        for thread, tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": "main" if tid == 0 else f"worker-{tid}"},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_tracer: Tracer | None = None
+
+
+def current_tracer() -> Tracer | None:
+    return _tracer
+
+
+@contextmanager
+def span(name: str, category: str = "volt", **args):
+    """Time the enclosed block as a named span; a no-op unless tracing is on."""
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, category, args) as record:
+        yield record
+
+
+def traced(name: str | None = None, category: str = "volt"):
+    """Decorator recording every call of the function as a span."""
+
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def trace_command(name: str, trace_file: Path | None = None):
+    """Trace everything inside the block and report it once the block exits.
+
+    The summary is printed to stderr even when the block exits through
+    ``SystemExit`` as typer apps do; ``trace_file`` also gets a Chrome trace.
+    """
+    global _tracer
+    tracer = _tracer = Tracer()
+    try:
+        with tracer.span(name, "command", {}):
+            yield tracer
+    finally:
+        _tracer = None
+        print_trace_summary(tracer)
+        if trace_file is not None:
+            import json
+
+            trace_file.write_text(json.dumps(tracer.chrome_trace()))
+            from rich.console import Console
+
+            Console(stderr=True).print(f"[dim]Chrome trace written to {trace_file}[/dim]")
+
+
+def print_trace_summary(tracer: Tracer, limit: int = 40) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    totals: dict[tuple[str, str], list] = {}
+    for record in tracer.spans:
+        entry = totals.setdefault((record.name, record.category), [0, 0.0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += record.duration
+        entry[2] += record.self_time
+        entry[3] = max(entry[3], record.duration)
+
+    table = Table(
+        title=f"Trace (top {min(limit, len(totals))} of {len(totals)} spans)",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Span", style="cyan", overflow="fold")
+    table.add_column("Category", style="dim")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right", style="yellow")
+    table.add_column("Self (ms)", justify="right", style="green")
+    table.add_column("Max (ms)", justify="right")
+
+    ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+    for (name, category), (calls, total, self_time, longest) in ranked[:limit]:
+        table.add_row(
+            name,
+            category,
+            str(calls),
+            f"{total * 1000:.2f}",
+            f"{self_time * 1000:.2f}",
+            f"{longest * 1000:.2f}",
+        )
+
+    console = Console(stderr=True)
+    console.print(table)
+    wall = time.perf_counter() - tracer.origin
+    console.print(f"[dim]{len(tracer.spans)} spans recorded in {wall * 1000:.1f} ms[/dim]")
@@ -1,6 +1,5 @@
 import os
 import sys
-from pathlib import Path
 from typing import Optional
 
 import typer
@@ -8,25 +7,30 @@ from alembic import command
 from alembic.config import Config
 from rich import print
 
-from volt.core.config import load_config
+from volt.core.project import require_project
 
 db_app = typer.Typer(help="Database migration management (Alembic wrapper).")
 
 
-def get_alembic_config() -> Config:
-    """Load Alembic configuration from current directory."""
-    ini_path = Path("alembic.ini")
+def get_alembic_config(config_required: bool = True) -> Config:
+    """Load the Alembic configuration of the project around the current directory.
+
+    Paths in alembic.ini are relative, so the command runs from the project root.
+    """
+    project = require_project(config_required=config_required)
+    ini_path = project.root / "alembic.ini"
     if not ini_path.exists():
-        print("[red]Error: alembic.ini not found in current directory.[/red]")
+        print("[red]Error: alembic.ini not found in the project root.[/red]")
         print(
-            "[dim]Ensure you are in the root of a Volt project with Alembic enabled.[/dim]"
+            "[dim]Ensure you are in a Volt project with Alembic enabled.[/dim]"
         )
         raise typer.Exit(1)
 
-    # Ensure current directory is in sys.path for autogenerate to work
-    cwd = os.getcwd()
-    if cwd not in sys.path:
-        sys.path.insert(0, cwd)
+    os.chdir(project.root)
+    # Ensure the project root is in sys.path for autogenerate to work
+    root = str(project.root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
 
     cfg = Config(str(ini_path))
     return cfg
@@ -36,41 +40,101 @@ def get_alembic_config() -> Config:
 def revision(
     message: str = typer.Option(..., "--message", "-m", help="Revision description"),
     autogenerate: bool = typer.Option(True, help="Automatically detect model changes"),
+    backfill: Optional[str] = typer.Option(
+        None,
+        "--backfill",
+        metavar="TABLE",
+        help="Create a data migration that updates TABLE in resumable batches",
+    ),
+    key: str = typer.Option(
+        "id", "--key", help="Indexed, unique column the backfill walks the table by"
+    ),
+    batch_size: int = typer.Option(
+        1000, "--batch-size", min=1, help="Rows per backfill batch (committed separately)"
+    ),
+    assignments: list[str] = typer.Option(
+        [],
+        "--set",
+        metavar="COLUMN=EXPR",
+        help="Backfill COLUMN with the SQL expression EXPR (repeatable)",
+    ),
 ):
     """Create a new migration revision."""
-    if not load_config(Path("volt.toml")):
-        print("[red]Error: Not a Volt project (volt.toml not found).[/red]")
+    from volt.core.migrations import parse_assignments
+
+    if assignments and not backfill:
+        print("[red]Error: --set only applies to --backfill revisions.[/red]")
+        raise typer.Exit(1)
+    try:
+        parsed = parse_assignments(assignments)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
+
     cfg = get_alembic_config()
     try:
-        command.revision(cfg, message=message, autogenerate=autogenerate)
+        script = command.revision(
+            cfg, message=message, autogenerate=autogenerate and not backfill
+        )
+        if backfill:
+            from volt.core.migrations import render_backfill_revision
+
+            with open(script.path, "w", encoding="utf-8") as f:
+                f.write(
+                    render_backfill_revision(script, backfill, key, batch_size, parsed)
+                )
         print(f"[green]✔ Migration revision created: {message}[/green]")
     except Exception as e:
         print(f"[red]Error creating revision: {e}[/red]")
         raise typer.Exit(1)
 
+    if backfill and parsed:
+        print(
+            f"[dim]Review the UPDATE in {os.path.relpath(script.path)}, then run 'volt db upgrade'.[/dim]"
+        )
+    elif backfill:
+        print(
+            f"[dim]Implement backfill_batch() in {os.path.relpath(script.path)} (or use --set), then run 'volt db upgrade'.[/dim]"
+        )
+
 
 @db_app.command()
-def upgrade(target: str = typer.Argument("head", help="Revision to upgrade to")):
+def upgrade(
+    target: str = typer.Argument("head", help="Revision to upgrade to"),
+    report: bool = typer.Option(
+        False, "--report", help="Print how long each revision step took"
+    ),
+):
     """Upgrade database to a specific revision."""
-    if not load_config(Path("volt.toml")):
-        print("[red]Error: Not a Volt project (volt.toml not found).[/red]")
-        raise typer.Exit(1)
     cfg = get_alembic_config()
-    try:
-        command.upgrade(cfg, target)
-        print(f"[green]✔ Successfully upgraded database to {target}[/green]")
-    except Exception as e:
-        print(f"[red]Error upgrading database: {e}[/red]")
-        raise typer.Exit(1)
+    if not report:
+        try:
+            command.upgrade(cfg, target)
+            print(f"[green]✔ Successfully upgraded database to {target}[/green]")
+        except Exception as e:
+            print(f"[red]Error upgrading database: {e}[/red]")
+            raise typer.Exit(1)
+        return
+
+    import time
+
+    from volt.core.migrations import print_step_timings, time_migration_steps
+
+    start = time.perf_counter()
+    with time_migration_steps() as timings:
+        try:
+            command.upgrade(cfg, target)
+        except Exception as e:
+            print_step_timings(timings, time.perf_counter() - start)
+            print(f"[red]Error upgrading database: {e}[/red]")
+            raise typer.Exit(1)
+    print_step_timings(timings, time.perf_counter() - start)
+    print(f"[green]✔ Successfully upgraded database to {target}[/green]")
 
 
 @db_app.command()
 def downgrade(target: str = typer.Argument("-1", help="Revision to downgrade to")):
     """Downgrade database to a specific revision."""
-    if not load_config(Path("volt.toml")):
-        print("[red]Error: Not a Volt project (volt.toml not found).[/red]")
-        raise typer.Exit(1)
     cfg = get_alembic_config()
     try:
         command.downgrade(cfg, target)
@@ -80,8 +144,229 @@ def downgrade(target: str = typer.Argument("-1", help="Revision to downgrade to"
         raise typer.Exit(1)
 
 
+@db_app.command()
+def squash(
+    target: str = typer.Argument("head", help="Last revision to squash (must be the head)"),
+    message: str = typer.Option("baseline", "--message", "-m", help="Baseline description"),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Squash even if the database is behind the target, its schema differs "
+        "from the models, or the revisions change data",
+    ),
+):
+    """Replace the revision history with one baseline generated from the models."""
+    import re
+    import shutil
+    from pathlib import Path
+
+    from alembic.script import ScriptDirectory
+    from rich.markup import escape
+
+    from volt.core.migrations import (
+        data_operations,
+        describe_schema_diff,
+        read_database,
+        render_baseline_revision,
+        squashable_revisions,
+    )
+    from volt.core.template import format_with_black
+
+    cfg = get_alembic_config()
+    script = ScriptDirectory.from_config(cfg)
+    try:
+        chain = squashable_revisions(script, target)
+    except Exception as e:
+        print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    if len(chain) < 2:
+        print("[green]✔ Nothing to squash.[/green]")
+        return
+
+    try:
+        current, metadata, diff = read_database(cfg, script, compare=True)
+    except Exception as e:
+        print(f"[red]Error reading the database revision: {e}[/red]")
+        raise typer.Exit(1)
+    if metadata is None:
+        print("[red]Error: migrations/env.py sets no target_metadata.[/red]")
+        raise typer.Exit(1)
+
+    head = chain[-1].revision
+    # Databases between base and head lose the revisions they still need.
+    behind = [rev for rev in current if rev != head]
+    if behind and not force:
+        print(
+            f"[red]Error: The database is at {', '.join(behind)}, not {head}; "
+            "it couldn't upgrade past the squashed revisions.[/red]"
+        )
+        print("[dim]Upgrade every environment first, or pass --force.[/dim]")
+        raise typer.Exit(1)
+
+    # The baseline is rendered from the models, so it only stands in for the
+    # chain if the models describe the schema the chain builds.
+    if diff and not behind and not force:
+        print(
+            f"[red]Error: The models differ from the database schema at {head}; "
+            "the baseline would not match the revisions it replaces.[/red]"
+        )
+        for entry in diff:
+            print(f"  [yellow]{escape(describe_schema_diff(entry))}[/yellow]")
+        print(
+            "[dim]Create a revision for the changes ('volt db revision') and upgrade "
+            "first, or pass --force.[/dim]"
+        )
+        raise typer.Exit(1)
+
+    changes = data_operations(chain)
+    if changes and not force:
+        print(
+            "[red]Error: These revisions change data, which the baseline can't "
+            "reproduce:[/red]"
+        )
+        for path, line, operation in changes:
+            print(f"  [cyan]{escape(os.path.relpath(path))}:{line}[/cyan] {operation}")
+        print(
+            "[dim]Move seed data elsewhere, or pass --force to drop it from the "
+            "history.[/dim]"
+        )
+        raise typer.Exit(1)
+
+    source = render_baseline_revision(head, message, len(chain), metadata)
+
+    # Kept for reference, outside the directory Alembic reads revisions from.
+    archive = Path(script.dir) / "squashed" / head
+    archive.mkdir(parents=True, exist_ok=True)
+    for rev in chain:
+        shutil.move(rev.path, archive / Path(rev.path).name)
+
+    slug = re.sub(r"[^a-z0-9]+", "_", message.lower()).strip("_")[:40]
+    baseline = Path(script.versions) / f"{head}_{slug or 'baseline'}.py"
+    baseline.write_text(source, encoding="utf-8")
+    format_with_black(baseline.parent, [baseline])
+
+    print(
+        f"[green]✔ Squashed {len(chain)} revisions into {os.path.relpath(baseline)}[/green]"
+    )
+    print(f"[dim]The old revisions were moved to {os.path.relpath(archive)}.[/dim]")
+
+
+DB_TEMPLATE_MODULE = "app.core.db_template"
+
+
+def run_db_template(*args: str) -> str:
+    """Run the project's ``app.core.db_template`` with its own interpreter.
+
+    The module runs inside the project, with its settings and drivers; it is
+    added first to projects created before it existed.
+    """
+    import subprocess
+    import time
+
+    from rich.markup import escape
+
+    from volt.core.template import TEMPLATES_ROOT, copy_template_file
+    from volt.stacks.constants import DB_NOSQL_MODEL, DB_SQL_MODEL
+
+    project = require_project()
+    db_choice = project.features.get("database", "None")
+    helper = project.root / "app" / "core" / "db_template.py"
+    if not helper.exists():
+        if db_choice not in DB_SQL_MODEL and db_choice not in DB_NOSQL_MODEL:
+            print("[red]Error: This project has no database.[/red]")
+            raise typer.Exit(1)
+        template = "db_mongo" if db_choice in DB_NOSQL_MODEL else "db_sqlmodel"
+        copy_template_file(
+            TEMPLATES_ROOT / "fastapi" / template / "app" / "core" / "db_template.py",
+            helper,
+        )
+        print(f"[green]Added {os.path.relpath(helper)}[/green]")
+
+    venv = project.root / ".venv"
+    python = next(
+        (
+            str(path)
+            for path in (venv / "bin" / "python", venv / "Scripts" / "python.exe")
+            if path.exists()
+        ),
+        sys.executable,
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python, "-m", DB_TEMPLATE_MODULE, *args],
+        cwd=project.root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        output = result.stderr.strip() or result.stdout.strip()
+        print(f"[red]Error: {escape(output.splitlines()[-1] if output else '')}[/red]")
+        raise typer.Exit(1)
+    print(
+        f"[dim]{DB_TEMPLATE_MODULE} {' '.join(args)} took "
+        f"{time.perf_counter() - start:.2f}s[/dim]"
+    )
+    return result.stdout.strip()
+
+
+@db_app.command()
+def snapshot():
+    """Migrate a template database once, for cheap clones."""
+    url = run_db_template("snapshot")
+    print(f"[green]✔ Template database ready:[/green] {url}")
+
+
+@db_app.command()
+def clone(
+    name: str = typer.Argument(..., help="Database to create from the template"),
+    drop: bool = typer.Option(False, "--drop", help="Drop the clone NAME instead"),
+):
+    """Copy the template database into NAME (snapshotting it first if stale)."""
+    if drop:
+        run_db_template("drop", name)
+        print(f"[green]✔ Dropped {name}[/green]")
+        return
+    url = run_db_template("clone", name)
+    print(f"[green]✔ Cloned the template into {name}:[/green] {url}")
+
+
 @db_app.command()
 def history():
     """Show migration history."""
-    cfg = get_alembic_config()
+    cfg = get_alembic_config(config_required=False)
     command.history(cfg)
+
+
+@db_app.command()
+def lint(
+    all_revisions: bool = typer.Option(
+        False,
+        "--all",
+        help="Check every revision instead of those the database hasn't applied yet",
+    ),
+):
+    """Check pending migrations for operations that lock or rewrite large tables."""
+    from volt.core.migrations import (
+        ERROR,
+        lint_migration,
+        pending_revisions,
+        print_lint_findings,
+    )
+
+    cfg = get_alembic_config()
+    try:
+        revisions = pending_revisions(cfg, all_revisions)
+    except Exception as e:
+        print(f"[red]Error reading the database revision: {e}[/red]")
+        print("[dim]Use --all to check every revision without connecting.[/dim]")
+        raise typer.Exit(1)
+
+    findings = []
+    for script in revisions:
+        path = os.path.relpath(script.path)
+        with open(script.path, encoding="utf-8") as f:
+            findings += lint_migration(f.read(), path)
+
+    print_lint_findings(findings, len(revisions))
+    if any(finding.severity == ERROR for finding in findings):
+        raise typer.Exit(1)
@@ -1,15 +1,27 @@
-from pathlib import Path
-
 from rich import print
 
-from volt.core.config import load_config, save_config
+from volt.core.delta import ProjectDelta, plan_delta, print_project_delta
+from volt.core.dependencies import install_uv_packages
+from volt.core.project import Project
 from volt.core.prompts import choose
-from volt.stacks.fastapi.helpers import setup_auth_templates, setup_db_templates
-from volt.stacks.fastapi.dependencies import install_fastapi_dependencies
-
-
-def add_feature(feature_type: str):
-    project_root = Path.cwd()
+from volt.core.manifest import record_generated
+from volt.core.render import RenderTree
+from volt.core.timing import StageTimings
+from volt.stacks.fastapi.helpers import (
+    setup_auth_templates,
+    setup_db_templates,
+    setup_redis_templates,
+)
+from volt.stacks.fastapi.dependencies import plan_fastapi_dependencies
+
+
+def add_feature(
+    project: Project,
+    feature_type: str,
+    skip_install: bool = False,
+    dry_run: bool = False,
+):
+    project_root = project.root
 
     if (
         not (project_root / "app").exists()
@@ -20,56 +32,122 @@ def add_feature(feature_type: str):
         )
         return
 
-    config = load_config(project_root / "volt.toml")
-    if not config:
+    if project.config is None:
         print(
             "[yellow]Warning: volt.toml not found. Feature detection might be less accurate.[/yellow]"
         )
 
     if feature_type == "database":
-        add_database(project_root, config)
+        add_database(project, skip_install=skip_install, dry_run=dry_run)
     elif feature_type == "auth":
-        add_auth(project_root, config)
+        add_auth(project, skip_install=skip_install, dry_run=dry_run)
+    elif feature_type == "redis":
+        add_redis(project, skip_install=skip_install, dry_run=dry_run)
     else:
         print(f"[red]Unknown feature type: {feature_type}[/red]")
 
 
-def add_database(project_root: Path, config):
+def stage_feature(project: Project) -> RenderTree:
+    """A render tree over the project that never replaces existing files."""
+    return RenderTree(base=project.root, keep_existing=True)
+
+
+def apply_feature(
+    project: Project,
+    tree: RenderTree,
+    delta: ProjectDelta,
+    skip_install: bool = False,
+    dry_run: bool = False,
+    timings: StageTimings | None = None,
+) -> bool:
+    """Show the delta and apply it; returns False when nothing was applied.
+
+    Only the files in the delta are written and only its missing packages
+    are added to the existing uv project, without re-initialising it.
+    """
+    timings = timings or StageTimings()
+    print_project_delta(delta)
+    if dry_run:
+        print("[dim]Dry run: the project was not changed.[/dim]")
+        return False
+
+    if delta.created or delta.updated:
+        record_generated(tree)
+        project.index.update(timings.timed("write files", tree.write, project.root))
+    if delta.packages and not skip_install:
+        timings.timed(
+            "install dependencies", install_uv_packages, delta.packages, project.root
+        )
+    if delta.dev_packages and not skip_install:
+        timings.timed(
+            "install dev dependencies",
+            install_uv_packages,
+            delta.dev_packages,
+            project.root,
+            dev=True,
+        )
+    return True
+
+
+def add_database(
+    project: Project,
+    skip_install: bool = False,
+    timings: StageTimings | None = None,
+    dry_run: bool = False,
+):
     print("[bold]Adding Database...[/bold]")
 
-    if config and config.features.get("database") != "None":
-        print(
-            f"[yellow]Database already configured: {config.features['database']}[/yellow]"
-        )
+    configured = project.features.get("database", "None")
+    if configured != "None":
+        print(f"[yellow]Database already configured: {configured}[/yellow]")
 
     db_choice = choose(
         "Select a database to add:",
         choices=["SQLite", "PostgreSQL", "MySQL", "MongoDB"],
         default="SQLite",
     )
+    if configured not in ("None", db_choice):
+        # Existing files are never replaced, so they would keep the old database.
+        print(
+            f"[red]Error: Switching from {configured} to {db_choice} is not supported.[/red]"
+        )
+        return
 
-    setup_db_templates(project_root, db_choice)
-    install_fastapi_dependencies(project_root, db_choice, "None")
+    # Stage template copies and injections, then write only what changed.
+    timings = timings or StageTimings()
+    tree = stage_feature(project)
+    with timings.stage("render templates"):
+        setup_db_templates(tree.root, db_choice)
+    delta = plan_delta(
+        f"{db_choice} database",
+        tree,
+        plan_fastapi_dependencies(db_choice, "None"),
+        project.requirements,
+        project.dev_requirements,
+    )
+    if not apply_feature(project, tree, delta, skip_install, dry_run, timings):
+        return
 
-    if config:
-        config.features["database"] = db_choice
-        save_config(config, project_root / "volt.toml")
+    if project.config is not None:
+        project.features["database"] = db_choice
+        project.save_config()
 
     print(f"[green]✔ Successfully added {db_choice} database support![/green]")
 
 
-def add_auth(project_root: Path, config):
+def add_auth(
+    project: Project,
+    skip_install: bool = False,
+    timings: StageTimings | None = None,
+    dry_run: bool = False,
+):
     print("[bold]Adding Authentication...[/bold]")
 
-    has_db = False
-    if (
-        config
-        and config.features.get("database")
-        and config.features["database"] != "None"
-    ):
-        has_db = True
-    elif (project_root / "app" / "core" / "db.py").exists():
-        has_db = True
+    project_root = project.root
+    db_choice = project.features.get("database", "None")
+    has_db = (
+        db_choice != "None" or (project_root / "app" / "core" / "db.py").exists()
+    )
 
     if not has_db:
         print(
@@ -86,15 +164,10 @@ def add_auth(project_root: Path, config):
         default="Bearer Token (Authorization Header)",
     )
 
-    db_choice = "None"
-    if config and config.features.get("database"):
-        db_choice = config.features["database"]
-
     if db_choice == "None":
-        pyproject = (project_root / "pyproject.toml").read_text()
-        if "beanie" in pyproject or "motor" in pyproject:
+        if project.dependencies & {"beanie", "motor"}:
             db_choice = "MongoDB"
-        elif "sqlmodel" in pyproject or "sqlalchemy" in pyproject:
+        elif project.dependencies & {"sqlmodel", "sqlalchemy"}:
             db_choice = "PostgreSQL"  # generic SQL
 
     if db_choice == "None":
@@ -103,11 +176,58 @@ def add_auth(project_root: Path, config):
         )
         return
 
-    setup_auth_templates(project_root, auth_choice, db_choice)
-    install_fastapi_dependencies(project_root, db_choice, auth_choice)
+    timings = timings or StageTimings()
+    tree = stage_feature(project)
+    with timings.stage("render templates"):
+        setup_auth_templates(tree.root, auth_choice, db_choice)
+    # The database packages are already there; only auth's own are planned.
+    delta = plan_delta(
+        auth_choice,
+        tree,
+        plan_fastapi_dependencies("None", auth_choice),
+        project.requirements,
+    )
+    if not apply_feature(project, tree, delta, skip_install, dry_run, timings):
+        return
 
-    if config:
-        config.features["auth"] = auth_choice
-        save_config(config, project_root / "volt.toml")
+    if project.config is not None:
+        project.features["auth"] = auth_choice
+        project.save_config()
 
     print(f"[green]✔ Successfully added {auth_choice}![/green]")
+
+
+def add_redis(
+    project: Project,
+    skip_install: bool = False,
+    timings: StageTimings | None = None,
+    dry_run: bool = False,
+):
+    from volt.core.template import add_env_variables
+    from volt.stacks.fastapi.config_blocks import REDIS_SETTINGS, REDIS_URL
+    from volt.stacks.fastapi.injectors import inject_settings
+
+    print("[bold]Adding Redis...[/bold]")
+
+    timings = timings or StageTimings()
+    tree = stage_feature(project)
+    root = tree.root
+    with timings.stage("render templates"):
+        setup_redis_templates(root)
+        inject_settings(root / "app" / "core" / "config.py", REDIS_SETTINGS)
+        add_env_variables(root / ".env", {"REDIS_URL": REDIS_URL}, overwrite=False)
+        add_env_variables(root / ".env.example", {"REDIS_URL": None}, overwrite=False)
+    delta = plan_delta(
+        "Redis",
+        tree,
+        plan_fastapi_dependencies("None", "None", redis_choice=True),
+        project.requirements,
+    )
+    if not apply_feature(project, tree, delta, skip_install, dry_run, timings):
+        return
+
+    if project.config is not None:
+        project.features["redis"] = True
+        project.save_config()
+
+    print("[green]✔ Successfully added Redis support![/green]")
@@ -1,21 +1,90 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from rich import print
 
 
-def create_fastapi_app(name: Path | str, skip_install: bool = False):
-    from volt.core.config import VoltConfig, save_config
+def prompt_fastapi_features() -> dict:
+    """Ask for the project's features; the result matches ``VoltConfig.features``."""
     from volt.core.prompts import choose
-    from volt.stacks.fastapi.dependencies import install_fastapi_dependencies
     from volt.stacks.constants import DB_SQL_MODEL
+
+    db_choice = choose(
+        "Select a database:",
+        choices=["None", "SQLite", "PostgreSQL", "MySQL", "MongoDB"],
+        default="None",
+    )
+    auth_choice = (
+        choose(
+            "Select an authentication method:",
+            choices=[
+                "None",
+                "Bearer Token (Authorization Header)",
+                "Cookie-based Authentication (HTTPOnly)",
+            ],
+            default="None",
+        )
+        if db_choice != "None"
+        else "None"
+    )
+    alembic_choice = (
+        choose(
+            "Add Alembic for database migrations?",
+            choices=["Yes", "No"],
+            default="Yes",
+        )
+        if db_choice in DB_SQL_MODEL
+        else "No"
+    )
+    redis_choice = choose(
+        "Add Redis support?",
+        choices=["Yes", "No"],
+        default="No",
+    )
+    observability_choice = choose(
+        "Select an observability / logging system:",
+        choices=["None", "Sentry", "Logfire"],
+        default="None",
+    )
+    return {
+        "database": db_choice,
+        "auth": auth_choice,
+        "alembic": alembic_choice == "Yes",
+        "redis": redis_choice == "Yes",
+        "observability": observability_choice,
+    }
+
+
+def create_fastapi_app(
+    name: Path | str,
+    skip_install: bool = False,
+    plan_only: bool = False,
+    timings=None,
+    features: dict | None = None,
+):
+    """Create a FastAPI project in ``name``.
+
+    ``features`` (a ``VoltConfig.features`` mapping, see ``presets``) skips
+    the interactive prompts.
+    """
+    from volt.core.config import VoltConfig, save_config
+    from volt.core.manifest import record_generated
+    from volt.core.render import RenderTree
+    from volt.core.template import format_with_black
+    from volt.core.timing import StageTimings
+    from volt.core.dependencies import print_dependency_plan
+    from volt.stacks.fastapi.dependencies import (
+        install_fastapi_dependencies,
+        plan_fastapi_dependencies,
+    )
     from volt.stacks.fastapi.helpers import (
         setup_db_templates,
         setup_auth_templates,
         setup_alembic_templates,
         setup_redis_templates,
     )
+    from volt.stacks.fastapi.presets import normalize_fastapi_features
     from volt.stacks.fastapi.template_utils import (
         copy_fastapi_base_template,
         prepare_fastapi_template,
@@ -28,107 +97,108 @@ def create_fastapi_app(name: Path | str, skip_install: bool = False):
         print(f"[red]The folder '{dest.resolve()}' already exists.[/red]")
         return
 
-    try:
-        db_choice = choose(
-            "Select a database:",
-            choices=["None", "SQLite", "PostgreSQL", "MySQL", "MongoDB"],
-            default="None",
-        )
-        auth_choice = (
-            choose(
-                "Select an authentication method:",
-                choices=[
-                    "None",
-                    "Bearer Token (Authorization Header)",
-                    "Cookie-based Authentication (HTTPOnly)",
-                ],
-                default="None",
-            )
-            if db_choice != "None"
-            else "None"
-        )
-        alembic_choice = (
-            choose(
-                "Add Alembic for database migrations?",
-                choices=["Yes", "No"],
-                default="Yes",
+    if features is None:
+        try:
+            features = prompt_fastapi_features()
+        except KeyboardInterrupt:
+            return
+    else:
+        features = normalize_fastapi_features(features)
+
+    db_choice = features["database"]
+    auth_choice = features["auth"]
+    redis_enabled = features["redis"]
+    observability_choice = features["observability"]
+
+    if plan_only:
+        print_dependency_plan(
+            plan_fastapi_dependencies(
+                db_choice, auth_choice, redis_enabled, observability_choice
             )
-            if db_choice in DB_SQL_MODEL
-            else "No"
-        )
-        redis_choice = choose(
-            "Add Redis support?",
-            choices=["Yes", "No"],
-            default="No",
         )
-        observability_choice = choose(
-            "Select an observability / logging system:",
-            choices=["None", "Sentry", "Logfire"],
-            default="None",
-        )
-    except KeyboardInterrupt:
         return
 
+    timings = timings or StageTimings()
+    install_future = None
+    pool = ThreadPoolExecutor(max_workers=1)
     try:
-        with TemporaryDirectory() as tmpdir:
-            temp_path = Path(tmpdir)
-            copy_fastapi_base_template(temp_path)
+        if not skip_install:
+            # The uv environment doesn't depend on the rendered sources, so it
+            # is created in the destination while the project is rendered.
+            dest.mkdir(parents=True)
+            install_future = pool.submit(
+                timings.timed,
+                "install dependencies",
+                install_fastapi_dependencies,
+                dest,
+                db_choice,
+                auth_choice,
+                redis_enabled,
+                observability_choice=observability_choice,
+                use_lock_snapshot=True,
+            )
 
-            setup_db_templates(temp_path, db_choice)
-            setup_auth_templates(temp_path, auth_choice, db_choice)
+        try:
+            # The whole project is assembled in memory and written to disk once.
+            with timings.stage("render templates"):
+                tree = RenderTree()
+                project_root = tree.root
+                copy_fastapi_base_template(project_root)
 
-            if redis_choice == "Yes":
-                setup_redis_templates(temp_path)
+                setup_db_templates(project_root, db_choice)
+                setup_auth_templates(project_root, auth_choice, db_choice)
 
-            if observability_choice == "Sentry":
-                from volt.stacks.fastapi.injectors import inject_sentry
+                if redis_enabled:
+                    setup_redis_templates(project_root)
 
-                inject_sentry(temp_path / "app" / "main.py")
-            elif observability_choice == "Logfire":
-                from volt.stacks.fastapi.injectors import inject_logfire
+                if observability_choice == "Sentry":
+                    from volt.stacks.fastapi.injectors import inject_sentry
 
-                inject_logfire(temp_path / "app" / "main.py")
+                    inject_sentry(project_root / "app" / "main.py")
+                elif observability_choice == "Logfire":
+                    from volt.stacks.fastapi.injectors import inject_logfire
 
-            if alembic_choice == "Yes":
-                setup_alembic_templates(temp_path)
+                    inject_logfire(project_root / "app" / "main.py")
 
-            prepare_fastapi_template(
-                temp_path,
-                project_name,
-                db_choice,
-                auth_choice,
-                redis_choice=redis_choice == "Yes",
-                observability_choice=observability_choice,
-            )
+                if features["alembic"]:
+                    setup_alembic_templates(project_root)
 
-            shutil.move(str(temp_path), dest)
-
-            config = VoltConfig(
-                project_name=project_name,
-                stack="fastapi",
-                features={
-                    "database": db_choice,
-                    "auth": auth_choice,
-                    "alembic": alembic_choice == "Yes",
-                    "redis": redis_choice == "Yes",
-                    "observability": observability_choice,
-                },
-            )
-            save_config(config, dest / "volt.toml")
+                prepare_fastapi_template(
+                    project_root,
+                    project_name,
+                    db_choice,
+                    auth_choice,
+                    redis_choice=redis_enabled,
+                    observability_choice=observability_choice,
+                )
 
-        if not skip_install:
-            install_fastapi_dependencies(
-                dest,
-                db_choice,
-                auth_choice,
-                redis_choice == "Yes",
-                observability_choice=observability_choice,
-            )
+                config = VoltConfig(
+                    project_name=project_name,
+                    stack="fastapi",
+                    features=dict(features),
+                )
+                save_config(config, project_root / "volt.toml")
+
+            timings.timed("format", format_with_black, project_root)
+            record_generated(tree)
+            timings.timed("write files", tree.write, dest)
+        except BaseException:
+            if install_future is not None:
+                install_future.cancel()
+                pool.shutdown(wait=True)
+                shutil.rmtree(dest, ignore_errors=True)
+            raise
+
+        if install_future is not None:
+            install_future.result()
     except Exception as e:
         print(f"[red]Error creating FastAPI app: {e}[/red]")
         raise e
         return
+    finally:
+        pool.shutdown(wait=True)
 
+    timings.print_summary("Project creation")
     print()
     print(
         f"[green]✔ Successfully created FastAPI app:[/green] [bold]{project_name}[/bold]"
@@ -141,3 +211,107 @@ def create_fastapi_app(name: Path | str, skip_install: bool = False):
         print("  2. [cyan]uv run uvicorn app.main:app[/cyan]")
     else:
         print("  2. [cyan]Install dependencies manually[/cyan]")
+
+
+def _create_in_worker(
+    dest: str, features: dict, skip_install: bool
+) -> tuple[str, float, str | None]:
+    """Run one project of a batch in a worker process, quietly."""
+    import contextlib
+    import io
+    import time
+
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            create_fastapi_app(dest, skip_install=skip_install, features=features)
+    except Exception as e:
+        return dest, time.perf_counter() - start, str(e) or type(e).__name__
+    return dest, time.perf_counter() - start, None
+
+
+def create_fastapi_apps(
+    projects: list[tuple[str, dict]],
+    skip_install: bool = False,
+    jobs: int | None = None,
+) -> bool:
+    """Create several FastAPI projects concurrently in a process pool.
+
+    Templates and black are loaded once in this process before the workers
+    are forked, and every worker installs through the same uv cache and lock
+    snapshots. Returns whether every project was created.
+    """
+    import multiprocessing
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from rich.table import Table
+
+    from volt.core.template import preload_templates
+    from volt.stacks.fastapi.presets import normalize_fastapi_features
+
+    existing = [name for name, _ in projects if Path(name).exists()]
+    if existing:
+        print(f"[red]These folders already exist: {', '.join(existing)}[/red]")
+        return False
+
+    projects = [(name, normalize_fastapi_features(f)) for name, f in projects]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(projects)))
+
+    # fork shares the preloaded templates copy-on-write; elsewhere each
+    # worker loads them once through the initializer.
+    if "fork" in multiprocessing.get_all_start_methods():
+        preload_templates("fastapi")
+        context, initializer = multiprocessing.get_context("fork"), None
+    else:
+        context, initializer = multiprocessing.get_context(), preload_templates
+
+    results = {}
+    start = time.perf_counter()
+    print(f"[dim]Creating {len(projects)} projects with {jobs} workers...[/dim]")
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=initializer,
+        initargs=("fastapi",) if initializer else (),
+    ) as pool:
+        futures = [
+            pool.submit(_create_in_worker, name, features, skip_install)
+            for name, features in projects
+        ]
+        for future in as_completed(futures):
+            name, seconds, error = future.result()
+            results[name] = (seconds, error)
+            if error:
+                print(f"[red]✘ {name}[/red] [dim]{error}[/dim]")
+            else:
+                print(f"[green]✔ {name}[/green] [dim]{seconds:.2f}s[/dim]")
+    elapsed = time.perf_counter() - start
+
+    table = Table(title="Batch creation", show_header=True, header_style="bold magenta")
+    table.add_column("Project", style="cyan")
+    table.add_column("Database")
+    table.add_column("Auth")
+    table.add_column("Time (s)", justify="right", style="yellow")
+    table.add_column("Status")
+    for name, features in projects:
+        seconds, error = results[name]
+        table.add_row(
+            name,
+            features["database"],
+            features["auth"],
+            f"{seconds:.2f}",
+            "[red]failed[/red]" if error else "[green]created[/green]",
+        )
+    print()
+    print(table)
+
+    failed = sum(1 for _, error in results.values() if error)
+    if failed:
+        print(f"[red]✘ {failed} of {len(projects)} projects failed[/red]")
+        return False
+    print(
+        f"[green]✔ Created {len(projects)} FastAPI projects in {elapsed:.2f}s[/green]"
+    )
+    return True
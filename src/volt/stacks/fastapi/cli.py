@@ -3,7 +3,11 @@ from typer import Typer, Argument, Option, Exit
 
 fastapi_app = Typer(help="Create, configure, and manage FastAPI applications.")
 generate_app = Typer(help="Generate code components (CRUD, models, etc.).")
+snapshots_app = Typer(help="Manage pre-resolved uv.lock snapshots.")
 fastapi_app.add_typer(generate_app, name="generate", help="Generate code components.")
+fastapi_app.add_typer(
+    snapshots_app, name="snapshots", help="Manage pre-resolved uv.lock snapshots."
+)
 
 
 @fastapi_app.command(
@@ -14,45 +18,153 @@ def create_fastapi(
     skip_install: bool = Option(
         False, "--skip-install", help="Skip dependency installation"
     ),
+    plan: bool = Option(
+        False, "--plan", help="Show the dependencies that would be installed and exit"
+    ),
+    preset: Path = Option(
+        None,
+        "--preset",
+        help="TOML file with the project features, skipping the prompts.",
+        exists=True,
+        dir_okay=False,
+    ),
 ):
     from volt.stacks.fastapi.app_creator import create_fastapi_app
 
-    create_fastapi_app(name, skip_install=skip_install)
+    features = None
+    if preset is not None:
+        from volt.stacks.fastapi.presets import load_fastapi_preset
+        from rich import print
+
+        try:
+            features = load_fastapi_preset(preset)
+        except ValueError as e:
+            print(f"[red]Error: {e}[/red]")
+            raise Exit(1)
+
+    create_fastapi_app(
+        name, skip_install=skip_install, plan_only=plan, features=features
+    )
+
+
+@fastapi_app.command(
+    "batch",
+    help="Create several FastAPI projects from a TOML list of presets.",
+    no_args_is_help=True,
+)
+def create_fastapi_batch(
+    batch_file: Path = Argument(
+        ...,
+        help="TOML file with a [[projects]] table per project.",
+        exists=True,
+        dir_okay=False,
+    ),
+    jobs: int = Option(
+        None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count)"
+    ),
+    skip_install: bool = Option(
+        False, "--skip-install", help="Skip dependency installation"
+    ),
+):
+    from volt.stacks.fastapi.app_creator import create_fastapi_apps
+    from volt.stacks.fastapi.presets import load_fastapi_batch
+    from rich import print
+
+    try:
+        projects = load_fastapi_batch(batch_file)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/red]")
+        raise Exit(1)
+
+    if not create_fastapi_apps(projects, skip_install=skip_install, jobs=jobs):
+        raise Exit(1)
 
 
 @generate_app.command("crud", help="Generate CRUD boilerplate for a model.")
 def generate_fastapi_crud(
-    model: str = Argument(..., help="Name of the model to generate CRUD for.")
+    model: str = Argument(None, help="Name of the model to generate CRUD for."),
+    spec: Path = Option(
+        None,
+        "--spec",
+        help="YAML file describing several models to generate in one pass.",
+        exists=True,
+        dir_okay=False,
+    ),
 ):
-    from volt.stacks.fastapi.scaffold import generate_crud, collect_fields
-    from volt.core.config import load_config
+    from volt.core.project import require_project
+    from volt.stacks.fastapi.index import MODELS
+    from volt.stacks.fastapi.scaffold import (
+        generate_cruds,
+        collect_fields,
+        load_crud_spec,
+    )
     from rich import print
 
-    config = load_config(Path("volt.toml"))
-    if not config:
-        print("[red]Error: Not a Volt project (volt.toml not found).[/red]")
-        return
-
-    if config.stack != "fastapi":
-        print(
-            f"[red]Error: This command is only for FastAPI stack (current: {config.stack}).[/red]"
-        )
-        return
-
-    app_path = Path.cwd()
-    model_lower = model.lower()
-    model_file = app_path / "app" / "models" / f"{model_lower}.py"
-    if model_file.exists():
-        print(
-            f"[red]Error: Model '{model.capitalize()}' already exists at {model_file.relative_to(app_path)}[/red]"
-        )
+    project = require_project(stack="fastapi")
+
+    if (model is None) == (spec is None):
+        print("[red]Error: Pass either a model name or --spec.[/red]")
         raise Exit(1)
 
-    # Collect fields interactively
-    fields = collect_fields()
+    if spec is not None:
+        try:
+            models = load_crud_spec(spec)
+        except ValueError as e:
+            print(f"[red]Error: {e}[/red]")
+            raise Exit(1)
+    else:
+        models = {model: None}
+
+    from volt.core.manifest import Manifest
+
+    manifest = Manifest.load(project.root)
+    defined = project.index.symbols(MODELS)
+    for name in models:
+        model_file = defined.get(name.capitalize())
+        entry = manifest.entries.get(model_file)
+        # Models volt scaffolded before are regenerated incrementally.
+        if model_file is not None and (
+            spec is None or entry is None or "/scaffold/" not in entry.template
+        ):
+            print(
+                f"[red]Error: Model '{name.capitalize()}' already exists at {model_file}[/red]"
+            )
+            raise Exit(1)
 
-    generate_crud(app_path, model, fields, config)
-    print(f"\n[bold green]✔ CRUD for {model} generated successfully![bold green]")
+    if spec is None:
+        # Collect fields interactively
+        models[model] = collect_fields()
+
+    generate_cruds(project.root, models, project.config, index=project.index)
+    print(
+        f"\n[bold green]✔ CRUD for {', '.join(models)} generated successfully![/bold green]"
+    )
     print(
         "[dim]Next Step: If using Alembic, run 'volt db revision --autogenerate' to create a migration.[/dim]"
     )
+
+
+@snapshots_app.command(
+    "refresh", help="Re-resolve the uv.lock snapshot for every feature combination."
+)
+def refresh_snapshots():
+    from volt.stacks.fastapi.dependencies import refresh_fastapi_lock_snapshots
+    from volt.core.snapshots import lock_snapshots_dir
+    from rich import print
+    from rich.markup import escape
+
+    def report(key, plan):
+        print(f"[green]✔ {key}[/green] [dim]{escape(', '.join(plan.groups))}[/dim]")
+
+    refreshed = refresh_fastapi_lock_snapshots(on_progress=report)
+    print(
+        f"\n[bold green]✔ Refreshed {len(refreshed)} snapshots in {lock_snapshots_dir()}[/bold green]"
+    )
+
+
+@snapshots_app.command("clear", help="Delete all cached uv.lock snapshots.")
+def clear_snapshots():
+    from volt.core.snapshots import clear_lock_snapshots
+    from rich import print
+
+    print(f"[green]✔ Removed {clear_lock_snapshots()} snapshots[/green]")
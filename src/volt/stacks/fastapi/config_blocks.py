@@ -47,6 +47,9 @@ DB_CONFIGS = {
     },
 }
 
+REDIS_URL = "redis://redis:6379/0"
+REDIS_SETTINGS = {"REDIS_URL": "str"}
+
 AUTH_CONFIGS = {
     "Bearer Token (Authorization Header)": True,
     "Cookie-based Authentication (HTTPOnly)": True,
@@ -107,9 +110,7 @@ def generate_auth_block(
 
 
 def generate_redis_block(env_path: Path, env_example_path: Path) -> str:
-    redis_url = "redis://redis:6379/0"
-
-    add_env_variables(env_path, {"REDIS_URL": redis_url})
+    add_env_variables(env_path, {"REDIS_URL": REDIS_URL})
     add_env_variables(env_example_path, {"REDIS_URL": None})
 
     return """
@@ -1,11 +1,29 @@
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from volt.core.dependencies import install_uv_packages, init_uv_project
+from volt.core.dependencies import (
+    DependencyPlan,
+    apply_dependency_plan,
+    declare_dev_dependencies,
+    init_uv_project,
+    run_uv,
+)
+from volt.core.snapshots import (
+    SNAPSHOT_PROJECT_NAME,
+    lock_snapshot_key,
+    read_python_version,
+    restore_lock_snapshot,
+    save_lock_snapshot,
+)
 
 STACK_DEPS = ["fastapi", "uvicorn", "pydantic-settings"]
 REDIS_DEPS = ["redis"]
 SENTRY_DEPS = ["sentry-sdk[fastapi]"]
 LOGFIRE_DEPS = ["logfire[fastapi]"]
+# Runs the tests generated with a database (tests/db/conftest.py).
+TEST_DEV_DEPS = ["pytest"]
+# Server of the production image; uvicorn[standard] brings uvloop and httptools.
+PRODUCTION_SERVER_DEPS = ["gunicorn", "uvicorn-worker", "uvicorn[standard]"]
 
 FASTAPI_DB_DEPS = {
     "sqlite": ["sqlmodel", "aiosqlite", "greenlet", "alembic"],
@@ -14,6 +32,9 @@ FASTAPI_DB_DEPS = {
     "mongodb": ["beanie"],
 }
 
+FASTAPI_DB_CHOICES = ["None", "SQLite", "PostgreSQL", "MySQL", "MongoDB"]
+OBSERVABILITY_CHOICES = ["None", "Sentry", "Logfire"]
+
 FASTAPI_AUTH_DEPS = {
     "Bearer Token (Authorization Header)": [
         "pwdlib[argon2]",
@@ -30,30 +51,100 @@ FASTAPI_AUTH_DEPS = {
 }
 
 
-def install_fastapi_dependencies(
-    dest: Path,
+def plan_fastapi_dependencies(
     db_choice: str,
     auth_choice: str,
     redis_choice: bool = False,
     observability_choice: str = "None",
-):
-    init_uv_project(dest)
-
-    install_uv_packages(STACK_DEPS, dest)
+) -> DependencyPlan:
+    plan = DependencyPlan()
+    plan.add("FastAPI", STACK_DEPS)
 
     if redis_choice:
-        install_uv_packages(REDIS_DEPS, dest)
+        plan.add("Redis", REDIS_DEPS)
 
     if observability_choice == "Sentry":
-        install_uv_packages(SENTRY_DEPS, dest)
+        plan.add("Sentry", SENTRY_DEPS)
     elif observability_choice == "Logfire":
-        install_uv_packages(LOGFIRE_DEPS, dest)
+        plan.add("Logfire", LOGFIRE_DEPS)
 
     db_key = db_choice.lower()
     if db_choice != "None" and db_key in FASTAPI_DB_DEPS:
-        deps = FASTAPI_DB_DEPS[db_key]
-        install_uv_packages(deps, dest)
+        plan.add(db_choice, FASTAPI_DB_DEPS[db_key])
+        plan.add_dev("Tests", TEST_DEV_DEPS)
 
     if auth_choice != "None" and auth_choice in FASTAPI_AUTH_DEPS:
-        deps = FASTAPI_AUTH_DEPS[auth_choice]
-        install_uv_packages(deps, dest)
+        plan.add(auth_choice, FASTAPI_AUTH_DEPS[auth_choice])
+
+    return plan
+
+
+def install_fastapi_dependencies(
+    dest: Path,
+    db_choice: str,
+    auth_choice: str,
+    redis_choice: bool = False,
+    observability_choice: str = "None",
+    use_lock_snapshot: bool = False,
+):
+    """Install the FastAPI stack into ``dest``.
+
+    With ``use_lock_snapshot`` (fresh projects only), a cached uv.lock for the
+    same package set is installed with ``uv sync --frozen``; on a cache miss
+    the packages are resolved once and the result is stored for next time.
+    """
+    plan = plan_fastapi_dependencies(
+        db_choice, auth_choice, redis_choice, observability_choice
+    )
+
+    init_uv_project(dest)
+    declare_dev_dependencies(plan.dev_packages, dest)
+    if not use_lock_snapshot:
+        apply_dependency_plan(plan, dest)
+        return
+
+    key = lock_snapshot_key(
+        plan.packages, read_python_version(dest), plan.dev_packages
+    )
+    if restore_lock_snapshot(dest, key):
+        return
+    apply_dependency_plan(plan, dest)
+    save_lock_snapshot(dest, key)
+
+
+def iter_fastapi_feature_plans():
+    for db_choice in FASTAPI_DB_CHOICES:
+        auth_choices = ["None"]
+        if db_choice != "None":
+            auth_choices += list(FASTAPI_AUTH_DEPS)
+        for auth_choice in auth_choices:
+            for redis_choice in (False, True):
+                for observability_choice in OBSERVABILITY_CHOICES:
+                    yield plan_fastapi_dependencies(
+                        db_choice, auth_choice, redis_choice, observability_choice
+                    )
+
+
+def refresh_fastapi_lock_snapshots(on_progress=None) -> list[str]:
+    """Re-resolve and store a lock snapshot for every distinct feature plan."""
+    unique_plans = {}
+    for plan in iter_fastapi_feature_plans():
+        unique_plans.setdefault(
+            (tuple(sorted(plan.packages)), tuple(sorted(plan.dev_packages))), plan
+        )
+
+    refreshed = []
+    for plan in unique_plans.values():
+        with TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir)
+            run_uv(["init", "--name", SNAPSHOT_PROJECT_NAME], dest)
+            declare_dev_dependencies(plan.dev_packages, dest)
+            run_uv(["add", "--no-sync", *plan.packages], dest)
+            key = lock_snapshot_key(
+                plan.packages, read_python_version(dest), plan.dev_packages
+            )
+            save_lock_snapshot(dest, key)
+        refreshed.append(key)
+        if on_progress:
+            on_progress(key, plan)
+    return refreshed
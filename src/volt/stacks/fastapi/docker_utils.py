@@ -23,6 +23,111 @@ ENV PATH="/app/.venv/bin:$PATH"
 CMD ["uvicorn", "--host", "0.0.0.0", "--port", "8000", "app.main:app"]
 """
 
+# Production image: dependencies and sources are compiled to bytecode in the
+# builder, and the runtime runs gunicorn (configured by gunicorn.conf.py) as
+# an unprivileged user.
+FASTAPI_PRODUCTION_DOCKERFILE = """FROM ghcr.io/astral-sh/uv:python{python_version}-bookworm-slim AS builder
+ENV UV_COMPILE_BYTECODE=1 UV_LINK_MODE=copy
+ENV UV_PYTHON_DOWNLOADS=0
+
+WORKDIR /app
+RUN --mount=type=cache,target=/root/.cache/uv \
+    --mount=type=bind,source=uv.lock,target=uv.lock \
+    --mount=type=bind,source=pyproject.toml,target=pyproject.toml \
+    uv sync --frozen --no-install-project --no-dev
+ADD . /app
+RUN --mount=type=cache,target=/root/.cache/uv \
+    uv sync --frozen --no-dev
+RUN .venv/bin/python -m compileall -q -j 0 --invalidation-mode unchecked-hash app
+
+FROM python:{python_version}-slim-bookworm
+
+RUN groupadd --system app && useradd --system --gid app --no-create-home app
+COPY --from=builder --chown=app:app /app /app
+WORKDIR /app
+
+ENV PATH="/app/.venv/bin:$PATH" \
+    PYTHONDONTWRITEBYTECODE=1 \
+    PYTHONUNBUFFERED=1
+
+USER app
+EXPOSE 8000
+
+CMD ["gunicorn", "--config", "gunicorn.conf.py", "app.main:app"]
+"""
+
+GUNICORN_CONF = '''"""Gunicorn settings of the production image (volt build --profile production).
+
+Every setting can be overridden from the environment, e.g. WEB_CONCURRENCY.
+"""
+
+import gc
+import math
+import os
+
+from uvicorn_worker import UvicornWorker
+
+
+def cpu_limit() -> int:
+    """CPUs the container may use: its cgroup CPU quota, else its CPU affinity."""
+    quota_files = (
+        ("/sys/fs/cgroup/cpu.max", None),
+        ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+    )
+    for quota_file, period_file in quota_files:
+        try:
+            with open(quota_file) as f:
+                values = f.read().split()
+            if period_file is not None:
+                with open(period_file) as f:
+                    values.append(f.read().strip())
+            quota, period = values[0], values[1]
+            if quota not in {"max", "-1"}:
+                return max(1, math.ceil(int(quota) / int(period)))
+        except (OSError, ValueError, IndexError):
+            continue
+    return len(os.sched_getaffinity(0))
+
+
+class Worker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# One event loop per available CPU.
+workers = int(os.getenv("WEB_CONCURRENCY", cpu_limit()))
+worker_class = Worker
+
+# Import the app once in the master; workers share its memory copy-on-write.
+preload_app = True
+
+# Longer than the usual 60s idle timeout of load balancers, so they close
+# idle connections first and never reuse one the server has dropped.
+keepalive = int(os.getenv("KEEPALIVE", 75))
+backlog = int(os.getenv("BACKLOG", 2048))
+timeout = int(os.getenv("TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+max_requests = int(os.getenv("MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 1000))
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "*")
+
+# Worker heartbeats go to memory instead of the container's overlay filesystem.
+worker_tmp_dir = "/dev/shm"
+accesslog = os.getenv("ACCESS_LOG") or None
+errorlog = "-"
+
+
+def when_ready(server):
+    # Keep the preloaded objects out of the collector, so collections in the
+    # workers don't touch (and copy) the pages shared with the master.
+    gc.freeze()
+'''
+
+DOCKERFILE_PROFILES = {
+    "dev": ("Dockerfile", FASTAPI_DOCKERFILE),
+    "production": ("Dockerfile.production", FASTAPI_PRODUCTION_DOCKERFILE),
+}
+
 
 def generate_docker_compose_string(
     db_choice: str,
@@ -69,3 +174,156 @@ def generate_docker_compose_string(
         sort_keys=False,
         default_flow_style=False,
     )
+
+
+def generate_tuned_compose_override(
+    db_choice: str,
+    memory_mb: int,
+    cpus: float,
+    tuned: bool = True,
+    ephemeral: bool = False,
+) -> str:
+    """Compose file layered over docker-compose.yaml for load and test stacks.
+
+    ``tuned`` sizes the database for ``memory_mb``/``cpus``, limits its
+    container to them and, for PostgreSQL, routes the app through a PgBouncer
+    in transaction mode. ``ephemeral`` keeps the database files in tmpfs.
+    """
+    from volt.stacks.fastapi.docker_config import (
+        DB_DATA_DIRS,
+        PGBOUNCER_DATABASE_URL,
+        PGBOUNCER_DOCKER,
+        TUNED_DB_COMMANDS,
+    )
+
+    services = {}
+    if db_choice in TUNED_DB_COMMANDS:
+        db = services["db"] = {}
+        if tuned:
+            db["command"] = TUNED_DB_COMMANDS[db_choice](memory_mb, cpus, ephemeral)
+            db["deploy"] = {
+                "resources": {"limits": {"cpus": f"{cpus:g}", "memory": f"{memory_mb}m"}}
+            }
+            if db_choice == "PostgreSQL":
+                # Parallel workers share memory through /dev/shm.
+                db["shm_size"] = f"{max(64, memory_mb // 4)}m"
+        if ephemeral:
+            db["tmpfs"] = [DB_DATA_DIRS[db_choice]]
+
+    if tuned and db_choice == "PostgreSQL":
+        services["pgbouncer"] = yaml.safe_load(PGBOUNCER_DOCKER)
+        # A few server connections per core keep PostgreSQL busy without
+        # contention; clients beyond that queue in PgBouncer.
+        services["pgbouncer"]["environment"].append(
+            f"DEFAULT_POOL_SIZE={max(10, round(cpus * 4))}"
+        )
+        services["app"] = {
+            "environment": {"DATABASE_URL": PGBOUNCER_DATABASE_URL},
+            "depends_on": {"pgbouncer": {"condition": "service_started"}},
+        }
+
+    return yaml.safe_dump(
+        {"services": services},
+        sort_keys=False,
+        default_flow_style=False,
+    )
+
+
+NGINX_CONF = """resolver 127.0.0.11 valid=5s ipv6=off;
+
+upstream app {
+    zone app 64k;
+    # Re-resolved as replicas come and go; a replica failing 3 requests is
+    # taken out of rotation for 10s.
+    server app:8000 resolve max_fails=3 fail_timeout=10s;
+    keepalive 32;
+    # Below uvicorn's 5s keep-alive, so the proxy never reuses a connection
+    # the app is closing.
+    keepalive_timeout 4s;
+}
+
+server {
+    listen 80;
+
+    location / {
+        proxy_pass http://app;
+        proxy_http_version 1.1;
+        proxy_set_header Connection "";
+        proxy_set_header Host $host;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+        proxy_connect_timeout 2s;
+        # A replica that is restarting or overloaded gets the request retried
+        # on another one, at most twice and within 5s.
+        proxy_next_upstream error timeout http_502 http_503;
+        proxy_next_upstream_tries 2;
+        proxy_next_upstream_timeout 5s;
+    }
+}
+"""
+
+# Probes the app from inside its own container, where Python is all there is.
+APP_HEALTHCHECK = {
+    "test": [
+        "CMD",
+        "python",
+        "-c",
+        "import urllib.request; urllib.request.urlopen('http://localhost:8000/')",
+    ],
+    "interval": "5s",
+    "timeout": "3s",
+    "retries": 5,
+    "start_period": "10s",
+}
+
+
+class _Reset(list):
+    """A ``!reset`` value, clearing what the base compose file sets."""
+
+
+class _ComposeDumper(yaml.SafeDumper):
+    pass
+
+
+_ComposeDumper.add_representer(
+    _Reset, lambda dumper, data: dumper.represent_sequence("!reset", data)
+)
+_ComposeDumper.add_representer(
+    str,
+    lambda dumper, data: dumper.represent_scalar(
+        "tag:yaml.org,2002:str", data, style="|" if "\n" in data else None
+    ),
+)
+
+
+def generate_replicas_compose_override(replicas: int) -> str:
+    """Compose file running ``replicas`` app containers behind an nginx proxy.
+
+    The proxy takes over the app's host port and only starts routing once
+    every replica passes its healthcheck.
+    """
+    services = {
+        "app": {
+            "ports": _Reset(),
+            "expose": ["8000"],
+            "healthcheck": APP_HEALTHCHECK,
+            "deploy": {"replicas": replicas},
+        },
+        "proxy": {
+            "image": "nginx:stable-alpine",
+            "ports": ["8000:80"],
+            "configs": [
+                {"source": "nginx_conf", "target": "/etc/nginx/conf.d/default.conf"}
+            ],
+            "depends_on": {"app": {"condition": "service_healthy"}},
+        },
+    }
+    # "$" starts a compose variable, "$$" is a literal one.
+    configs = {"nginx_conf": {"content": NGINX_CONF.replace("$", "$$")}}
+
+    return yaml.dump(
+        {"services": services, "configs": configs},
+        Dumper=_ComposeDumper,
+        sort_keys=False,
+        default_flow_style=False,
+    )
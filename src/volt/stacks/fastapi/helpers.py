@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from volt.core.template import copy_template
+from volt.core.tracing import traced
 from volt.stacks.constants import DB_NOSQL_MODEL, DB_SQL_MODEL
 from volt.stacks.fastapi.injectors import (
     inject_auth_routers,
@@ -11,6 +12,7 @@ from volt.stacks.fastapi.injectors import (
 )
 
 
+@traced(category="template")
 def setup_db_templates(dest: Path, db_choice: str):
     from volt.stacks.constants import DB_NOSQL_MODEL
     from volt.stacks.constants import DB_SQL_MODEL
@@ -21,10 +23,12 @@ def setup_db_templates(dest: Path, db_choice: str):
         copy_template("fastapi", "db_mongo", dest, True)
 
     if db_choice != "None":
+        copy_template("fastapi", "db_tests", dest, True)
         inject_lifespan(db_choice, dest / "app" / "main.py")
         setup_health_router(dest, db_choice)
 
 
+@traced(category="template")
 def setup_auth_templates(dest: Path, auth_choice: str, db_choice: str):
     if auth_choice == "None":
         return
@@ -41,12 +45,14 @@ def setup_auth_templates(dest: Path, auth_choice: str, db_choice: str):
         copy_template("fastapi", f"{auth_type_model}/sqlmodel", dest, True)
 
 
+@traced(category="template")
 def setup_alembic_templates(dest: Path):
     from volt.core.template import copy_template
 
     copy_template("fastapi", "alembic", dest, True)
 
 
+@traced(category="template")
 def setup_redis_templates(dest: Path):
     from volt.core.template import copy_template
     from volt.stacks.fastapi.injectors import inject_redis
@@ -0,0 +1,73 @@
+import ast
+
+from volt.core.index import IndexSource
+
+# Symbol kinds of a FastAPI project.
+MODELS = "models"
+ROUTERS = "routers"
+EXCEPTIONS = "exceptions"
+DOCUMENTS = "documents"
+
+
+def _call_name(node: ast.AST) -> str | None:
+    """The called name of a call node (``f`` in ``f()`` and ``x.f()``)."""
+    if not isinstance(node, ast.Call):
+        return None
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def scan_models(source: str) -> list[str]:
+    return [
+        node.name
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ClassDef)
+    ]
+
+
+def scan_routers(source: str) -> list[str]:
+    """Names of the routers passed to ``include_router``."""
+    return [
+        node.args[0].id
+        for node in ast.walk(ast.parse(source))
+        if _call_name(node) == "include_router"
+        and node.args
+        and isinstance(node.args[0], ast.Name)
+    ]
+
+
+def scan_exceptions(source: str) -> list[str]:
+    """Exception classes mapped in ``EXCEPTION_MAP``."""
+    for node in ast.parse(source).body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "EXCEPTION_MAP" for t in node.targets)
+            and isinstance(node.value, ast.Dict)
+        ):
+            return [key.id for key in node.value.keys if isinstance(key, ast.Name)]
+    return []
+
+
+def scan_documents(source: str) -> list[str]:
+    """Beanie documents registered with ``init_beanie``."""
+    documents = []
+    for node in ast.walk(ast.parse(source)):
+        if _call_name(node) != "init_beanie":
+            continue
+        for keyword in node.keywords:
+            if keyword.arg == "document_models" and isinstance(keyword.value, ast.List):
+                documents += [
+                    elt.id for elt in keyword.value.elts if isinstance(elt, ast.Name)
+                ]
+    return documents
+
+
+FASTAPI_INDEX_SOURCES = (
+    IndexSource(MODELS, "app/models/*.py", scan_models),
+    IndexSource(ROUTERS, "app/routers/main.py", scan_routers),
+    IndexSource(EXCEPTIONS, "app/core/exceptions.py", scan_exceptions),
+    IndexSource(DOCUMENTS, "app/core/db.py", scan_documents),
+)
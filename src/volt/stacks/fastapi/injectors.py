@@ -1,28 +1,37 @@
-import re
+import ast
 from pathlib import Path
 
 from rich import print
 
-from volt.core.injectors import replace_pattern_in_file
+from volt.core.injectors import SourceEditor
+from volt.core.tracing import traced
 from volt.stacks.constants import DB_SQL_MODEL, DB_NOSQL_MODEL
+from volt.stacks.fastapi.index import DOCUMENTS, EXCEPTIONS
 
 ASYNC_CONTEXT_IMPORT = "from contextlib import asynccontextmanager"
 
 
-def inject_lifespan_for_mongo(main_file: Path):
-    content = main_file.read_text()
-    if "lifespan=" in content:
-        return
-
-    pattern = r"app\s*=\s*FastAPI\s*\(([^)]*)\)"
-    match = re.search(pattern, content)
-    if not match:
+def find_fastapi_app(editor: SourceEditor):
+    app_stmt = editor.find_assignment("app", call="FastAPI")
+    if app_stmt is None:
         raise RuntimeError("FastAPI app instance not found in main.py")
+    return app_stmt
+
 
-    lifespan_code = """\n
-from contextlib import asynccontextmanager
-from app.core.db import init_db, close_db
+def add_lifespan(editor: SourceEditor, app_stmt, lifespan_code: str):
+    editor.add_import(ASYNC_CONTEXT_IMPORT)
+    editor.insert_before(app_stmt, lifespan_code, blank_lines=2)
+    editor.add_keyword(app_stmt.value, "lifespan", "lifespan")
+
+
+@traced(category="inject")
+def inject_lifespan_for_mongo(main_file: Path):
+    editor = SourceEditor(main_file)
+    app_stmt = find_fastapi_app(editor)
+    if editor.keyword(app_stmt.value, "lifespan"):
+        return
 
+    lifespan_code = """
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
@@ -30,40 +39,28 @@ async def lifespan(app: FastAPI):
     await close_db()
 """
 
-    new_content = re.sub(
-        pattern,
-        f"{lifespan_code}\napp = FastAPI(\\1, lifespan=lifespan)",
-        content,
-    )
-    main_file.write_text(new_content)
+    editor.add_import("from app.core.db import init_db, close_db")
+    add_lifespan(editor, app_stmt, lifespan_code)
+    editor.commit()
 
 
+@traced(category="inject")
 def inject_lifespan_for_sqlmodel(main_file: Path):
-    content = main_file.read_text()
-    if "lifespan=" in content:
+    editor = SourceEditor(main_file)
+    app_stmt = find_fastapi_app(editor)
+    if editor.keyword(app_stmt.value, "lifespan"):
         return
 
-    pattern = r"app\s*=\s*FastAPI\s*\(([^)]*)\)"
-    match = re.search(pattern, content)
-    if not match:
-        raise RuntimeError("FastAPI app instance not found in main.py")
-
-    lifespan_code = """\n
-from contextlib import asynccontextmanager
-from app.core.db import init_db
-
+    lifespan_code = """
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
     yield
 """
 
-    new_content = re.sub(
-        pattern,
-        f"{lifespan_code}\napp = FastAPI(\\1, lifespan=lifespan)",
-        content,
-    )
-    main_file.write_text(new_content)
+    editor.add_import("from app.core.db import init_db")
+    add_lifespan(editor, app_stmt, lifespan_code)
+    editor.commit()
 
 
 def inject_lifespan(db_choice: str, main_file: Path):
@@ -76,46 +73,42 @@ def inject_lifespan(db_choice: str, main_file: Path):
 
 
 def register_model_in_init_beanie(root: Path, model_name: str):
-    db_file = root / "app" / "core" / "db.py"
-    content = db_file.read_text()
+    register_models_in_init_beanie(root, [model_name])
 
-    import_stmt = (
-        f"from app.models.{model_name.lower()} import {model_name.capitalize()}"
-    )
 
-    if import_stmt not in content:
-        content = re.sub(
-            r"^(from .+|import .+)$",
-            r"\1\n" + import_stmt,
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
+@traced(category="inject")
+def register_models_in_init_beanie(root: Path, model_names: list[str], index=None):
+    """Add models to ``init_beanie(document_models=[...])`` in app/core/db.py.
 
-    pattern = r"await\s+init_beanie\s*\(\s*database\s*=\s*db\s*,\s*document_models\s*=\s*\[([^\]]*)\]\s*\)"
-    match = re.search(pattern, content, flags=re.DOTALL)
+    With a project ``index``, models it already lists as documents are skipped
+    without reading db.py.
+    """
+    if index is not None:
+        model_names = [m for m in model_names if not index.has(DOCUMENTS, m)]
+        if not model_names:
+            return
 
-    if not match:
-        db_file.write_text(content)
-        return
+    editor = SourceEditor(root / "app" / "core" / "db.py")
 
-    existing_models = match.group(1).strip()
-    if existing_models:
-        models = [m.strip() for m in existing_models.split(",") if m.strip()]
-        if model_name not in models:
-            models.append(model_name)
-        new_models = ", ".join(models)
-    else:
-        new_models = model_name
+    for model_name in model_names:
+        editor.add_import(
+            f"from app.models.{model_name.lower()} import {model_name.capitalize()}"
+        )
 
-    new_content = re.sub(
-        pattern,
-        f"await init_beanie(database=db, document_models=[{new_models}])",
-        content,
-    )
-    db_file.write_text(new_content)
+    for call in editor.find_calls("init_beanie"):
+        models = editor.keyword(call, "document_models")
+        if models is None or not isinstance(models.value, ast.List):
+            continue
+        registered = {m.id for m in models.value.elts if isinstance(m, ast.Name)}
+        for model_name in model_names:
+            if model_name not in registered:
+                editor.append_element(models.value, model_name)
+                registered.add(model_name)
+
+    editor.commit()
 
 
+@traced(category="inject")
 def setup_health_router(project_path: Path, db_choice: str):
     routers_dir = project_path / "app" / "routers"
     health_file = routers_dir / "health.py"
@@ -134,23 +127,7 @@ async def health_check():
 """
         health_file.write_text(health_code)
 
-    main_content = routers_main.read_text()
-    if "from app.routers.health import router as health_router" not in main_content:
-        import_line = "from app.routers.health import router as health_router"
-        if "from fastapi import APIRouter" in main_content:
-            main_content = main_content.replace(
-                "from fastapi import APIRouter",
-                f"from fastapi import APIRouter\n{import_line}",
-            )
-        else:
-            main_content = f"{import_line}\n" + main_content
-
-        if "api_router.include_router(health_router)" not in main_content:
-            main_content = main_content.replace(
-                "api_router = APIRouter()",
-                "api_router = APIRouter()\napi_router.include_router(health_router)",
-            )
-        routers_main.write_text(main_content)
+    include_health_router(routers_main)
 
     content = health_file.read_text()
     if "async def database_health" in content:
@@ -190,6 +167,7 @@ async def database_health(session: AsyncSession = Depends(get_session)):
         health_file.write_text(content.strip() + "\n" + db_health)
 
 
+@traced(category="inject")
 def inject_redis_healthcheck(project_path: Path):
     health_file = project_path / "app" / "routers" / "health.py"
     if not health_file.exists():
@@ -210,33 +188,55 @@ async def redis_health(redis=Depends(get_redis)):
     health_file.write_text(content.strip() + "\n" + redis_health)
 
 
-def inject_auth_routers(routers_file: Path):
-    new_router_code = """api_router = APIRouter()
-api_router.include_router(auth_router)
-api_router.include_router(user_router)
-"""
+@traced(category="inject")
+def include_health_router(routers_file: Path):
+    editor = SourceEditor(routers_file)
+    router_stmt = editor.find_assignment("api_router", call="APIRouter")
+    import_line = "from app.routers.health import router as health_router"
+    if editor.has_import(import_line) or router_stmt is None:
+        return
 
-    content = routers_file.read_text()
+    editor.add_import(import_line)
+    if not is_router_included(editor, "health_router"):
+        editor.insert_after(router_stmt, "api_router.include_router(health_router)")
+    editor.commit()
 
-    if "app.routers.auth.routes" in content and "app.routers.users.routes" in content:
+
+def is_router_included(editor: SourceEditor, router_name: str) -> bool:
+    return any(
+        call.args and isinstance(call.args[0], ast.Name) and call.args[0].id == router_name
+        for call in editor.find_calls("include_router")
+    )
+
+
+@traced(category="inject")
+def inject_auth_routers(routers_file: Path):
+    editor = SourceEditor(routers_file)
+    auth_import = "from app.routers.auth.routes import router as auth_router"
+    users_import = "from app.routers.users.routes import router as user_router"
+
+    if editor.has_import(auth_import) and editor.has_import(users_import):
         print("[yellow]Routers already injected, skipping.[/yellow]")
         return
 
-    pattern = r"api_router\s*=\s*APIRouter\(\)"
-    import_pattern = r"from fastapi import APIRouter"
-    if import_pattern not in content:
+    router_stmt = editor.find_assignment("api_router", call="APIRouter")
+    if router_stmt is None:
         print("[yellow]APIRouter not found, skipping.[/yellow]")
         return
 
-    import_code = """from fastapi import APIRouter
-from app.routers.auth.routes import router as auth_router
-from app.routers.users.routes import router as user_router
-"""
-
-    replace_pattern_in_file(routers_file, pattern, new_router_code.strip())
-    replace_pattern_in_file(routers_file, import_pattern, import_code.strip())
+    editor.add_import(auth_import)
+    editor.add_import(users_import)
+    editor.insert_after(
+        router_stmt,
+        """
+api_router.include_router(auth_router)
+api_router.include_router(user_router)
+""",
+    )
+    editor.commit()
 
 
+@traced(category="inject")
 def inject_users_model(models_file: Path, db_choice: str):
     if db_choice == "MongoDB":
         register_model_in_init_beanie(models_file.parent.parent.parent, "User")
@@ -272,31 +272,26 @@ class User(SQLModel, table=True):
     models_file.write_text(new_model_code)
 
 
+@traced(category="inject")
 def inject_redis(main_file: Path):
-    content = main_file.read_text()
-    if "init_redis" in content:
+    editor = SourceEditor(main_file)
+    if editor.find_calls("init_redis"):
         return
 
-    import_code = "from app.core.redis import init_redis, close_redis"
-    if ASYNC_CONTEXT_IMPORT not in content:
-        content = re.sub(
-            r"(from fastapi import FastAPI[^\n]*)",
-            r"\1\n" + ASYNC_CONTEXT_IMPORT,
-            content,
-        )
-
-    if import_code not in content:
-        content = re.sub(
-            r"(from fastapi import FastAPI)", r"\1\n" + import_code, content
-        )
-
-    if "async def lifespan(app: FastAPI):" in content:
-        content = re.sub(
-            r"(async def lifespan\(app: FastAPI\):)",
-            r"\1\n    await init_redis()",
-            content,
+    editor.add_import("from app.core.redis import init_redis, close_redis")
+
+    lifespan = editor.find_function("lifespan")
+    if lifespan is not None:
+        editor.insert_before(lifespan.body[0], "await init_redis()")
+        yield_stmt = next(
+            (
+                stmt
+                for stmt in lifespan.body
+                if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Yield)
+            ),
+            lifespan.body[-1],
         )
-        content = re.sub(r"(yield)", r"\1\n    await close_redis()", content)
+        editor.insert_after(yield_stmt, "await close_redis()")
     else:
         lifespan_code = """
 @asynccontextmanager
@@ -305,24 +300,50 @@ async def lifespan(app: FastAPI):
     yield
     await close_redis()
 """
-        pattern = r"app\s*=\s*FastAPI\s*\(([^)]*)\)"
-        content = re.sub(
-            pattern,
-            f"{lifespan_code}\napp = FastAPI(\\1, lifespan=lifespan)",
-            content,
-        )
+        add_lifespan(editor, find_fastapi_app(editor), lifespan_code)
+
+    editor.commit()
+
+
+@traced(category="inject")
+def inject_settings(config_file: Path, fields: dict[str, str]):
+    """Add ``fields`` (name to annotation) to the ``Settings`` class, once."""
+    editor = SourceEditor(config_file)
+    settings = next(
+        (
+            stmt
+            for stmt in editor.module.body
+            if isinstance(stmt, ast.ClassDef) and stmt.name == "Settings"
+        ),
+        None,
+    )
+    if settings is None:
+        raise RuntimeError(f"Settings class not found in {config_file}")
+
+    defined = {
+        stmt.target.id
+        for stmt in settings.body
+        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)
+    }
+    missing = [f"{name}: {annotation}" for name, annotation in fields.items() if name not in defined]
+    if not missing:
+        return
 
-    main_file.write_text(content)
+    last = settings.body[-1]
+    editor.insert_after(
+        last,
+        "\n".join(missing),
+        blank_lines=1 if isinstance(last, (ast.FunctionDef, ast.AsyncFunctionDef)) else 0,
+    )
+    editor.commit()
 
 
+@traced(category="inject")
 def inject_sentry(main_file: Path):
-    content = main_file.read_text()
-    if "sentry_sdk.init" in content:
+    editor = SourceEditor(main_file)
+    if editor.find_calls("sentry_sdk.init"):
         return
 
-    import_code = """import sentry_sdk
-from app.core.config import settings"""
-
     init_code = """
 if settings.SENTRY_DSN:
     sentry_sdk.init(
@@ -334,42 +355,34 @@ if settings.SENTRY_DSN:
     )
 """
 
-    if "import sentry_sdk" not in content:
-        content = import_code + "\n" + content
-
-    pattern = r"(app\s*=\s*FastAPI\s*\([^)]*\))"
-    content = re.sub(pattern, r"\1\n" + init_code, content)
-
-    main_file.write_text(content)
+    editor.add_import("import sentry_sdk")
+    editor.add_import("from app.core.config import settings")
+    editor.insert_after(find_fastapi_app(editor), init_code, blank_lines=1)
+    editor.commit()
 
 
+@traced(category="inject")
 def inject_logfire(main_file: Path):
-    content = main_file.read_text()
-    if "logfire.instrument_fastapi" in content:
+    editor = SourceEditor(main_file)
+    if editor.find_calls("logfire.instrument_fastapi"):
         return
 
-    import_code = """import logfire
-from app.core.config import settings"""
-
     init_code = """
 if settings.LOGFIRE_TOKEN:
     logfire.configure(token=settings.LOGFIRE_TOKEN)
     logfire.instrument_fastapi(app)
 """
 
-    if "import logfire" not in content:
-        content = import_code + "\n" + content
-
-    pattern = r"(app\s*=\s*FastAPI\s*\([^)]*\))"
-    content = re.sub(pattern, r"\1\n" + init_code, content)
-
-    main_file.write_text(content)
+    editor.add_import("import logfire")
+    editor.add_import("from app.core.config import settings")
+    editor.insert_after(find_fastapi_app(editor), init_code, blank_lines=1)
+    editor.commit()
 
 
+@traced(category="inject")
 def setup_exception_infrastructure(app_path: Path):
     """Ensures exceptions.py exists and is registered in main.py."""
-    from volt.core.template import TEMPLATES_ROOT
-    import shutil
+    from volt.core.template import TEMPLATES_ROOT, read_template_text
 
     exception_path = app_path / "app" / "core" / "exceptions.py"
     main_file = app_path / "app" / "main.py"
@@ -381,63 +394,49 @@ def setup_exception_infrastructure(app_path: Path):
         template_path = (
             TEMPLATES_ROOT / "fastapi" / "base" / "app" / "core" / "exceptions.py"
         )
-        shutil.copy(template_path, exception_path)
+        exception_path.write_text(read_template_text(template_path))
 
     # 2. Ensure app/main.py calls setup_exception_handlers
     if main_file.exists():
-        content = main_file.read_text()
-        import_line = "from app.core.exceptions import setup_exception_handlers"
-        setup_call = "setup_exception_handlers(app)"
-
-        if import_line not in content:
-            lines = content.splitlines()
-            last_import_idx = 0
-            for i, line in enumerate(lines):
-                if line.startswith("from ") or line.startswith("import "):
-                    last_import_idx = i
-            lines.insert(last_import_idx + 1, import_line)
-            content = "\n".join(lines) + "\n"
-
-        if setup_call not in content:
-            content = re.sub(
-                r"(app\s*=\s*FastAPI\(.*?\))",
-                r"\1\n\n" + setup_call,
-                content,
-                flags=re.DOTALL,
+        editor = SourceEditor(main_file)
+        editor.add_import("from app.core.exceptions import setup_exception_handlers")
+        if not editor.find_calls("setup_exception_handlers"):
+            editor.insert_after(
+                find_fastapi_app(editor), "setup_exception_handlers(app)", blank_lines=1
             )
-        main_file.write_text(content)
+        editor.commit()
 
 
+@traced(category="inject")
 def add_exception_to_map(
     app_path: Path,
     exception_class_name: str,
     status_code: int,
     exception_definition: str = None,
+    index=None,
 ):
     """Adds an exception class and its mapping to app/core/exceptions.py."""
+    if index is not None and index.has(EXCEPTIONS, exception_class_name):
+        return
+
     exception_path = app_path / "app" / "core" / "exceptions.py"
     if not exception_path.exists():
         setup_exception_infrastructure(app_path)
 
-    content = exception_path.read_text()
+    editor = SourceEditor(exception_path)
+    map_stmt = editor.find_assignment("EXCEPTION_MAP")
+    if map_stmt is None or not isinstance(map_stmt.value, ast.Dict):
+        raise RuntimeError(f"EXCEPTION_MAP not found in {exception_path}")
 
     # Add class definition if provided and not present
-    if exception_definition and exception_class_name not in content:
-        # Find the line before EXCEPTION_MAP
-        content = re.sub(
-            r"EXCEPTION_MAP\s*=\s*{",
-            f"{exception_definition}\n\nEXCEPTION_MAP = {{",
-            content,
-        )
+    if exception_definition and not editor.defines(exception_class_name):
+        editor.insert_before(map_stmt, exception_definition, blank_lines=2)
 
     # Add to EXCEPTION_MAP if not present
-    mapping_entry = f"{exception_class_name}: {status_code},"
-    if mapping_entry not in content:
-        content = re.sub(
-            r"EXCEPTION_MAP\s*=\s*{([^}]*)}",
-            f"EXCEPTION_MAP = {{\\1    {mapping_entry}\n}}",
-            content,
-            flags=re.DOTALL,
+    mapped = {k.id for k in map_stmt.value.keys if isinstance(k, ast.Name)}
+    if exception_class_name not in mapped:
+        editor.append_element(
+            map_stmt.value, f"{exception_class_name}: {status_code}", multiline=True
         )
 
-    exception_path.write_text(content)
+    editor.commit()
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import tomli
+
+from volt.stacks.constants import DB_SQL_MODEL
+from volt.stacks.fastapi.dependencies import (
+    FASTAPI_AUTH_DEPS,
+    FASTAPI_DB_CHOICES,
+    OBSERVABILITY_CHOICES,
+)
+
+AUTH_CHOICES = ["None", *FASTAPI_AUTH_DEPS]
+
+# Same answers the interactive prompts default to.
+FASTAPI_FEATURE_DEFAULTS = {
+    "database": "None",
+    "auth": "None",
+    "alembic": True,
+    "redis": False,
+    "observability": "None",
+}
+
+
+def normalize_fastapi_features(features: dict) -> dict:
+    """Validate a ``VoltConfig.features`` mapping and fill in the defaults.
+
+    Raises ``ValueError`` for unknown keys or values and for combinations the
+    interactive prompts would never produce.
+    """
+    unknown = set(features) - set(FASTAPI_FEATURE_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+
+    resolved = {**FASTAPI_FEATURE_DEFAULTS, **features}
+    for key, choices in (
+        ("database", FASTAPI_DB_CHOICES),
+        ("auth", AUTH_CHOICES),
+        ("observability", OBSERVABILITY_CHOICES),
+    ):
+        if resolved[key] not in choices:
+            raise ValueError(
+                f"Invalid {key} '{resolved[key]}' (expected one of: {', '.join(choices)})"
+            )
+    for key in ("alembic", "redis"):
+        if not isinstance(resolved[key], bool):
+            raise ValueError(f"'{key}' must be true or false")
+
+    if resolved["database"] == "None" and resolved["auth"] != "None":
+        raise ValueError("Authentication requires a database")
+    if resolved["database"] not in DB_SQL_MODEL:
+        if features.get("alembic"):
+            raise ValueError("Alembic requires a SQL database")
+        resolved["alembic"] = False
+    return resolved
+
+
+def read_fastapi_preset(path: Path) -> dict:
+    """Read the features of a preset file as written, without defaults.
+
+    The file holds ``VoltConfig.features`` keys, either at the top level or
+    in a ``[features]`` table, so an existing project's volt.toml works too.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomli.load(f)
+    except (OSError, tomli.TOMLDecodeError) as e:
+        raise ValueError(f"Could not read preset {path}: {e}") from e
+    return dict(data.get("features", data))
+
+
+def load_fastapi_preset(path: Path) -> dict:
+    """Read and validate the features of a preset file, defaults filled in."""
+    features = read_fastapi_preset(path)
+    try:
+        return normalize_fastapi_features(features)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+
+def load_fastapi_batch(path: Path) -> list[tuple[str, dict]]:
+    """Read a batch file of ``[[projects]]`` tables.
+
+    Each project has a ``name`` and either inline features, a ``preset`` path
+    (relative to the batch file), or both, with inline keys winning.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomli.load(f)
+    except (OSError, tomli.TOMLDecodeError) as e:
+        raise ValueError(f"Could not read batch file {path}: {e}") from e
+
+    projects = data.get("projects")
+    if not isinstance(projects, list) or not projects:
+        raise ValueError(f"{path} must define at least one [[projects]] table")
+
+    batch = []
+    seen = set()
+    for entry in projects:
+        entry = dict(entry)
+        name = entry.pop("name", None)
+        if not name:
+            raise ValueError(f"{path}: every project needs a 'name'")
+        if name in seen:
+            raise ValueError(f"{path}: project '{name}' is listed more than once")
+        seen.add(name)
+
+        features = {}
+        preset = entry.pop("preset", None)
+        if preset:
+            # Raw keys, so defaults (alembic on) never override inline choices.
+            features.update(read_fastapi_preset(path.parent / preset))
+        features.update(entry)
+        try:
+            batch.append((name, normalize_fastapi_features(features)))
+        except ValueError as e:
+            raise ValueError(f"{path}: project '{name}': {e}") from e
+    return batch
@@ -1,4 +1,3 @@
-import shutil
 from pathlib import Path
 from typing import List, Dict
 from rich.console import Console
@@ -6,23 +5,41 @@ from rich.table import Table
 from rich import print
 from typer import Exit
 import questionary
-import re
 from volt.core.config import VoltConfig
+from volt.core.index import SymbolIndex
+from volt.core.injectors import SourceEditor
+from volt.core.manifest import (
+    STATUS_MODIFIED,
+    STATUS_NEW,
+    STATUS_STALE,
+    STATUS_UNCHANGED,
+    Manifest,
+    input_hash,
+    record_generated,
+)
+from volt.core.render import RenderTree, load_template_file
+from volt.core.timing import StageTimings
+from volt.core.tracing import traced
 from volt.stacks.constants import get_db_path, DB_MONGO_MODEL
+from volt.stacks.fastapi.index import EXCEPTIONS, FASTAPI_INDEX_SOURCES, ROUTERS
 from volt.stacks.fastapi.injectors import (
-    register_model_in_init_beanie,
+    is_router_included,
+    register_models_in_init_beanie,
     setup_exception_infrastructure,
     add_exception_to_map,
 )
 
 from volt.core.template import (
     TEMPLATES_ROOT,
+    copy_template_file,
     inject_variables_in_file,
     format_with_black,
 )
 
 console = Console()
 
+FIELD_TYPES = ["str", "int", "float", "bool", "datetime", "date"]
+
 
 def collect_fields() -> List[Dict[str, str]]:
     """Interactively collect table columns from the user."""
@@ -60,7 +77,7 @@ def collect_fields() -> List[Dict[str, str]]:
                 continue
             type_choice = questionary.select(
                 "Field type:",
-                choices=["str", "int", "float", "bool", "datetime", "date"],
+                choices=FIELD_TYPES,
             ).ask()
             required = questionary.select(
                 "Is it required?", choices=["Yes", "No"]
@@ -83,6 +100,72 @@ def collect_fields() -> List[Dict[str, str]]:
             raise Exit()
 
 
+def load_crud_spec(spec_path: Path) -> Dict[str, List[Dict[str, str]]]:
+    """Read models and their fields from a YAML spec.
+
+    Fields map to a type, or to ``{type, required}`` for optional ones::
+
+        models:
+          Item:
+            title: str
+            price: float
+            description: {type: str, required: false}
+
+    Returns the same field dicts that :func:`collect_fields` produces.
+    """
+    import yaml
+
+    try:
+        data = yaml.safe_load(spec_path.read_text()) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {spec_path}: {e}") from e
+
+    models = data.get("models") if isinstance(data, dict) else None
+    if not isinstance(models, dict) or not models:
+        raise ValueError(f"{spec_path} must define a non-empty 'models' mapping")
+
+    spec = {}
+    seen = set()
+    for model_name, model_fields in models.items():
+        model_name = str(model_name)
+        if not model_name.isidentifier():
+            raise ValueError(f"Invalid model name '{model_name}'")
+        if model_name.lower() in seen:
+            raise ValueError(f"Model '{model_name}' is defined more than once")
+        seen.add(model_name.lower())
+
+        if not isinstance(model_fields, dict) or not model_fields:
+            raise ValueError(f"Model '{model_name}' must define at least one field")
+
+        fields = []
+        for name, definition in model_fields.items():
+            if not str(name).isidentifier():
+                raise ValueError(f"Invalid field name '{model_name}.{name}'")
+            if isinstance(definition, dict):
+                ptype = definition.get("type")
+                required = definition.get("required", True)
+            else:
+                ptype, required = definition, True
+            if ptype not in FIELD_TYPES:
+                raise ValueError(
+                    f"Field '{model_name}.{name}' has unsupported type '{ptype}' "
+                    f"(expected one of: {', '.join(FIELD_TYPES)})"
+                )
+            fields.append(
+                {"name": str(name), "type": ptype, "required": "Yes" if required else "No"}
+            )
+        spec[model_name] = fields
+
+    return spec
+
+
+def pluralize(model_lower: str) -> str:
+    # Simple pluralization (can be improved)
+    if model_lower.endswith("y"):
+        return model_lower[:-1] + "ies"
+    return model_lower + "s"
+
+
 def generate_crud(
     app_path: Path,
     model_name: str,
@@ -90,13 +173,129 @@ def generate_crud(
     volt_config: VoltConfig,
 ) -> None:
     """Generate CRUD boilerplate for a given model with custom fields."""
-    model_lower = model_name.lower()
+    generate_cruds(app_path, {model_name: fields}, volt_config)
 
-    # Simple pluralization (can be improved)
-    if model_lower.endswith("y"):
-        model_plural = model_lower[:-1] + "ies"
-    else:
-        model_plural = model_lower + "s"
+
+def generate_cruds(
+    app_path: Path,
+    models: Dict[str, List[Dict[str, str]]],
+    volt_config: VoltConfig,
+    timings: StageTimings | None = None,
+    index: SymbolIndex | None = None,
+) -> None:
+    """Generate CRUD boilerplate for several models in a single pass.
+
+    Every model's files are staged first; routers, exceptions and beanie
+    models are then registered with one edit per file, the new code is
+    formatted once and the project is written once.
+
+    Models that were generated before are regenerated incrementally: the
+    project manifest tells which files are out of date with their template
+    or fields, and only those are rewritten unless the user modified them.
+    The project's symbol ``index`` tells which registrations already exist
+    and is updated with the written files.
+    """
+    # Stage every new file and registration edit in memory, then write once.
+    timings = timings or StageTimings()
+    project_path = app_path
+    tree = RenderTree(base=project_path)
+    app_path = tree.root
+    if index is None:
+        index = SymbolIndex.load(project_path, FASTAPI_INDEX_SOURCES)
+
+    db_path = get_db_path(volt_config.features.get("database"))
+    scaffold_root = TEMPLATES_ROOT / "fastapi" / "scaffold" / db_path / "app"
+
+    manifest = Manifest.load(app_path)
+    inputs = {}
+    routers = []
+    with timings.stage("render templates"):
+        for model_name, fields in models.items():
+            model_plural = stage_crud_files(
+                app_path,
+                scaffold_root,
+                model_name,
+                fields,
+                manifest,
+                inputs,
+                verbose=len(models) == 1,
+            )
+            routers.append((model_name, model_plural))
+
+    with timings.stage("register"):
+        register_routers(app_path, routers, index)
+        register_exception(app_path, index)
+        if volt_config.features.get("auth") != "None":
+            for model_name, model_plural in routers:
+                # Routers left as they were already carry the dependency.
+                routes = app_path / "app" / "routers" / model_plural / "routes.py"
+                if routes.as_posix() in inputs:
+                    register_auth(app_path, model_name, model_plural)
+        if volt_config.features.get("database") == DB_MONGO_MODEL:
+            register_models_in_init_beanie(
+                app_path, [model_name.capitalize() for model_name in models], index
+            )
+
+    timings.timed("format", format_with_black, app_path)
+    record_generated(tree, inputs)
+    written = timings.timed("write files", tree.write, project_path)
+    index.update(written)
+
+
+# Modules shared by every generated model, with the names generated code
+# imports from them.
+SHARED_MODULES = {
+    "repositories/base.py": ("BaseRepository",),
+    "services/base.py": ("BaseService",),
+    "repositories/pagination.py": ("CursorPaginationMixin", "InvalidCursorError"),
+    "schemas/pagination.py": ("Page",),
+}
+
+
+def require_shared_names(path: Path, key: str, names: tuple[str, ...]) -> None:
+    """Stop when a kept shared module lacks names the generated code imports."""
+    import ast
+
+    defined = set()
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            defined.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            defined.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            defined.update(t.id for t in targets if isinstance(t, ast.Name))
+
+    missing = [name for name in names if name not in defined]
+    if missing:
+        print(
+            f"[red]Error: {key} was not generated by this version of Volt and lacks "
+            f"{', '.join(missing)}, which the generated code imports.[/red]"
+        )
+        print("[dim]Add them to it, or move it away to have it generated, then re-run.[/dim]")
+        raise Exit(1)
+
+
+@traced(category="template")
+def stage_crud_files(
+    app_path: Path,
+    scaffold_root: Path,
+    model_name: str,
+    fields: List[Dict[str, str]],
+    manifest: Manifest | None = None,
+    inputs: Dict[str, str] | None = None,
+    verbose: bool = True,
+) -> str:
+    """Copy and render one model's scaffold files; returns the model's plural.
+
+    Files the manifest reports as up to date or modified by the user are
+    skipped. The input hash of every staged file is collected in ``inputs``.
+    Unless ``verbose``, a single summary line is printed for the model.
+    """
+    manifest = manifest or Manifest()
+    inputs = inputs if inputs is not None else {}
+    model_lower = model_name.lower()
+    model_plural = pluralize(model_lower)
 
     model_fields_code = ""
     schema_base_fields = ""
@@ -129,10 +328,6 @@ def generate_crud(
         ),
     }
 
-    db_path = get_db_path(volt_config.features.get("database"))
-
-    scaffold_root = TEMPLATES_ROOT / "fastapi" / "scaffold" / db_path / "app"
-
     files_to_generate = {
         scaffold_root
         / "models"
@@ -183,12 +378,45 @@ def generate_crud(
         / "app"
         / "services"
         / "base.py",
+        scaffold_root
+        / "repositories"
+        / "pagination.py": app_path
+        / "app"
+        / "repositories"
+        / "pagination.py",
+        scaffold_root
+        / "schemas"
+        / "pagination.py": app_path
+        / "app"
+        / "schemas"
+        / "pagination.py",
     }
 
-    for src, dest in files_to_generate.items():
-        if dest.exists() and dest.stem == "base":
+    staged = 0
+    # Shared modules first, so a project's unusable one stops the command early.
+    for src, dest in sorted(
+        files_to_generate.items(),
+        key=lambda item: f"{item[1].parent.name}/{item[1].name}" not in SHARED_MODULES,
+    ):
+        key = dest.as_posix()
+        file_inputs = input_hash(load_template_file(src), variables)
+        status = manifest.status(key, file_inputs, dest)
+        shared = SHARED_MODULES.get(f"{dest.parent.name}/{dest.name}")
+        if key in inputs:
+            continue
+        elif shared is not None and (
+            status in (STATUS_UNCHANGED, STATUS_MODIFIED)
+            or (status == STATUS_NEW and dest.exists())
+        ):
+            # The project's own version is kept, but generated code needs it.
+            require_shared_names(dest, key, shared)
             continue
-        elif dest.exists():
+        elif status == STATUS_UNCHANGED:
+            continue
+        elif status == STATUS_MODIFIED:
+            print(f"[yellow]⚠ Skipped {key} (modified since it was generated)[/yellow]")
+            continue
+        elif status == STATUS_NEW and dest.exists():
             print(f"{dest} already exists")
             raise Exit(1)
 
@@ -197,22 +425,42 @@ def generate_crud(
         if not init_file.exists():
             init_file.touch()
 
-        shutil.copy(src, dest)
+        copy_template_file(src, dest)
         inject_variables_in_file(dest, variables)
-        print(f"[green]✔ Created {dest.relative_to(app_path)}[/green]")
-
-    register_router(app_path, model_name, model_plural)
-    register_exception(app_path)
-    if volt_config.features.get("auth") != "None":
-        register_auth(app_path, model_name, model_plural)
-    if volt_config.features.get("database") == DB_MONGO_MODEL:
-        register_model_in_init_beanie(app_path, model_name.capitalize())
+        inputs[key] = file_inputs
+        staged += 1
+        if verbose:
+            action = "Updated" if status == STATUS_STALE else "Created"
+            print(f"[green]✔ {action} {dest.relative_to(app_path)}[/green]")
 
-    format_with_black(app_path)
+    if not verbose and staged:
+        print(f"[green]✔ Generated {model_name} ({staged} files)[/green]")
+    return model_plural
 
 
 def register_router(app_path: Path, model_name: str, model_plural: str) -> None:
     """Inject router registration into app/routers/main.py."""
+    register_routers(app_path, [(model_name, model_plural)])
+
+
+@traced(category="inject")
+def register_routers(
+    app_path: Path, routers: List[tuple[str, str]], index: SymbolIndex | None = None
+) -> None:
+    """Inject several router registrations into app/routers/main.py at once.
+
+    Routers the project ``index`` lists as included are skipped, and the file
+    isn't read at all when there is nothing left to register.
+    """
+    if index is not None:
+        routers = [
+            (model_name, model_plural)
+            for model_name, model_plural in routers
+            if not index.has(ROUTERS, f"{model_name.lower()}_router")
+        ]
+        if not routers:
+            return
+
     main_router_path = app_path / "app" / "routers" / "main.py"
     if not main_router_path.exists():
         print(
@@ -220,47 +468,47 @@ def register_router(app_path: Path, model_name: str, model_plural: str) -> None:
         )
         return
 
-    model_lower = model_name.lower()
-    content = main_router_path.read_text()
-
-    import_line = f"from app.routers.{model_plural}.routes import router as {model_lower}_router\n"
-    registration_line = f'api_router.include_router({model_lower}_router, prefix="/{model_plural}", tags=["{model_plural}"])\n'
-
-    if import_line not in content:
-        lines = content.splitlines()
-        last_import_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("from ") or line.startswith("import "):
-                last_import_idx = i
-        lines.insert(last_import_idx + 1, import_line.strip())
-        content = "\n".join(lines) + "\n"
+    editor = SourceEditor(main_router_path)
 
-    if registration_line not in content:
-        content += registration_line
+    for model_name, model_plural in routers:
+        model_lower = model_name.lower()
+        editor.add_import(
+            f"from app.routers.{model_plural}.routes import router as {model_lower}_router"
+        )
+        if not is_router_included(editor, f"{model_lower}_router"):
+            editor.append(
+                f'api_router.include_router({model_lower}_router, prefix="/{model_plural}", tags=["{model_plural}"])'
+            )
 
-    main_router_path.write_text(content)
+    editor.commit()
     print(
-        f"[green]✔ Registered router in {main_router_path.relative_to(app_path)}[/green]"
+        f"[green]✔ Registered {len(routers)} router(s) in {main_router_path.relative_to(app_path)}[/green]"
     )
 
 
+@traced(category="inject")
 def register_auth(app_path: Path, model_name: str, model_plural: str) -> None:
     """Inject router registration into app/routers/main.py."""
     router_path = app_path / "app" / "routers" / model_plural / "routes.py"
 
-    content = router_path.read_text()
-    content = re.sub(
-        r"router\s*=\s*APIRouter\s*\((.*?)\)",
-        r"router = APIRouter(dependencies=[Depends(get_current_active_user)])",
-        content,
-    )
-    router_path.write_text(
-        "from app.dependencies.auth import get_current_active_user\n" + content
+    editor = SourceEditor(router_path)
+    router_stmt = editor.find_assignment("router", call="APIRouter")
+    if router_stmt is None or editor.keyword(router_stmt.value, "dependencies"):
+        return
+
+    editor.add_import("from app.dependencies.auth import get_current_active_user")
+    editor.add_keyword(
+        router_stmt.value, "dependencies", "[Depends(get_current_active_user)]"
     )
+    editor.commit()
 
 
-def register_exception(app_path: Path) -> None:
+@traced(category="inject")
+def register_exception(app_path: Path, index: SymbolIndex | None = None) -> None:
     """Inject exception registration into app/core/exceptions.py."""
+    if index is not None and index.has(EXCEPTIONS, "NotFoundError"):
+        return
+
     setup_exception_infrastructure(app_path)
 
     not_found_exception = """
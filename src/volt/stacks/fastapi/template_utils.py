@@ -3,7 +3,6 @@ from pathlib import Path
 from volt.core.template import (
     copy_template,
     inject_variables_in_file,
-    format_with_black,
 )
 from .config_blocks import generate_db_block, generate_auth_block
 
@@ -42,8 +41,6 @@ def prepare_fastapi_template(
         },
     )
 
-    format_with_black(dest)
-
 
 def copy_fastapi_base_template(dest: Path) -> None:
     copy_template("fastapi", "base", dest, True)
@@ -0,0 +1,123 @@
+"""__MESSAGE__
+
+Revision ID: __REVISION__
+Revises: __DOWN_REVISION__
+Create Date: __CREATE_DATE__
+
+Data migration: walks "__TABLE_NAME__" in batches of BATCH_SIZE rows, in order
+of "__KEY_COLUMN__", and commits every batch on its own, so no transaction
+stays open for long. The last committed key is kept in PROGRESS_TABLE; after
+an interruption, running the upgrade again resumes from there. A batch can
+be replayed after a crash, so keep backfill_batch() idempotent.
+"""
+import datetime
+import os
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "__REVISION__"
+down_revision: Union[str, None] = __DOWN_REVISION_REPR__
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "__TABLE_NAME__"
+KEY_COLUMN = "__KEY_COLUMN__"
+BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", __BATCH_SIZE__))
+# Seconds to sleep between batches, to leave room for other writes and replicas.
+PAUSE = float(os.getenv("BACKFILL_PAUSE", 0))
+PROGRESS_TABLE = "volt_backfill_progress"
+PROGRESS_EVERY = 5.0
+
+progress = sa.Table(
+    PROGRESS_TABLE,
+    sa.MetaData(),
+    sa.Column("revision", sa.String(32), primary_key=True),
+    sa.Column("last_key", sa.String(255), nullable=False),
+    sa.Column("rows", sa.BigInteger(), nullable=False),
+)
+
+
+def backfill_batch(connection: sa.Connection, keys: list) -> None:
+    """Update the rows whose KEY_COLUMN is in ``keys``."""
+__BACKFILL_BODY__
+
+
+def parse_key(column: sa.Column, value: str):
+    """Read back a key saved as text, as the Python type of its column."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (datetime.datetime, datetime.date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def save_progress(connection: sa.Connection, last_key, rows: int) -> None:
+    values = {"last_key": str(last_key), "rows": rows}
+    updated = connection.execute(
+        progress.update().where(progress.c.revision == revision).values(**values)
+    )
+    if updated.rowcount == 0:
+        connection.execute(progress.insert().values(revision=revision, **values))
+
+
+def upgrade() -> None:
+    # Every statement below commits on its own.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        progress.create(connection, checkfirst=True)
+        # Reflected, so the saved key is read back and bound with its real type.
+        table = sa.Table(
+            TABLE_NAME, sa.MetaData(), autoload_with=connection, include_columns=[KEY_COLUMN]
+        )
+        key = table.c[KEY_COLUMN]
+
+        saved = connection.execute(
+            sa.select(progress.c.last_key, progress.c.rows).where(
+                progress.c.revision == revision
+            )
+        ).first()
+        last_key = parse_key(key, saved.last_key) if saved else None
+        rows = saved.rows if saved else 0
+        if saved:
+            print(f"Resuming {TABLE_NAME} after {KEY_COLUMN}={last_key} ({rows} rows done)")
+
+        start = reported = time.monotonic()
+        done = 0
+        while True:
+            query = sa.select(key).order_by(key).limit(BATCH_SIZE)
+            if last_key is not None:
+                query = query.where(key > last_key)
+            keys = connection.execute(query).scalars().all()
+            if not keys:
+                break
+
+            backfill_batch(connection, keys)
+            last_key = keys[-1]
+            rows += len(keys)
+            done += len(keys)
+            save_progress(connection, last_key, rows)
+
+            now = time.monotonic()
+            if now - reported >= PROGRESS_EVERY:
+                rate = done / (now - start)
+                print(f"{TABLE_NAME}: {rows} rows, {rate:.0f} rows/s, at {KEY_COLUMN}={last_key}")
+                reported = now
+            if PAUSE:
+                time.sleep(PAUSE)
+
+        connection.execute(progress.delete().where(progress.c.revision == revision))
+        # Not part of the app's schema: gone once no backfill is in flight.
+        if connection.execute(sa.select(sa.func.count()).select_from(progress)).scalar() == 0:
+            progress.drop(connection)
+        print(f"{TABLE_NAME}: backfilled {rows} rows in {time.monotonic() - start:.1f}s")
+
+
+def downgrade() -> None:
+    # Data migrations are not reverted; the schema revisions around them are.
+    pass
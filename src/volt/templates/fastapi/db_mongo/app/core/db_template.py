@@ -0,0 +1,157 @@
+"""Template database: the collections and their indexes are built once, then
+copied for every test session or preview environment.
+
+MongoDB has no template databases, so a clone re-creates each collection
+with the template's indexes and copies its documents in batches. The
+template is rebuilt when the models change; a hash of their sources is kept
+in .volt/db_template/.
+
+Usage: python -m app.core.db_template snapshot | clone NAME | drop NAME
+"""
+
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+
+from pymongo import AsyncMongoClient
+
+from app.core.config import settings
+
+TEMPLATE_SUFFIX = "_template"
+COPY_BATCH_SIZE = 1000
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+METADATA_HASH_DIR = PROJECT_ROOT / ".volt" / "db_template"
+# The documents and their indexes, and the list Beanie is initialised with.
+MODEL_SOURCES = ("app/models", "app/core/db.py")
+
+
+def database_name() -> str:
+    return settings.DB_NAME
+
+
+def template_name() -> str:
+    return database_name() + TEMPLATE_SUFFIX
+
+
+def use_database(name: str) -> str:
+    """Point the app, and processes it starts, at database ``name``."""
+    settings.DB_NAME = name
+    os.environ["DB_NAME"] = name
+    return settings.DATABASE_URI
+
+
+def url_for(name: str) -> str:
+    return settings.DATABASE_URI.rsplit("/", 1)[0] + f"/{name}"
+
+
+def metadata_hash() -> str:
+    """Hash of the sources the template's collections are built from."""
+    digest = hashlib.sha256()
+    for source in MODEL_SOURCES:
+        path = PROJECT_ROOT / source
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            digest.update(file.relative_to(PROJECT_ROOT).as_posix().encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _metadata_hash_path() -> Path:
+    return METADATA_HASH_DIR / template_name()
+
+
+def _stored_metadata_hash() -> str | None:
+    path = _metadata_hash_path()
+    return path.read_text().strip() if path.exists() else None
+
+
+async def drop_database(name: str) -> None:
+    client = AsyncMongoClient(settings.DATABASE_URI)
+    try:
+        await client.drop_database(name)
+    finally:
+        await client.close()
+
+
+async def snapshot() -> str:
+    """(Re)build the template: the app's Beanie documents and their indexes."""
+    from app.core import db
+
+    name = template_name()
+    models = metadata_hash()
+    _metadata_hash_path().unlink(missing_ok=True)
+    await drop_database(name)
+    original = settings.DB_NAME
+    settings.DB_NAME = name
+    try:
+        await db.init_db()
+        await db.close_db()
+    finally:
+        settings.DB_NAME = original
+    METADATA_HASH_DIR.mkdir(parents=True, exist_ok=True)
+    _metadata_hash_path().write_text(models)
+    return url_for(name)
+
+
+async def ensure_template() -> None:
+    # A template whose documents have no indexes is never written to, so it
+    # doesn't exist on the server and is rebuilt, which costs next to nothing.
+    client = AsyncMongoClient(settings.DATABASE_URI)
+    try:
+        exists = template_name() in await client.list_database_names()
+    finally:
+        await client.close()
+    if not exists or _stored_metadata_hash() != metadata_hash():
+        await snapshot()
+
+
+async def clone_database(name: str) -> str:
+    """Replace database ``name`` with a copy of the template."""
+    client = AsyncMongoClient(settings.DATABASE_URI)
+    try:
+        await client.drop_database(name)
+        template, target = client[template_name()], client[name]
+        for collection_name in await template.list_collection_names():
+            source = template[collection_name]
+            collection = await target.create_collection(collection_name)
+            for index_name, info in (await source.index_information()).items():
+                if index_name == "_id_":
+                    continue
+                options = {k: v for k, v in info.items() if k not in {"key", "v", "ns"}}
+                await collection.create_index(info["key"], name=index_name, **options)
+
+            batch = []
+            async for document in source.find():
+                batch.append(document)
+                if len(batch) == COPY_BATCH_SIZE:
+                    await collection.insert_many(batch)
+                    batch = []
+            if batch:
+                await collection.insert_many(batch)
+    finally:
+        await client.close()
+    return url_for(name)
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m app.core.db_template")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("snapshot", help="Build the template database")
+    commands.add_parser("clone", help="Copy the template into NAME").add_argument("name")
+    commands.add_parser("drop", help="Drop database NAME").add_argument("name")
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshot":
+        print(asyncio.run(snapshot()))
+    elif args.command == "clone":
+        asyncio.run(ensure_template())
+        print(asyncio.run(clone_database(args.name)))
+    else:
+        asyncio.run(drop_database(args.name))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Template database: the schema is built once, then copied for every test
+session or preview environment instead of running the migrations again.
+
+- PostgreSQL: ``CREATE DATABASE ... TEMPLATE``
+- SQLite: a file copy
+- MySQL (no template databases): tables re-created from ``SHOW CREATE TABLE``
+  and filled with ``INSERT ... SELECT``
+
+The template is rebuilt when the migration heads or the models change; a
+hash of the models' schema is kept in .volt/db_template/.
+
+Usage: python -m app.core.db_template snapshot | clone NAME | drop NAME
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+
+TEMPLATE_SUFFIX = "_template"
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = PROJECT_ROOT / "alembic.ini"
+METADATA_HASH_DIR = PROJECT_ROOT / ".volt" / "db_template"
+# Without Alembic, the schema comes from the models, as on app startup.
+CREATE_ALL = (
+    "import asyncio, app.main; from app.core.db_template import import_models; "
+    "import_models(); from app.core.db import init_db; asyncio.run(init_db())"
+)
+
+
+def database_name() -> str:
+    return Path(make_url(settings.DATABASE_URI).database or "app").stem
+
+
+def template_name() -> str:
+    return database_name() + TEMPLATE_SUFFIX
+
+
+def url_for(name: str) -> str:
+    """The app's database URL, pointing at database ``name`` instead."""
+    url = make_url(settings.DATABASE_URI)
+    if url.get_backend_name() == "sqlite":
+        # SQLite databases are files next to the app's one.
+        path = Path(url.database or "app")
+        name = str(path.with_name(name + path.suffix))
+    return url.set(database=name).render_as_string(hide_password=False)
+
+
+def use_database(name: str) -> str:
+    """Point the app, and processes it starts, at database ``name``.
+
+    If ``app.core.db`` is already imported, its engine is replaced.
+    """
+    url = url_for(name)
+    settings.DATABASE_URL = url
+    os.environ["DATABASE_URL"] = url
+    db = sys.modules.get("app.core.db")
+    if db is not None:
+        db.engine = create_async_engine(url, echo=settings.DEBUG, future=True)
+        db.async_session.configure(bind=db.engine)
+    return url
+
+
+def _backend() -> str:
+    return make_url(settings.DATABASE_URI).get_backend_name()
+
+
+def _sqlite_path(name: str) -> Path:
+    return Path(make_url(url_for(name)).database)
+
+
+async def _server(statements) -> None:
+    """Run ``statements(connection, quote)`` on the database server, outside
+    any database the statements may create or drop."""
+    url = make_url(settings.DATABASE_URI)
+    maintenance = "postgres" if url.get_backend_name() == "postgresql" else None
+    engine = create_async_engine(url.set(database=maintenance), isolation_level="AUTOCOMMIT")
+    try:
+        async with engine.connect() as connection:
+            await statements(connection, engine.dialect.identifier_preparer.quote)
+    finally:
+        await engine.dispose()
+
+
+async def drop_database(name: str) -> None:
+    if _backend() == "sqlite":
+        _sqlite_path(name).unlink(missing_ok=True)
+        return
+
+    async def drop(connection, quote):
+        force = " WITH (FORCE)" if _backend() == "postgresql" else ""
+        await connection.exec_driver_sql(f"DROP DATABASE IF EXISTS {quote(name)}{force}")
+
+    await _server(drop)
+
+
+async def _template_revisions() -> set[str] | None:
+    """Alembic revisions of the template; None when it doesn't exist."""
+    if _backend() == "sqlite" and not _sqlite_path(template_name()).exists():
+        return None
+    engine = create_async_engine(url_for(template_name()))
+    try:
+        async with engine.connect() as connection:
+            try:
+                result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+                return {row[0] for row in result}
+            except Exception:
+                return set()
+    except Exception:
+        return None
+    finally:
+        await engine.dispose()
+
+
+def _head_revisions() -> set[str]:
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+
+
+def import_models() -> None:
+    """Import every module of app.models, registering its tables."""
+    import importlib
+    import pkgutil
+
+    import app.models
+
+    for module in pkgutil.walk_packages(app.models.__path__, "app.models."):
+        importlib.import_module(module.name)
+
+
+def metadata_hash() -> str:
+    """Hash of the schema the models describe, as DDL for the app's database."""
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    from sqlmodel import SQLModel
+
+    import_models()
+    dialect = make_url(settings.DATABASE_URI).get_dialect()()
+    digest = hashlib.sha256()
+    for table in SQLModel.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def _metadata_hash_path() -> Path:
+    return METADATA_HASH_DIR / template_name()
+
+
+def _stored_metadata_hash() -> str | None:
+    path = _metadata_hash_path()
+    return path.read_text().strip() if path.exists() else None
+
+
+def _migrate(name: str) -> None:
+    env = {**os.environ, "DATABASE_URL": url_for(name)}
+    if ALEMBIC_INI.exists():
+        command = [sys.executable, "-m", "alembic", "upgrade", "head"]
+    else:
+        command = [sys.executable, "-c", CREATE_ALL]
+    subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=True)
+
+
+async def snapshot() -> str:
+    """(Re)build the template database from scratch."""
+    name = template_name()
+    models = metadata_hash()
+    _metadata_hash_path().unlink(missing_ok=True)
+    await drop_database(name)
+    if _backend() != "sqlite":
+
+        async def create(connection, quote):
+            await connection.exec_driver_sql(f"CREATE DATABASE {quote(name)}")
+
+        await _server(create)
+    await asyncio.to_thread(_migrate, name)
+    METADATA_HASH_DIR.mkdir(parents=True, exist_ok=True)
+    _metadata_hash_path().write_text(models)
+    return url_for(name)
+
+
+async def ensure_template() -> None:
+    """Build the template unless it exists, is at the migration heads and was
+    built from the current models."""
+    revisions = await _template_revisions()
+    if (
+        revisions is None
+        or (ALEMBIC_INI.exists() and revisions != _head_revisions())
+        or _stored_metadata_hash() != metadata_hash()
+    ):
+        await snapshot()
+
+
+async def clone_database(name: str) -> str:
+    """Replace database ``name`` with a copy of the template."""
+    template = template_name()
+    await drop_database(name)
+    backend = _backend()
+
+    if backend == "sqlite":
+        shutil.copyfile(_sqlite_path(template), _sqlite_path(name))
+        return url_for(name)
+
+    async def clone(connection, quote):
+        if backend == "postgresql":
+            await connection.exec_driver_sql(
+                f"CREATE DATABASE {quote(name)} TEMPLATE {quote(template)}"
+            )
+            return
+
+        await connection.exec_driver_sql(f"CREATE DATABASE {quote(name)}")
+        await connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+        tables = await connection.exec_driver_sql(
+            f"SHOW FULL TABLES FROM {quote(template)} WHERE Table_type = 'BASE TABLE'"
+        )
+        for table, _ in tables.all():
+            source = f"{quote(template)}.{quote(table)}"
+            created = await connection.exec_driver_sql(f"SHOW CREATE TABLE {source}")
+            await connection.exec_driver_sql(f"USE {quote(name)}")
+            await connection.exec_driver_sql(created.one()[1])
+            await connection.exec_driver_sql(
+                f"INSERT INTO {quote(name)}.{quote(table)} SELECT * FROM {source}"
+            )
+
+    await _server(clone)
+    return url_for(name)
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m app.core.db_template")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("snapshot", help="Build the template database")
+    commands.add_parser("clone", help="Copy the template into NAME").add_argument("name")
+    commands.add_parser("drop", help="Drop database NAME").add_argument("name")
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshot":
+        print(asyncio.run(snapshot()))
+    elif args.command == "clone":
+        asyncio.run(ensure_template())
+        print(asyncio.run(clone_database(args.name)))
+    else:
+        asyncio.run(drop_database(args.name))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Tests in this package run against their own copy of the template database
+(see app/core/db_template.py), cloned the first time the session needs it and
+dropped when it ends. Tests that don't touch the database belong outside
+tests/db/."""
+
+import asyncio
+import os
+
+import pytest
+
+from app.core import db_template
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_url():
+    original = db_template.database_name()
+    name = f"{original}_test_{os.getenv('PYTEST_XDIST_WORKER', 'main')}_{os.getpid()}"
+
+    asyncio.run(db_template.ensure_template())
+    asyncio.run(db_template.clone_database(name))
+    url = db_template.use_database(name)
+    try:
+        yield url
+    finally:
+        db_template.use_database(original)
+        asyncio.run(db_template.drop_database(name))
@@ -0,0 +1,84 @@
+import base64
+import json
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+from pymongo import ASCENDING
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: list[Any]) -> str:
+    data = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except ValueError as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+class CursorPaginationMixin:
+    """Keyset paging for a repository's ``model``."""
+
+    # Pages are ordered by this field, then by _id. It must be indexed and
+    # always set; set it in a subclass, e.g. "created_at".
+    cursor_field: str | None = None
+
+    def _cursor_names(self) -> list[str]:
+        if self.cursor_field and self.cursor_field != "id":
+            return [self.cursor_field, "id"]
+        return ["id"]
+
+    def _cursor_values(self, names: list[str], cursor: str) -> list[Any]:
+        values = decode_cursor(cursor)
+        if len(values) != len(names):
+            raise InvalidCursorError("Invalid cursor")
+        try:
+            return [
+                TypeAdapter(self.model.model_fields[name].annotation).validate_python(value)
+                for name, value in zip(names, values)
+            ]
+        except ValueError as e:
+            raise InvalidCursorError("Invalid cursor") from e
+
+    async def get_page(
+        self, cursor: str | None = None, limit: int = 100
+    ) -> tuple[Sequence[Any], str | None]:
+        """Keyset paging: every page is an index range scan after the last
+        document of the previous one, so deep pages cost as much as the first
+        and concurrent inserts don't shift documents between pages.
+
+        Returns the page and the cursor of the next one (None on the last).
+        """
+        names = self._cursor_names()
+        keys = ["_id" if name == "id" else name for name in names]
+        query = {}
+        if cursor is not None:
+            values = self._cursor_values(names, cursor)
+            # (a, b) > (x, y), spelled out as an $or of index ranges.
+            query = {
+                "$or": [
+                    {**dict(zip(keys[:i], values[:i])), keys[i]: {"$gt": values[i]}}
+                    for i in range(len(keys))
+                ]
+            }
+
+        docs = (
+            await self.model.find(query)
+            .sort([(key, ASCENDING) for key in keys])
+            .limit(limit + 1)
+            .to_list()
+        )
+        if len(docs) <= limit:
+            return docs, None
+        docs = docs[:limit]
+        return docs, encode_cursor([getattr(docs[-1], name) for name in names])
@@ -1,6 +1,6 @@
 from beanie import PydanticObjectId
 from typing import Annotated, List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.dependencies.__MODEL_NAME_LOWER__ import get___MODEL_NAME_LOWER___service
 from app.services.__MODEL_NAME_LOWER__ import __MODEL_NAME__Service
 from app.schemas.__MODEL_NAME_LOWER__ import (
@@ -8,6 +8,8 @@ from app.schemas.__MODEL_NAME_LOWER__ import (
     __MODEL_NAME__Read,
     __MODEL_NAME__Update,
 )
+from app.repositories.pagination import InvalidCursorError
+from app.schemas.pagination import Page
 
 serviceDep = Annotated[__MODEL_NAME__Service, Depends(get___MODEL_NAME_LOWER___service)]
 router = APIRouter()
@@ -20,6 +22,21 @@ async def create___MODEL_NAME_LOWER__(
     return await service.create(obj_in=obj_in)
 
 
+# Declared before /{id}, which would otherwise match "page".
+@router.get("/page", response_model=Page[__MODEL_NAME__Read])
+async def read_page___MODEL_NAME_PLURAL__(
+    *,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    service: serviceDep,
+):
+    try:
+        items, next_cursor = await service.get_page(cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Page(items=items, next_cursor=next_cursor)
+
+
 @router.get("/{id}", response_model=__MODEL_NAME__Read)
 async def read___MODEL_NAME_LOWER__(*, id: PydanticObjectId, service: serviceDep):
     db_obj = await service.get(id=id)
@@ -22,6 +22,9 @@ class __MODEL_NAME__Service(BaseService[__MODEL_NAME__]):
     async def get_multi(self, skip: int = 0, limit: int = 100) -> List[__MODEL_NAME__]:
         return await self.repo.get_multi(skip, limit)
 
+    async def get_page(self, cursor: str | None = None, limit: int = 100):
+        return await self.repo.get_page(cursor, limit)
+
     async def update(
         self, id: PydanticObjectId, obj_in: __MODEL_NAME__Update
     ) -> __MODEL_NAME__ | None:
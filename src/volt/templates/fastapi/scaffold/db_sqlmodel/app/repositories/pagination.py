@@ -0,0 +1,85 @@
+import base64
+import json
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import and_, inspect, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: list[Any]) -> str:
+    data = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except ValueError as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+class CursorPaginationMixin:
+    """Keyset paging for a repository's ``model``."""
+
+    # Pages are ordered by this field, then by primary key. It must be
+    # indexed and not nullable; set it in a subclass, e.g. "created_at".
+    cursor_field: str | None = None
+
+    def _cursor_names(self) -> list[str]:
+        names = [column.key for column in inspect(self.model).primary_key]
+        if self.cursor_field and self.cursor_field not in names:
+            names.insert(0, self.cursor_field)
+        return names
+
+    def _cursor_values(self, names: list[str], cursor: str) -> list[Any]:
+        values = decode_cursor(cursor)
+        if len(values) != len(names):
+            raise InvalidCursorError("Invalid cursor")
+        try:
+            return [
+                TypeAdapter(self.model.model_fields[name].annotation).validate_python(value)
+                for name, value in zip(names, values)
+            ]
+        except ValueError as e:
+            raise InvalidCursorError("Invalid cursor") from e
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[Sequence[Any], str | None]:
+        """Keyset paging: every page is an index range scan after the last row
+        of the previous one, so deep pages cost as much as the first and
+        concurrent inserts don't shift rows between pages.
+
+        Returns the page and the cursor of the next one (None on the last).
+        """
+        names = self._cursor_names()
+        columns = [getattr(self.model, name) for name in names]
+        statement = select(self.model).order_by(*columns).limit(limit + 1)
+
+        if cursor is not None:
+            values = self._cursor_values(names, cursor)
+            # (a, b) > (x, y), spelled out so every database uses the index.
+            after = [
+                and_(*(c == v for c, v in zip(columns[:i], values[:i])), columns[i] > values[i])
+                for i in range(len(columns))
+            ]
+            statement = statement.where(or_(*after))
+
+        rows = (await session.execute(statement)).scalars().all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor([getattr(rows[-1], name) for name in names])
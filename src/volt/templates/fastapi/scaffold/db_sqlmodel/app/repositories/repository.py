@@ -1,6 +1,7 @@
 from app.models.__MODEL_NAME_LOWER__ import __MODEL_NAME__
 from app.repositories.base import BaseRepository
+from app.repositories.pagination import CursorPaginationMixin
 
 
-class __MODEL_NAME__Repository(BaseRepository[__MODEL_NAME__]):
+class __MODEL_NAME__Repository(CursorPaginationMixin, BaseRepository[__MODEL_NAME__]):
     model = __MODEL_NAME__
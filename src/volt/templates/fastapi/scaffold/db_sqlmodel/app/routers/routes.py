@@ -1,5 +1,5 @@
 from typing import Annotated, List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 from app.core.db import get_session
 from app.dependencies.__MODEL_NAME_LOWER__ import get___MODEL_NAME_LOWER___service
@@ -9,6 +9,8 @@ from app.schemas.__MODEL_NAME_LOWER__ import (
     __MODEL_NAME__Read,
     __MODEL_NAME__Update,
 )
+from app.repositories.pagination import InvalidCursorError
+from app.schemas.pagination import Page
 
 sessionDep = Annotated[Session, Depends(get_session)]
 serviceDep = Annotated[__MODEL_NAME__Service, Depends(get___MODEL_NAME_LOWER___service)]
@@ -22,6 +24,24 @@ async def create___MODEL_NAME_LOWER__(
     return await service.create(session=session, obj_in=obj_in)
 
 
+# Declared before /{id}, which would otherwise match "page".
+@router.get("/page", response_model=Page[__MODEL_NAME__Read])
+async def read_page___MODEL_NAME_PLURAL__(
+    *,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    session: sessionDep,
+    service: serviceDep,
+):
+    try:
+        items, next_cursor = await service.get_page(
+            session=session, cursor=cursor, limit=limit
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Page(items=items, next_cursor=next_cursor)
+
+
 @router.get("/{id}", response_model=__MODEL_NAME__Read)
 async def read___MODEL_NAME_LOWER__(
     *, id: int, session: sessionDep, service: serviceDep
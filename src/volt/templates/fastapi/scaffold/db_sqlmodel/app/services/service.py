@@ -23,6 +23,11 @@ class __MODEL_NAME__Service(BaseService[__MODEL_NAME__]):
     async def get_multi(self, session: AsyncSession, skip: int = 0, limit: int = 100):
         return await self.repo.get_multi(session, skip, limit)
 
+    async def get_page(
+        self, session: AsyncSession, cursor: str | None = None, limit: int = 100
+    ):
+        return await self.repo.get_page(session, cursor, limit)
+
     async def update(
         self, session: AsyncSession, id: int, obj_in: __MODEL_NAME__Update
     ) -> __MODEL_NAME__ | None:
@@ -0,0 +1,30 @@
+"""__MESSAGE__
+
+Revision ID: __REVISION__
+Revises:
+Create Date: __CREATE_DATE__
+
+Baseline generated by `volt db squash` from the models' metadata. It replaces
+__SQUASHED_COUNT__ revisions and keeps the id of the last one, so databases
+already at that revision upgrade from here as before.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "__REVISION__"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    __UPGRADES__
+
+
+def downgrade() -> None:
+    __DOWNGRADES__
@@ -1,12 +1,25 @@
 # -*- mode: python ; coding: utf-8 -*-
+from pathlib import Path
 
+from volt.core.archive import ARCHIVE_NAME, pack_templates
+
+# Ship templates as one memory-mapped archive instead of thousands of loose files.
+template_archive = pack_templates(Path("src/volt/templates"), Path("build") / ARCHIVE_NAME)
 
 a = Analysis(
     ['src/volt/cli.py'],
     pathex=[],
     binaries=[],
-    datas=[('src/volt/templates', 'volt/templates')],
-    hiddenimports=["7bce59c0a152c0e01f70__mypyc", "ddc459050edb75a05942__mypyc"],
+    datas=[(str(template_archive), 'volt')],
+    hiddenimports=[
+        "7bce59c0a152c0e01f70__mypyc",
+        "ddc459050edb75a05942__mypyc",
+        # Subcommands are imported lazily by volt.cli, so PyInstaller can't see them.
+        "volt.add_cli",
+        "volt.build_cli",
+        "volt.db_cli",
+        "volt.stacks.fastapi.cli",
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],